@@ -0,0 +1,81 @@
+"""
+Micro-benchmark — ContextManager token accounting per loop iteration
+=====================================================================
+Simulates the agentic loop's history growth (a 50K-char case presentation,
+then one assistant turn and one multi-KB tool result per iteration) and
+times the budget check each iteration would make:
+
+- recount: ContextManager.estimate_tokens() over the full history
+  (the pre-ledger behaviour, O(total history) per iteration)
+- ledger:  ContextManager.append() for the new messages plus
+  approaching_limit(), which stays flat as the conversation grows
+
+Usage:
+    python benchmarks/bench_context_ledger.py [iterations]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from orchestrator.context_manager import ContextManager  # noqa: E402
+from orchestrator.token_estimator import TokenEstimator, set_estimator  # noqa: E402
+
+REPEATS = 20
+
+
+def _turn(i: int) -> tuple[dict, dict]:
+    assistant = {
+        "role": "assistant",
+        "content": [
+            {"type": "text", "text": f"Round reasoning {i} " * 40},
+            {"type": "tool_use", "id": f"toolu_{i}", "name": "call_specialist",
+             "input": {"specialist_type": "neurologist", "round": 1, "focus_instructions": "x" * 400}},
+        ],
+    }
+    tool_result = {
+        "role": "user",
+        "content": [{"type": "tool_result", "tool_use_id": f"toolu_{i}", "content": "evidence " * 600}],
+    }
+    return assistant, tool_result
+
+
+def main():
+    # The fake API's token counts must not train (or read) the saved ratios
+    set_estimator(TokenEstimator(path=None))
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    initial = {"role": "user", "content": "Case records " * 4_000}
+
+    recount_history = [initial]
+    ledger_mgr = ContextManager(max_tokens=10**9)
+    ledger_history = []
+    ledger_mgr.append(ledger_history, initial)
+
+    print(f"{'iter':>5} {'messages':>9} {'recount µs':>12} {'ledger µs':>10}")
+    for i in range(1, iterations + 1):
+        assistant, tool_result = _turn(i)
+
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            ContextManager().estimate_tokens(recount_history + [assistant, tool_result])
+        recount_us = (time.perf_counter() - start) / REPEATS * 1e6
+        recount_history += [assistant, tool_result]
+
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            ledger = ledger_mgr.ledger
+            ledger.add(assistant)
+            ledger.add(tool_result)
+            ledger_mgr.approaching_limit()
+        ledger_us = (time.perf_counter() - start) / REPEATS * 1e6
+        ledger_mgr.append(ledger_history, assistant)
+        ledger_mgr.append(ledger_history, tool_result)
+
+        if i == 1 or i % 10 == 0:
+            print(f"{i:>5} {len(recount_history):>9} {recount_us:>12.1f} {ledger_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Micro-benchmark — DiagnosisLexicon lookups
+==========================================
+Times lookup() for hypothesis-style texts:
+
+- exact:  texts naming a lexicon alias (token-trie match)
+- fuzzy:  misspelled names that only the trigram index matches
+- miss:   texts the lexicon does not know (worst case: every fuzzy window)
+- cached: the same texts again, served from the lookup cache
+
+Before timing, it checks that syndromes missing from the lexicon match no
+concept (a generic word like "syndrome" must not fuzzy-match an alias) and
+exits with status 1 if one does.
+
+Usage:
+    python benchmarks/bench_diagnosis_lexicon.py [lookups]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from orchestrator.diagnosis_lexicon import DiagnosisLexicon  # noqa: E402
+
+EXACT = [
+    "Batten disease (CLN2) with late-infantile onset, case {i}",
+    "Cushing's syndrome, ACTH-dependent (pituitary adenoma) #{i}",
+    "Hemoglobin SC disease with avascular necrosis {i}",
+]
+FUZZY = [
+    "Neuronal ceroid lipofuscinsis variant {i}",
+    "Mitochondral encephalomyopathy {i}",
+]
+MISS = ["Idiopathic multisystem presentation of unclear origin {i}"]
+# Not in the lexicon: each must match nothing
+UNLISTED = [
+    "Dravet syndrome", "Marfan syndrome", "Guillain-Barre syndrome", "Sjogren syndrome",
+    "Ehlers-Danlos syndrome", "Noonan syndrome", "Williams syndrome", "Alport syndrome",
+]
+
+
+def _time(lexicon: DiagnosisLexicon, texts: list[str]) -> float:
+    start = time.perf_counter()
+    for text in texts:
+        lexicon.lookup(text)
+    return (time.perf_counter() - start) / len(texts) * 1e6
+
+
+def main():
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    start = time.perf_counter()
+    lexicon = DiagnosisLexicon.load()
+    load_ms = (time.perf_counter() - start) * 1e3
+    print(f"Loaded {len(lexicon.concepts)} concepts in {load_ms:.1f} ms\n")
+
+    wrong = [(text, lexicon.lookup(text)) for text in UNLISTED if lexicon.lookup(text) is not None]
+    for text, match in wrong:
+        print(f"FAIL: {text!r} matched {match.concept_id} via {match.alias!r} ({match.method}, {match.score:.2f})")
+    if wrong:
+        sys.exit(1)
+    print(f"Unlisted syndromes: none of {len(UNLISTED)} matched a concept\n")
+
+    print(f"{'kind':>8} {'µs/lookup':>10}")
+    for kind, templates in (("exact", EXACT), ("fuzzy", FUZZY), ("miss", MISS)):
+        texts = [templates[i % len(templates)].format(i=i) for i in range(lookups)]
+        print(f"{kind:>8} {_time(lexicon, texts):>10.1f}")
+        if kind == "exact":
+            print(f"{'cached':>8} {_time(lexicon, texts):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark — rate-limit scheduler against a fake API that returns 429s
+======================================================================
+Starts benchmarks/fake_anthropic_server.py with a low input-tokens-per-
+minute limit and sends a burst of large streaming requests (like a round
+of specialists, each with the full case), then one synthesis-priority
+request, twice:
+
+- direct:    ResilientClient(AsyncAnthropic) — every request races, the
+             burst draws 429s and each retry backs off on its own
+- scheduled: ResilientClient(ScheduledClient(AsyncAnthropic)) — requests
+             are admitted within the limits learned from the headers
+
+Reports wall time, 429s served and when the synthesis request finished.
+
+Usage:
+    python benchmarks/bench_scheduler.py [requests] [tokens_per_request]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from anthropic import AsyncAnthropic  # noqa: E402
+
+from benchmarks.fake_anthropic_server import FakeAnthropicServer  # noqa: E402
+from orchestrator.resilience import ResilientClient  # noqa: E402
+from orchestrator.scheduler import RateLimitScheduler, ScheduledClient, call_stage  # noqa: E402
+from orchestrator.token_estimator import TokenEstimator, set_estimator  # noqa: E402
+
+ITPM = 60_000
+RPM = 100
+LATENCY = 0.5
+
+
+async def _call(client, stage: str, tokens: int) -> float:
+    with call_stage(stage):
+        async with client.messages.stream(
+            model="fake-model",
+            max_tokens=100,
+            messages=[{"role": "user", "content": "case " * tokens}],
+        ) as stream:
+            await stream.get_final_message()
+    return time.monotonic()
+
+
+async def _burst(client, n: int, tokens: int) -> dict:
+    start = time.monotonic()
+    specialists = [asyncio.create_task(_call(client, "specialist", tokens)) for _ in range(n)]
+    await asyncio.sleep(0.1)
+    synthesis = asyncio.create_task(_call(client, "synthesis", tokens))
+    results = await asyncio.gather(*specialists, synthesis, return_exceptions=True)
+    failed = sum(1 for r in results if isinstance(r, BaseException))
+    synthesis_done = results[-1] - start if not isinstance(results[-1], BaseException) else None
+    return {"wall": time.monotonic() - start, "failed": failed, "synthesis": synthesis_done}
+
+
+async def _run(label: str, n: int, tokens: int, scheduled: bool):
+    server = FakeAnthropicServer(rpm=RPM, itpm=ITPM, latency=LATENCY).start()
+    base = AsyncAnthropic(base_url=server.base_url, api_key="fake", max_retries=0)
+    scheduler = RateLimitScheduler() if scheduled else None
+    inner = ScheduledClient(base, scheduler) if scheduled else base
+    client = ResilientClient(inner, max_attempts=8, retry_budget=200, breaker_threshold=100)
+    try:
+        result = await _burst(client, n, tokens)
+    finally:
+        await base.close()
+        server.stop()
+    synthesis = f"{result['synthesis']:.1f}s" if result["synthesis"] is not None else "failed"
+    print(
+        f"{label:>10} {result['wall']:>8.1f}s {server.stats['rate_limited']:>6} "
+        f"{client.retries:>8} {result['failed']:>7} {synthesis:>10}"
+    )
+
+
+def main():
+    # The fake API's token counts must not train (or read) the saved ratios
+    set_estimator(TokenEstimator(path=None))
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    tokens = int(sys.argv[2]) if len(sys.argv) > 2 else 8_000
+    print(f"{n} specialist requests + 1 synthesis, ~{tokens:,} input tokens each; fake API at {ITPM:,} ITPM")
+    print(f"{'':>10} {'wall':>9} {'429s':>6} {'retries':>8} {'failed':>7} {'synthesis':>10}")
+    asyncio.run(_run("direct", n, tokens, scheduled=False))
+    asyncio.run(_run("scheduled", n, tokens, scheduled=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark — stateless vs session Round 2 specialist calls
+=========================================================
+Runs Round 1 and Round 2 for a team of specialists against
+benchmarks/fake_anthropic_server.py, whose prompt-cache simulation reports
+cache reads and adds prefill time per uncached input token, twice:
+
+- stateless: Round 2 is a fresh request with the Round 2 system prompt,
+             the case and the peer digest (the default path)
+- sessions:  Round 2 continues each specialist's Round 1 conversation
+             (orchestrator/specialist_session.py)
+
+Reports per-round mean latency and input tokens (and how many were read
+from the cache) for each path.
+
+Usage:
+    python benchmarks/bench_specialist_sessions.py [specialists] [case_tokens]
+"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from anthropic import AsyncAnthropic  # noqa: E402
+
+from benchmarks.fake_anthropic_server import FakeAnthropicServer  # noqa: E402
+from orchestrator.peer_context import build_peer_context  # noqa: E402
+from orchestrator.specialist_caller import (  # noqa: E402
+    build_followup_instructions,
+    build_round_2_specialist_system_prompt,
+    build_specialist_system_prompt,
+    call_specialist,
+    continue_specialist,
+)
+from orchestrator.specialist_session import SpecialistCallStats, SpecialistSession  # noqa: E402
+from orchestrator.token_estimator import TokenEstimator, set_estimator  # noqa: E402
+
+LATENCY = 0.2
+PREFILL_RATE = 50_000  # Uncached input tokens per second
+CONSTITUTION = "Follow the evidence. " * 500
+
+
+def _case(tokens: int) -> dict:
+    return {"case_id": "bench", "history": "Patient history entry. " * (tokens // 4)}
+
+
+async def _run(label: str, n: int, case_tokens: int, sessions: bool) -> SpecialistCallStats:
+    server = FakeAnthropicServer(rpm=10_000, itpm=100_000_000, latency=LATENCY, prefill_rate=PREFILL_RATE).start()
+    client = AsyncAnthropic(base_url=server.base_url, api_key="fake", max_retries=0)
+    stats = SpecialistCallStats()
+    case_json = json.dumps(_case(case_tokens), indent=2)
+    agent_def = {"model": "fake-model", "system_prompt": "You are a specialist."}
+    names = [f"Specialist {i + 1}" for i in range(n)]
+    keys = {name: name.lower().replace(" ", "_") for name in names}
+    try:
+        start = time.monotonic()
+        systems = {
+            name: build_specialist_system_prompt(agent_def, name, None, "General review", CONSTITUTION)
+            for name in names
+        }
+        team = {
+            name: SpecialistSession(keys[name], "fake-model", systems[name]) if sessions else None
+            for name in names
+        }
+        results = await asyncio.gather(*(
+            call_specialist(
+                client, agent_def, name, systems[name], case_json,
+                session=team[name], round_num=1, call_stats=stats,
+            )
+            for name in names
+        ))
+        r1 = {keys[name]: result for name, result in zip(names, results)}
+
+        calls = []
+        for name in names:
+            context = build_peer_context(keys[name], {1: r1}, {}, include_own=not sessions).text
+            if sessions:
+                calls.append(continue_specialist(
+                    client, agent_def, name, team[name],
+                    build_followup_instructions(name, 2, context), round_num=2, call_stats=stats,
+                ))
+            else:
+                system = build_round_2_specialist_system_prompt(agent_def, name, None, "General review", CONSTITUTION)
+                calls.append(call_specialist(
+                    client, agent_def, name, system, case_json + "\n\n" + context,
+                    round_num=2, call_stats=stats,
+                ))
+        await asyncio.gather(*calls)
+        wall = time.monotonic() - start
+    finally:
+        await client.close()
+        server.stop()
+    print(f"\n{label}: {wall:.1f}s wall\n  {stats.summary()}")
+    return stats
+
+
+def main():
+    # The fake API's token counts must not train (or read) the saved ratios
+    set_estimator(TokenEstimator(path=None))
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    case_tokens = int(sys.argv[2]) if len(sys.argv) > 2 else 60_000
+    print(
+        f"{n} specialists, ~{case_tokens:,}-token case; fake API with {LATENCY}s latency "
+        f"+ 1s per {PREFILL_RATE:,} uncached input tokens"
+    )
+    stateless = asyncio.run(_run("stateless", n, case_tokens, sessions=False))
+    session = asyncio.run(_run("sessions", n, case_tokens, sessions=True))
+
+    before = stateless.rounds[2]["fresh"]
+    after = session.rounds[2]["continued"]
+    print(f"\nRound 2 per call: {'':>10} {'latency':>8} {'input':>9} {'cached':>9}")
+    for label, s in (("stateless", before), ("sessions", after)):
+        total = s["uncached"] + s["cache_read"] + s["cache_write"]
+        print(
+            f"{'':>17} {label:>10} {s['seconds'] / s['calls']:>7.2f}s "
+            f"{total // s['calls']:>9,} {s['cache_read'] // s['calls']:>9,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+Fake Anthropic Messages API — a local server that enforces rate limits
+======================================================================
+Serves POST /v1/messages with a fixed text reply, as JSON or as an SSE
+stream (`"stream": true`), after a configurable latency. Requests and
+input tokens (~4 characters per token) are limited per minute with token
+buckets like the real API's; a request over either limit gets a 429 with
+`retry-after` and the `anthropic-ratelimit-*` headers, so rate-limit
+handling (orchestrator/scheduler.py, orchestrator/resilience.py) can be
+exercised offline.
+
+Prompt caching is simulated too: the prefix up to each `cache_control`
+breakpoint is remembered, a later request starting with a remembered prefix
+reports it as `cache_read_input_tokens`, and with `prefill_rate` set each
+request takes an extra second per that many uncached input tokens:
+
+    client = AsyncAnthropic(base_url="http://127.0.0.1:8765", api_key="fake", max_retries=0)
+
+Usage:
+    python benchmarks/fake_anthropic_server.py [--port 8765] [--rpm 50] [--itpm 200000] [--latency 1.0] [--prefill-rate 0]
+"""
+
+import argparse
+import json
+import math
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+REPLY_TEXT = '{"diagnosis": "fake", "confidence": 0.5}'
+
+
+class _Bucket:
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.level = per_minute
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.per_minute, self.level + (now - self.updated) * self.per_minute / 60)
+        self.updated = now
+
+    def try_take(self, amount: float) -> float:
+        """Take `amount` and return 0, or return the seconds until it would fit."""
+        self._refill()
+        if amount <= self.level:
+            self.level -= amount
+            return 0.0
+        return (min(amount, self.per_minute) - self.level) * 60 / self.per_minute
+
+
+class FakeAnthropicServer:
+    def __init__(
+        self,
+        port: int = 0,
+        rpm: float = 50,
+        itpm: float = 200_000,
+        latency: float = 1.0,
+        prefill_rate: float = 0.0,
+    ):
+        """
+        Args:
+            port: Port to listen on (0 = any free port, see `base_url`).
+            rpm: Requests per minute before 429s.
+            itpm: Input tokens per minute before 429s.
+            latency: Seconds each successful request takes.
+            prefill_rate: Uncached input tokens processed per second, added
+                to `latency` (0 = no prefill time).
+        """
+        self.rpm = rpm
+        self.itpm = itpm
+        self.latency = latency
+        self.prefill_rate = prefill_rate
+        self.cache: set[int] = set()  # Hashes of prefixes ending at a breakpoint
+        self.requests = _Bucket(rpm)
+        self.input_tokens = _Bucket(itpm)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "rate_limited": 0}
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), _handler_for(self))
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}"
+
+    def start(self) -> "FakeAnthropicServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def admit(self, input_tokens: int) -> tuple[float, dict]:
+        """(seconds to retry after or 0, rate-limit headers) for one request."""
+        with self.lock:
+            self.stats["requests"] += 1
+            wait = self.requests.try_take(1)
+            if not wait:
+                wait = self.input_tokens.try_take(input_tokens)
+                if wait:
+                    self.requests.level += 1  # Rejected requests are not charged
+            if wait:
+                self.stats["rate_limited"] += 1
+            headers = {
+                "anthropic-ratelimit-requests-limit": str(int(self.rpm)),
+                "anthropic-ratelimit-requests-remaining": str(max(0, int(self.requests.level))),
+                "anthropic-ratelimit-input-tokens-limit": str(int(self.itpm)),
+                "anthropic-ratelimit-input-tokens-remaining": str(max(0, int(self.input_tokens.level))),
+            }
+            return wait, headers
+
+
+def _count_input_tokens(body: dict) -> int:
+    return math.ceil(len(json.dumps(body.get("system", "")) + json.dumps(body.get("messages", []))) / 4)
+
+
+def _prompt_blocks(body: dict) -> list[dict]:
+    """The request's system and message content blocks, in prompt order."""
+    system = body.get("system") or []
+    blocks = [{"type": "text", "text": system}] if isinstance(system, str) else list(system)
+    for message in body.get("messages", []):
+        content = message["content"]
+        if isinstance(content, str):
+            content = [{"type": "text", "text": content}]
+        blocks.extend(dict(b, role=message["role"]) for b in content)
+    return blocks
+
+
+def _cache_usage(server: FakeAnthropicServer, body: dict, input_tokens: int) -> dict:
+    """Usage with the input split into cache reads, cache writes and uncached tokens."""
+    read = write = 0
+    prefix, tokens = "", 0
+    with server.lock:
+        for block in _prompt_blocks(body):
+            marked = "cache_control" in block
+            text = json.dumps({k: v for k, v in block.items() if k != "cache_control"})
+            prefix += text
+            tokens += math.ceil(len(text) / 4)
+            if not marked:
+                continue
+            key = hash(prefix)
+            if key in server.cache:
+                read = tokens
+            else:
+                server.cache.add(key)
+                write = tokens
+    write = max(0, min(write, input_tokens) - read)
+    read = min(read, input_tokens)
+    return {
+        "input_tokens": max(0, input_tokens - read - write),
+        "cache_read_input_tokens": read,
+        "cache_creation_input_tokens": write,
+    }
+
+
+def _handler_for(server: FakeAnthropicServer):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass  # Quiet
+
+        def do_POST(self):
+            if self.path.split("?")[0] != "/v1/messages":
+                self._json(404, {"type": "error", "error": {"type": "not_found_error", "message": self.path}})
+                return
+            body = json.loads(self.rfile.read(int(self.headers.get("content-length", 0))) or b"{}")
+            input_tokens = _count_input_tokens(body)
+            wait, headers = server.admit(input_tokens)
+            if wait:
+                headers["retry-after"] = str(math.ceil(wait))
+                self._json(429, {
+                    "type": "error",
+                    "error": {"type": "rate_limit_error", "message": "Rate limit exceeded (fake server)"},
+                }, headers)
+                return
+
+            usage = _cache_usage(server, body, input_tokens)
+            prefill = 0.0
+            if server.prefill_rate:
+                prefill = (usage["input_tokens"] + usage["cache_creation_input_tokens"]) / server.prefill_rate
+            time.sleep(server.latency + prefill)
+            message = {
+                "id": f"msg_{uuid.uuid4().hex[:24]}",
+                "type": "message",
+                "role": "assistant",
+                "model": body.get("model", "fake"),
+                "content": [{"type": "text", "text": REPLY_TEXT}],
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": dict(usage, output_tokens=len(REPLY_TEXT) // 4),
+            }
+            if body.get("stream"):
+                self._sse(message, headers)
+            else:
+                self._json(200, message, headers)
+
+        def _json(self, status: int, payload: dict, headers: dict | None = None):
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _sse(self, message: dict, headers: dict):
+            self.send_response(200)
+            self.send_header("content-type", "text/event-stream")
+            self.send_header("cache-control", "no-cache")
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            usage = message["usage"]
+            start = dict(message, content=[], stop_reason=None, usage=dict(usage, output_tokens=1))
+            events = [
+                ("message_start", {"type": "message_start", "message": start}),
+                ("content_block_start", {"type": "content_block_start", "index": 0,
+                                         "content_block": {"type": "text", "text": ""}}),
+                ("content_block_delta", {"type": "content_block_delta", "index": 0,
+                                         "delta": {"type": "text_delta", "text": REPLY_TEXT}}),
+                ("content_block_stop", {"type": "content_block_stop", "index": 0}),
+                ("message_delta", {"type": "message_delta",
+                                   "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                                   "usage": {"output_tokens": usage["output_tokens"]}}),
+                ("message_stop", {"type": "message_stop"}),
+            ]
+            for event, data in events:
+                self.wfile.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode())
+            self.wfile.flush()
+            self.close_connection = True
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Anthropic Messages API with rate limits")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rpm", type=float, default=50)
+    parser.add_argument("--itpm", type=float, default=200_000)
+    parser.add_argument("--latency", type=float, default=1.0)
+    parser.add_argument("--prefill-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = FakeAnthropicServer(args.port, args.rpm, args.itpm, args.latency, args.prefill_rate)
+    print(f"Fake Anthropic API on {server.base_url} ({args.rpm:g} RPM, {args.itpm:,.0f} ITPM)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ Usage:
     python orchestrator.py <case_file>                      # defaults to legacy
     python orchestrator.py --mode=legacy <case_file>        # fixed pipeline
     python orchestrator.py --mode=agentic <case_file>       # Observer-as-Orchestrator
+    python orchestrator.py --resume shared/runs/<run>       # continue an interrupted run
 """
 
 import argparse
@@ -20,6 +21,8 @@ BASE_DIR = Path(__file__).resolve().parent
 
 
 def main():
+    from orchestrator.peer_context import DEFAULT_TOKEN_CAP as DEFAULT_PEER_CONTEXT_TOKENS
+
     parser = argparse.ArgumentParser(
         description="The Emergent Diagnostic Institution — Diagnostic Pipeline",
     )
@@ -29,12 +32,121 @@ def main():
         default="legacy",
         help="Pipeline mode: 'legacy' (fixed 2-round pipeline) or 'agentic' (Observer-as-Orchestrator). Default: legacy",
     )
+    parser.add_argument(
+        "--prompt-layout",
+        choices=["standard", "shared-prefix"],
+        default="standard",
+        help="Specialist prompt layout: 'shared-prefix' puts constitution and case data first so parallel specialists share a cached prefix. Default: standard",
+    )
+    parser.add_argument(
+        "--sequential-tools",
+        action="store_true",
+        help="Agentic mode: run the Observer's tool calls one at a time instead of fanning out independent calls",
+    )
+    parser.add_argument(
+        "--speculative-round1",
+        action="store_true",
+        help="Agentic mode: start likely Round 1 specialists while the Observer is still triaging",
+    )
+    parser.add_argument(
+        "--speculative-roster",
+        default=None,
+        help="Comma-separated specialists to prefetch (default: team_topology.json active_specialists)",
+    )
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        default=None,
+        help="Agentic mode: per-case token budget across all model calls (forces synthesis at 80%%, completion at 100%%)",
+    )
+    parser.add_argument(
+        "--max-cost",
+        type=float,
+        default=None,
+        help="Agentic mode: per-case budget in USD across all model calls (forces synthesis at 80%%, completion at 100%%)",
+    )
+    parser.add_argument(
+        "--quorum",
+        type=int,
+        default=None,
+        metavar="K",
+        help="Let a round of parallel specialists proceed to Observer review once K of them are done; stragglers are merged as late results (default: wait for all)",
+    )
+    parser.add_argument(
+        "--straggler-grace",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="With --quorum: keep waiting this long for the remaining specialists once the quorum is reached. Default: 0",
+    )
+    parser.add_argument(
+        "--hedge",
+        type=float,
+        nargs="?",
+        const=0.9,
+        default=None,
+        metavar="PERCENTILE",
+        help="Send a duplicate request for specialist and synthesis calls (and legacy Observer reviews) slower than this quantile of recent latencies and keep the first valid response. Default when given: 0.9",
+    )
+    parser.add_argument(
+        "--auto-synthesis",
+        type=float,
+        nargs="?",
+        const=0.85,
+        default=None,
+        metavar="SCORE",
+        help="Agentic mode: synthesize as soon as a reviewed round converges with at least this convergence score (0-1), without waiting for the Observer. Default when given: 0.85",
+    )
+    parser.add_argument(
+        "--local-triage",
+        type=float,
+        nargs="?",
+        const=0.7,
+        default=None,
+        metavar="CONFIDENCE",
+        help="Agentic mode: pick the Round 1 team from the case with rule-based triage; at or above this confidence (0-1) Round 1 runs before the Observer's first turn, below it the Observer triages and the two picks are logged to shared/triage_log.jsonl. Default when given: 0.7",
+    )
+    parser.add_argument(
+        "--observer-prescreen",
+        type=float,
+        nargs="?",
+        const=0.5,
+        default=None,
+        metavar="THRESHOLD",
+        help="Legacy mode: review each round with the local bias pre-screen first and only call the Observer when its flag score (0-1) reaches this threshold. Default when given: 0.5 (without the flag the Observer always runs)",
+    )
+    parser.add_argument(
+        "--peer-context-tokens",
+        type=int,
+        default=DEFAULT_PEER_CONTEXT_TOKENS,
+        metavar="N",
+        help=f"Token cap for the digest of the previous round (peer hypotheses, new or contradicting evidence, Observer findings) given to Round 2+ specialists; 0 sends every prior output as full JSON. Default: {DEFAULT_PEER_CONTEXT_TOKENS}",
+    )
+    parser.add_argument(
+        "--specialist-sessions",
+        action="store_true",
+        help="Continue each specialist's earlier conversation in Round 2+ (new turn with the peer digest and Observer feedback, earlier turns read from the prompt cache) instead of re-sending the case in a fresh request",
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_DIR",
+        default=None,
+        help="Continue an interrupted run from its last checkpoint (a shared/runs/ directory); mode, case and options come from the run",
+    )
     parser.add_argument(
         "case_file",
+        nargs="?",
         help="Path to the case JSON file (e.g., cases/case_001_diagnostic_odyssey.json)",
     )
     args = parser.parse_args()
 
+    if args.resume:
+        resume_run(Path(args.resume))
+        return
+
+    if not args.case_file:
+        parser.error("case_file is required unless --resume is given")
+
     # Resolve case path
     case_path = Path(args.case_file)
     if not case_path.is_absolute():
@@ -52,17 +164,69 @@ def main():
     if args.mode == "legacy":
         # Import and run the legacy fixed pipeline
         from orchestrator_legacy import run_pipeline
-        asyncio.run(run_pipeline(case_path))
+        asyncio.run(run_pipeline(
+            case_path,
+            prompt_layout=args.prompt_layout,
+            quorum_size=args.quorum,
+            straggler_grace=args.straggler_grace,
+            observer_threshold=args.observer_prescreen,
+            peer_context_tokens=args.peer_context_tokens or None,
+            specialist_sessions=args.specialist_sessions,
+            hedge_percentile=args.hedge,
+        ))
     elif args.mode == "agentic":
         # Import and run the Observer-as-Orchestrator
         try:
             from orchestrator.observer_orchestrator import run_observer_orchestrator
-            asyncio.run(run_observer_orchestrator(case_path))
+            asyncio.run(run_observer_orchestrator(
+                case_path,
+                concurrent_tools=not args.sequential_tools,
+                prompt_layout=args.prompt_layout,
+                speculative_round_1=args.speculative_round1,
+                speculative_roster=(
+                    args.speculative_roster.split(",") if args.speculative_roster else None
+                ),
+                max_total_tokens=args.max_tokens,
+                max_cost_usd=args.max_cost,
+                quorum_size=args.quorum,
+                straggler_grace=args.straggler_grace,
+                hedge_percentile=args.hedge,
+                auto_synthesis_convergence=args.auto_synthesis,
+                peer_context_tokens=args.peer_context_tokens or None,
+                specialist_sessions=args.specialist_sessions,
+                local_triage=args.local_triage,
+            ))
         except ImportError:
             print("Error: Agentic mode not yet implemented.")
             print("Use --mode=legacy for the fixed pipeline.")
             sys.exit(1)
 
 
+def resume_run(run_dir: Path):
+    """Continue a checkpointed run with the mode, case and options it started with."""
+    from orchestrator.checkpoint import load_run_meta
+
+    if not run_dir.is_absolute():
+        run_dir = BASE_DIR / run_dir
+    try:
+        meta = load_run_meta(run_dir)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        print("Error: ANTHROPIC_API_KEY environment variable is not set.")
+        sys.exit(1)
+
+    case_path = Path(meta["case_path"])
+    options = meta.get("options", {})
+    if meta["mode"] == "legacy":
+        from orchestrator_legacy import run_pipeline
+        asyncio.run(run_pipeline(case_path, resume_dir=run_dir, **options))
+    else:
+        from orchestrator.observer_orchestrator import run_observer_orchestrator
+        asyncio.run(run_observer_orchestrator(case_path, resume_dir=run_dir, **options))
+
+
 if __name__ == "__main__":
     main()
@@ -5,6 +5,7 @@ import json
 
 from anthropic import AsyncAnthropic
 
+from orchestrator.deadline import Deadline, limits, within
 from orchestrator.utils import (
     extract_json,
     update_visualization_state,
@@ -14,7 +15,7 @@ from orchestrator.utils import (
 )
 
 
-async def run_constitution_amender(
+async def propose_amendments(
     client: AsyncAnthropic,
     agent_defs: dict,
     case_data: dict,
@@ -22,16 +23,14 @@ async def run_constitution_amender(
     r1_observer: dict,
     r2_observer: dict,
     diagnosis: dict,
-) -> list[dict]:
-    """Propose and apply constitutional amendments based on case learnings."""
-    case_id = case_data.get("case_id", "unknown")
-    update_visualization_state("running", case_id, 2, "constitution_amendment")
-
-    print("[STAGE] amender")
-    print("\n📜 Constitution Amender: Learning from this case")
-    print("─" * 50)
-    print("  ⏳ Analyzing diagnostic process for systemic improvements...")
+    deadline: Deadline | None = None,
+) -> dict:
+    """Make the Constitution Amender model call and return its parsed proposal.
 
+    Nothing is written to the constitution here, so the call can run as a
+    background prefetch and be cancelled without side effects.
+    """
+    case_id = case_data.get("case_id", "unknown")
     amender_def = agent_defs["constitution_amender.md"]
 
     system_prompt = f"""You are the Constitution Amender for The Emergent Diagnostic Institution.
@@ -93,22 +92,56 @@ Propose 3-6 focused, non-overlapping amendments. Each should be specific enough
         "Respond with ONLY the JSON object."
     )
 
-    async with client.messages.stream(
-        model=amender_def["model"],
-        max_tokens=16_000,
-        thinking={"type": "adaptive"},
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_message}],
-    ) as stream:
-        response = await stream.get_final_message()
+    async def _stream():
+        async with client.messages.stream(
+            model=amender_def["model"],
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_message}],
+            **limits(deadline, "amendments", 16_000, {"type": "adaptive"}),
+        ) as stream:
+            return await stream.get_final_message()
+
+    response = await within(deadline, "amendments", _stream())
 
     text_content = "".join(
         block.text for block in response.content if block.type == "text"
     )
-    result = extract_json(text_content)
+    return extract_json(text_content)
+
 
-    amendments = result.get("amendments", [])
-    topology_changes = result.get("team_topology_changes", [])
+async def run_constitution_amender(
+    client: AsyncAnthropic,
+    agent_defs: dict,
+    case_data: dict,
+    constitution: str,
+    r1_observer: dict,
+    r2_observer: dict,
+    diagnosis: dict,
+    proposal: dict | None = None,
+    deadline: Deadline | None = None,
+) -> list[dict]:
+    """Propose and apply constitutional amendments based on case learnings.
+
+    If `proposal` is given (e.g. from a background prefetch), the model call
+    is skipped and the proposal is applied directly.
+    """
+    case_id = case_data.get("case_id", "unknown")
+    update_visualization_state("running", case_id, 2, "constitution_amendment")
+
+    print("[STAGE] amender")
+    print("\n📜 Constitution Amender: Learning from this case")
+    print("─" * 50)
+    if proposal is None:
+        print("  ⏳ Analyzing diagnostic process for systemic improvements...")
+        proposal = await propose_amendments(
+            client, agent_defs, case_data, constitution,
+            r1_observer, r2_observer, diagnosis, deadline=deadline,
+        )
+    else:
+        print("  ⚡ Using prefetched amendment proposal")
+
+    amendments = proposal.get("amendments", [])
+    topology_changes = proposal.get("team_topology_changes", [])
 
     # ── Write amendments to amendments_log.json (append to existing) ──
     amendments_log_path = SHARED_DIR / "constitution" / "amendments_log.json"
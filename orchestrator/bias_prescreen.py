@@ -0,0 +1,280 @@
+"""Bias pre-screen — local, deterministic first pass of the Observer's review.
+
+The Metacognitive Observer is a max-effort model call per round, yet part of
+its output can be computed from the specialist outputs directly. prescreen()
+fills the Observer's output schema (biases_detected, reasoning_quality,
+interrupt_recommended) in milliseconds:
+
+- differential_breadth: distinct alternative diagnoses across the team
+  (dissenting considerations, canonicalized through the diagnosis lexicon)
+  against TARGET_DIFFERENTIALS; a specialist listing fewer than
+  MIN_DIFFERENTIALS is flagged for premature closure (Article 1.3)
+- independence_score: 1 - mean pairwise Jaccard of the specialists' key
+  evidence; in Round 2+, agreement with highly overlapping evidence is
+  flagged as bandwagon risk (Article 2.3)
+- anchoring: a hypothesis naming a diagnosis the patient already carries
+  (the case's diagnoses_given / past_medical_history / "diagnosed with ..."
+  mentions) is flagged, more severely at high confidence
+- calibration: confidence above OVERCONFIDENT without a definitive test
+  is flagged (Article 1.4); a wide confidence spread among specialists who
+  agree raises the flag score
+- diagnostic momentum (Round 2+): same hypothesis, higher confidence and
+  essentially the same evidence as the specialist's previous round
+
+`prescreen["flag_score"]` (0-1) summarizes how much needs a closer look:
+the worst bias severity, or low reasoning quality. The legacy pipeline only
+calls the LLM Observer when it reaches the threshold (or always, in full
+mode); otherwise the pre-screen result stands in for the Observer's, marked
+`"source": "local"`. Agentic mode keeps its pre-screens apart from the
+Observer's analyses (ToolHandler.prescreen_results).
+"""
+
+import itertools
+import re
+
+from orchestrator.convergence import TfidfIndex, hypothesis_similarity, tokenize
+from orchestrator.diagnosis_lexicon import get_lexicon
+
+TARGET_DIFFERENTIALS = 6  # Distinct alternatives for a full breadth score
+MIN_DIFFERENTIALS = 2  # Per specialist, below this is premature closure
+TARGET_EVIDENCE = 5  # Evidence items for full utilization
+OVERCONFIDENT = 0.9  # Article 1.4
+CONFIDENCE_SPREAD_LIMIT = 0.4
+BANDWAGON_INDEPENDENCE = 0.5
+ANCHOR_SIMILARITY = 0.5
+MOMENTUM_EVIDENCE_OVERLAP = 0.7
+
+SEVERITY_WEIGHT = {"low": 0.25, "medium": 0.5, "high": 0.75, "critical": 1.0}
+
+# Definitive tests that can justify confidence above OVERCONFIDENT
+_DEFINITIVE = re.compile(
+    r"(?i)\b(biopsy|genetic|sequencing|mutation|variant|enzyme assay|electrophoresis|"
+    r"culture|pathology|confirmed|pathognomonic)\b"
+)
+_DIAGNOSED_AS = [
+    re.compile(r"(?i)\bdiagnos\w*\s+(?:with\s+|as\s+|of\s+)?['\"‘“]([^'\"’”]{3,80})"),
+    re.compile(r"(?i)\bdiagnosed\s+(?:with|as)\s+([^.;,(—'\"]{3,80})"),
+]
+
+
+def _strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from _strings(v)
+    elif isinstance(value, list):
+        for v in value:
+            yield from _strings(v)
+
+
+def prior_diagnoses(case_data: dict) -> list[str]:
+    """Diagnoses the patient was already given, as recorded in the case."""
+    found: list[str] = []
+
+    def _walk(value):
+        if isinstance(value, dict):
+            for key, v in value.items():
+                if key == "metadata":
+                    continue  # Holds the answer (known_diagnosis), not history
+                if "diagnos" in key.lower() or key == "past_medical_history":
+                    found.extend(_strings(v))
+                else:
+                    _walk(v)
+        elif isinstance(value, list):
+            for v in value:
+                _walk(v)
+
+    _walk(case_data)
+    for text in _strings({k: v for k, v in case_data.items() if k not in ("metadata", "full_medical_records")}):
+        for pattern in _DIAGNOSED_AS:
+            found.extend(m.strip() for m in pattern.findall(text))
+
+    seen, result = set(), []
+    for text in found:
+        key = text.lower().strip()
+        if key and not key.startswith("none") and key not in seen:
+            seen.add(key)
+            result.append(text)
+    return result
+
+
+def _items(value) -> list[str]:
+    if isinstance(value, list):
+        return [str(v) for v in value]
+    return [str(value)] if value else []
+
+
+def _jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a | b else 0.0
+
+
+def _bias(bias_type: str, agent: str, evidence: str, severity: str, recommendation: str) -> dict:
+    return {
+        "bias_type": bias_type,
+        "agent": agent,
+        "evidence": evidence,
+        "severity": severity,
+        "recommendation": recommendation,
+    }
+
+
+def prescreen(
+    specialist_outputs: dict[str, dict],
+    case_data: dict,
+    round_num: int = 1,
+    prior_outputs: dict[str, dict] | None = None,
+) -> dict:
+    """Observer-schema review of one round, computed locally.
+
+    Args:
+        specialist_outputs: {specialist: output dict} for the round.
+        case_data: The case (for the patient's prior diagnoses).
+        round_num: The round being reviewed.
+        prior_outputs: The previous round's outputs (Round 2+), for
+            diagnostic momentum.
+    """
+    outputs = {
+        name: o for name, o in specialist_outputs.items()
+        if isinstance(o, dict) and o.get("diagnosis_hypothesis") and not o.get("pending")
+    }
+    lexicon = get_lexicon()
+    biases: list[dict] = []
+
+    hypotheses = {name: str(o["diagnosis_hypothesis"]) for name, o in outputs.items()}
+    evidence = {name: _items(o.get("key_evidence")) for name, o in outputs.items()}
+    evidence_tokens = {name: set(tokenize(" ".join(items))) for name, items in evidence.items()}
+    differentials = {name: _items(o.get("dissenting_considerations")) for name, o in outputs.items()}
+    confidences = {
+        name: float(o["confidence"]) for name, o in outputs.items()
+        if isinstance(o.get("confidence"), (int, float))
+    }
+    priors = prior_diagnoses(case_data)
+    index = TfidfIndex([tokenize(t) for t in [*hypotheses.values(), *priors]])
+
+    # ── Differential breadth ───────────────────────────────────────────
+    distinct = {lexicon.canonical(d).lower() for items in differentials.values() for d in items}
+    differential_breadth = min(1.0, len(distinct) / TARGET_DIFFERENTIALS)
+    for name, items in differentials.items():
+        if len(items) < MIN_DIFFERENTIALS:
+            biases.append(_bias(
+                "premature_closure", name,
+                f"Only {len(items)} alternative diagnosis(es) considered",
+                "medium" if not items else "low",
+                "Broaden the differential before committing (Article 1.3)",
+            ))
+
+    # ── Independence ───────────────────────────────────────────────────
+    pairs = list(itertools.combinations(evidence_tokens.values(), 2))
+    overlap = sum(_jaccard(a, b) for a, b in pairs) / len(pairs) if pairs else 0.0
+    independence_score = 1.0 - overlap
+    concepts = {name: lexicon.lookup(h) for name, h in hypotheses.items()}
+    named = {m.concept_id for m in concepts.values() if m is not None}
+    all_agree = len(outputs) >= 2 and len(named) == 1 and all(concepts.values())
+    if round_num >= 2 and all_agree and independence_score < BANDWAGON_INDEPENDENCE:
+        biases.append(_bias(
+            "bandwagon", "team",
+            f"All specialists converged on {lexicon.canonical(next(iter(hypotheses.values())))} "
+            f"citing largely the same evidence (overlap {overlap:.2f})",
+            "medium",
+            "Have one specialist argue the strongest alternative (Article 2.3)",
+        ))
+
+    # ── Anchoring on prior diagnoses ───────────────────────────────────
+    for name, hypothesis in hypotheses.items():
+        for prior in priors:
+            if hypothesis_similarity(hypothesis, prior, index) >= ANCHOR_SIMILARITY:
+                high = confidences.get(name, 0.0) >= 0.7
+                biases.append(_bias(
+                    "anchoring", name,
+                    f"Hypothesis '{hypothesis[:80]}' restates the existing diagnosis '{prior[:80]}'",
+                    "high" if high else "medium",
+                    "Test the existing diagnosis against the full timeline before accepting it",
+                ))
+                break
+
+    # ── Confidence calibration ─────────────────────────────────────────
+    for name, confidence in confidences.items():
+        if confidence > OVERCONFIDENT and not any(_DEFINITIVE.search(e) for e in evidence[name]):
+            biases.append(_bias(
+                "premature_closure", name,
+                f"Confidence {confidence:.2f} without a definitive test cited",
+                "medium",
+                "Lower confidence or cite the confirming test (Article 1.4)",
+            ))
+    spread = max(confidences.values()) - min(confidences.values()) if confidences else 0.0
+    # Not a bias of any one specialist, but worth the Observer's attention
+    miscalibrated = all_agree and spread > CONFIDENCE_SPREAD_LIMIT
+
+    # ── Diagnostic momentum ────────────────────────────────────────────
+    for name, hypothesis in hypotheses.items():
+        before = (prior_outputs or {}).get(name)
+        if not isinstance(before, dict) or not before.get("diagnosis_hypothesis"):
+            continue
+        same = lexicon.compare(hypothesis, str(before["diagnosis_hypothesis"])) == "same"
+        rose = confidences.get(name, 0.0) - float(before.get("confidence") or 0.0) >= 0.1
+        old_evidence = set(tokenize(" ".join(_items(before.get("key_evidence")))))
+        if same and rose and _jaccard(evidence_tokens[name], old_evidence) >= MOMENTUM_EVIDENCE_OVERLAP:
+            biases.append(_bias(
+                "diagnostic_momentum", name,
+                "Confidence rose without new evidence since the previous round",
+                "medium",
+                "Justify the higher confidence with evidence not used before",
+            ))
+
+    # ── Scores ─────────────────────────────────────────────────────────
+    utilization = [
+        0.5 * min(1.0, len(items) / TARGET_EVIDENCE)
+        + 0.5 * (sum(1 for e in items if re.search(r"\d", e)) / len(items) if items else 0.0)
+        for items in evidence.values()
+    ]
+    evidence_utilization = sum(utilization) / len(utilization) if utilization else 0.0
+    overall_score = (independence_score + evidence_utilization + differential_breadth) / 3
+
+    worst = max((SEVERITY_WEIGHT[b["severity"]] for b in biases), default=0.0)
+    flag_score = max(worst, 1.0 - overall_score, SEVERITY_WEIGHT["medium"] if miscalibrated else 0.0)
+    if not outputs:
+        flag_score = 1.0
+    return {
+        "agent": "metacognitive_observer",
+        "source": "local",  # Heuristics, not the Observer's review
+        "round": round_num,
+        "biases_detected": biases,
+        "reasoning_quality": {
+            "independence_score": round(independence_score, 2),
+            "evidence_utilization": round(evidence_utilization, 2),
+            "differential_breadth": round(differential_breadth, 2),
+            "overall_score": round(overall_score, 2),
+        },
+        "interrupt_recommended": any(b["severity"] == "critical" for b in biases),
+        "interrupt_reason": "",
+        "prescreen": {
+            "source": "local",
+            "flag_score": round(flag_score, 2),
+            "distinct_differentials": len(distinct),
+            "evidence_overlap": round(overlap, 2),
+            "confidence_spread": round(spread, 2),
+            "miscalibrated": miscalibrated,
+            "prior_diagnoses": priors[:10],
+        },
+    }
+
+
+def summary_lines(result: dict) -> list[str]:
+    """Markdown bullet lines describing a prescreen() result."""
+    quality = result["reasoning_quality"]
+    lines = [
+        f"- Flag score: {result['prescreen']['flag_score']:.2f} "
+        f"(independence {quality['independence_score']:.2f}, "
+        f"evidence use {quality['evidence_utilization']:.2f}, "
+        f"differential breadth {quality['differential_breadth']:.2f})",
+    ]
+    for bias in result["biases_detected"]:
+        lines.append(f"- {bias['severity'].upper()} {bias['bias_type']} ({bias['agent']}): {bias['evidence']}")
+    if result["prescreen"]["miscalibrated"]:
+        lines.append(
+            f"- Specialists agree but their confidence spans {result['prescreen']['confidence_spread']:.2f}"
+        )
+    if not result["biases_detected"]:
+        lines.append("- No biases flagged locally")
+    return lines
@@ -0,0 +1,76 @@
+"""Checkpoints — persist a run's state so it can resume after a crash.
+
+Each run gets a directory under shared/runs/ holding:
+
+- run.json         how the run was started (mode, case path, options)
+- checkpoint.json  the latest state, rewritten after every completed stage
+                   (legacy mode) or tool call / Observer turn (agentic mode)
+
+`python orchestrator.py --resume shared/runs/<run>` reloads both files and
+continues from the last checkpoint; anything already recorded there (model
+outputs, tool results, guard counters) is reused instead of re-requested.
+The checkpoint is written to a temp file and renamed into place, so a crash
+mid-write leaves the previous checkpoint intact.
+"""
+
+import datetime
+import json
+from pathlib import Path
+
+from orchestrator.utils import SHARED_DIR
+
+RUNS_DIR = SHARED_DIR / "runs"
+
+
+def load_run_meta(run_dir: Path) -> dict:
+    """Read how a run was started (its run.json)."""
+    meta_path = Path(run_dir) / "run.json"
+    if not meta_path.exists():
+        raise FileNotFoundError(f"Not a run directory (no run.json): {run_dir}")
+    return json.loads(meta_path.read_text())
+
+
+class RunCheckpoint:
+    def __init__(self, run_dir: Path, meta: dict, state: dict | None = None):
+        self.run_dir = run_dir
+        self.meta = meta
+        self.state = state or {}
+
+    @classmethod
+    def create(cls, mode: str, case_path: Path, options: dict) -> "RunCheckpoint":
+        """Start a new run directory."""
+        stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        run_dir = RUNS_DIR / f"{stamp}_{Path(case_path).stem}"
+        run_dir.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "mode": mode,
+            "case_path": str(Path(case_path).resolve()),
+            "options": options,
+            "created": stamp,
+        }
+        (run_dir / "run.json").write_text(json.dumps(meta, indent=2))
+        print(f"  [CHECKPOINT] Run directory: {run_dir} (resume with --resume {run_dir})")
+        return cls(run_dir, meta)
+
+    @classmethod
+    def load(cls, run_dir: Path) -> "RunCheckpoint":
+        """Open an existing run directory and its latest checkpoint."""
+        run_dir = Path(run_dir)
+        meta = load_run_meta(run_dir)
+        state_path = run_dir / "checkpoint.json"
+        state = json.loads(state_path.read_text()) if state_path.exists() else {}
+        label = state.get("label", "none")
+        print(f"  [CHECKPOINT] Resuming {run_dir.name} from checkpoint '{label}'")
+        return cls(run_dir, meta, state)
+
+    def get(self, key: str, default=None):
+        return self.state.get(key, default)
+
+    def save(self, label: str, **updates):
+        """Merge `updates` into the state and write it atomically."""
+        self.state.update(updates)
+        self.state["label"] = label
+        self.state["saved_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        tmp_path = self.run_dir / "checkpoint.json.tmp"
+        tmp_path.write_text(json.dumps(self.state, indent=2, default=str))
+        tmp_path.replace(self.run_dir / "checkpoint.json")
@@ -1,57 +1,383 @@
 """Context manager — tracks token budget and compresses conversation history."""
 
 import json
+from pathlib import Path
+
+from orchestrator.token_estimator import char_counts, get_estimator, merge_counts
+from orchestrator.utils import DEBATE_DIR
+
+COMPRESSED_MARKER = "[CONTEXT COMPRESSED"
+
+
+def message_char_counts(message) -> dict[str, int]:
+    """Characters per content type (see token_estimator) in one message.
+
+    Handles both dict messages and Anthropic API response objects
+    (which contain Pydantic models like ThinkingBlock, TextBlock, etc.).
+    Images are not counted.
+    """
+    content = _get_attr(message, "content", "")
+    if isinstance(content, str):
+        return char_counts(content)
+    return merge_counts(*(_block_char_counts(b) for b in content))
+
+
+def _block_char_counts(block) -> dict[str, int]:
+    block_type = _get_type(block)
+    if block_type == "text":
+        return char_counts(_get_attr(block, "text", ""))
+    if block_type == "thinking":
+        return char_counts(_get_attr(block, "thinking", ""))
+    if block_type == "tool_use":
+        return char_counts(json.dumps(_get_attr(block, "input", {}), default=str), "json")
+    if block_type == "tool_result":
+        inner = _get_attr(block, "content", "")
+        if isinstance(inner, str):
+            return char_counts(inner)
+        return merge_counts(*(_block_char_counts(b) for b in inner))
+    if block_type == "image":
+        return {}
+    if isinstance(block, dict):
+        return char_counts(json.dumps(block, default=str), "json")
+    return char_counts(str(block), "json")
+
+
+def estimate_message_tokens(message) -> int:
+    """Token estimate for one message, using the learned per-content-type ratios."""
+    return get_estimator().estimate_counts(message_char_counts(message))
+
+
+def to_plain_content(content) -> list | str:
+    """Convert API response content blocks to plain request dicts.
+
+    Done once when an assistant turn is appended, so the history holds only
+    JSON-serializable dicts with the fields the API accepts back.
+    """
+    if isinstance(content, str):
+        return content
+    plain = []
+    for block in content:
+        if isinstance(block, dict):
+            plain.append(block)
+            continue
+        block_type = getattr(block, "type", "")
+        if block_type == "text":
+            plain.append({"type": "text", "text": block.text})
+        elif block_type == "thinking":
+            plain.append({"type": "thinking", "thinking": block.thinking, "signature": block.signature})
+        elif block_type == "redacted_thinking":
+            plain.append({"type": "redacted_thinking", "data": block.data})
+        elif block_type == "tool_use":
+            plain.append({"type": "tool_use", "id": block.id, "name": block.name, "input": block.input})
+        else:
+            plain.append(block.model_dump(exclude_none=True))
+    return plain
+
+
+THINKING_BLOCK_TYPES = {"thinking", "redacted_thinking"}
+
+
+class ContextLedger:
+    """Running token total for the conversation history.
+
+    Each message is estimated once, when it is appended, instead of
+    re-serializing the whole history every iteration. After every API call
+    the total is replaced by the real prompt size from response.usage
+    (which also covers the system prompt and tools), so estimation error
+    never accumulates beyond the messages appended since the last call.
+
+    The growth between two calibrations is also a clean measurement of the
+    messages appended in between, so each calibration feeds it to the
+    token estimator to refine its ratios.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.estimated_since_calibration = 0
+        self._pending_counts: dict[str, int] = {}
+        self._last_actual: int | None = None
+
+    def add(self, message) -> int:
+        counts = message_char_counts(message)
+        tokens = get_estimator().estimate_counts(counts)
+        self.total += tokens
+        self.estimated_since_calibration += tokens
+        self._pending_counts = merge_counts(self._pending_counts, counts)
+        return tokens
+
+    def replace(self, old_message, new_message) -> int:
+        """Account for a message rewritten in place; returns the tokens freed."""
+        old_counts = message_char_counts(old_message)
+        new_counts = message_char_counts(new_message)
+        estimator = get_estimator()
+        freed = estimator.estimate_counts(old_counts) - estimator.estimate_counts(new_counts)
+        self.total = max(0, self.total - freed)
+        self._pending_counts = merge_counts(
+            self._pending_counts, new_counts, {k: -v for k, v in old_counts.items()},
+        )
+        return freed
+
+    def adjust(self, delta: int):
+        """Apply a known change whose content is not tracked (skips the next observation)."""
+        self.total = max(0, self.total + delta)
+        self._last_actual = None
+
+    def reset(self, messages: list):
+        """Recount from scratch — only needed after the history is rewritten."""
+        self.total = sum(estimate_message_tokens(m) for m in messages)
+        self.estimated_since_calibration = self.total
+        self._pending_counts = {}
+        self._last_actual = None
+
+    def calibrate(self, usage):
+        """Replace the running total with the real input size of the last request."""
+        actual = (
+            (getattr(usage, "input_tokens", 0) or 0)
+            + (getattr(usage, "cache_read_input_tokens", 0) or 0)
+            + (getattr(usage, "cache_creation_input_tokens", 0) or 0)
+        )
+        if self._last_actual is not None and all(v >= 0 for v in self._pending_counts.values()):
+            get_estimator().observe(self._pending_counts, actual - self._last_actual)
+        self.total = actual
+        self.estimated_since_calibration = 0
+        self._pending_counts = {}
+        self._last_actual = actual
 
 
 class ContextManager:
     """Manages the Observer-orchestrator's conversation context to stay within token limits."""
 
-    def __init__(self, max_tokens: int = 150_000):
+    def __init__(self, max_tokens: int = 150_000, archive_dir: Path | None = None):
         self.max_tokens = max_tokens
         self.specialist_full_outputs = {}  # Stored on disk, not in context
+        self.ledger = ContextLedger()
+        self.archive_dir = archive_dir or DEBATE_DIR / "context_archive"
+        self.last_compaction: dict = {}
+        self.thinking_blocks_pruned = 0
+        self.thinking_tokens_pruned = 0
+        self._pruned_through = 0  # History index below which thinking is already gone
+
+    def append(self, messages: list, message: dict):
+        """Append a message to the history and count it in the ledger."""
+        messages.append(message)
+        self.ledger.add(message)
+
+    def record_usage(self, usage):
+        """Calibrate the ledger with the usage of the request just sent.
+
+        Call right after each API response, before appending the response
+        itself, so the real input size lines up with the history it covers.
+        """
+        self.ledger.calibrate(usage)
 
     def estimate_tokens(self, messages: list) -> int:
-        """Rough token estimate: ~4 chars per token.
+        """Full recount of a message list (O(history)); the loop uses the ledger instead."""
+        return sum(estimate_message_tokens(m) for m in messages)
+
+    def approaching_limit(self) -> bool:
+        """Check if context is approaching the token budget (O(1), from the ledger)."""
+        return self.ledger.total > self.max_tokens * 0.8
 
-        Handles both dict messages and Anthropic API response objects
-        (which contain Pydantic models like ThinkingBlock, TextBlock, etc.).
+    def prune_stale_thinking(self, messages: list) -> int:
+        """Drop thinking blocks from every assistant turn but the latest.
+
+        The API only needs the thinking of the latest assistant message (the
+        one whose tool results are being returned); earlier thinking is
+        never required again but is re-sent on every iteration. An assistant
+        message that held nothing but thinking keeps a short placeholder so
+        the history stays well-formed. Returns the estimated tokens freed.
+
+        Rewriting earlier turns changes the cached prompt prefix, so the next
+        request writes the cache instead of reading it: only call this when
+        the history has to shrink anyway (see approaching_limit).
         """
-        total_chars = 0
-        for m in messages:
-            try:
-                total_chars += len(json.dumps(m))
-            except TypeError:
-                # Message contains non-serializable objects (e.g., Anthropic
-                # API response content blocks). Estimate from string repr.
-                total_chars += len(str(m))
-        return total_chars // 4
-
-    def approaching_limit(self, messages: list) -> bool:
-        """Check if context is approaching the token budget."""
-        return self.estimate_tokens(messages) > self.max_tokens * 0.8
-
-    def compress(self, messages: list) -> list:
-        """Compress conversation by summarizing older tool results.
-
-        Strategy: keep the first message (case presentation) and last 6 messages
-        intact. Summarize everything in between.
+        last_assistant = next(
+            (i for i in range(len(messages) - 1, -1, -1) if _get_attr(messages[i], "role") == "assistant"),
+            None,
+        )
+        if last_assistant is None or last_assistant <= self._pruned_through:
+            return 0
+
+        freed = 0
+        for i in range(self._pruned_through, last_assistant):
+            msg = messages[i]
+            content = msg.get("content") if isinstance(msg, dict) else None
+            if msg.get("role") != "assistant" or not isinstance(content, list):
+                continue
+            kept = [b for b in content if _get_type(b) not in THINKING_BLOCK_TYPES]
+            dropped = len(content) - len(kept)
+            if not dropped:
+                continue
+            if not kept:
+                kept = [{"type": "text", "text": "(earlier reasoning omitted)"}]
+            messages[i] = {**msg, "content": kept}
+            freed += self.ledger.replace(msg, messages[i])
+            self.thinking_blocks_pruned += dropped
+
+        self._pruned_through = last_assistant
+        self.thinking_tokens_pruned += freed
+        return freed
+
+    def hygiene_summary(self) -> str:
+        return (
+            f"History hygiene: {self.thinking_blocks_pruned} stale thinking block(s) pruned "
+            f"(~{self.thinking_tokens_pruned:,} tokens not re-sent per request)"
+        )
+
+    def compress(self, messages: list, target_tokens: int | None = None) -> list:
+        """Compact the history down to a token target, one whole turn at a time.
+
+        The history after the case presentation is split into turns: an
+        assistant message plus the user messages that follow it (its
+        tool_results and any injected nudges). Turns are evicted whole, so a
+        tool_result is never separated from its tool_use. Eviction order is
+        oldest-and-largest first (tokens weighted by age); the latest turn is
+        always kept. Eviction stops once the ledger total is at or below
+        `target_tokens` (default: half of max_tokens).
+
+        Each evicted tool result is archived to disk under a stable
+        reference (its tool_use_id) that the Observer can recover with
+        get_debate_state(ref=...). The evicted turns are replaced by one
+        summary message placed right after the case presentation.
         """
-        if len(messages) <= 8:
-            return messages
+        if target_tokens is None:
+            target_tokens = self.max_tokens // 2
 
         head = messages[:1]  # Case presentation
-        tail = messages[-6:]  # Recent context
-        middle = messages[1:-6]
+        prior_summaries, units = self._split_turns(messages[1:])
+        if len(units) <= 1:
+            return messages
+
+        to_free = self.ledger.total - target_tokens
+        if to_free <= 0:
+            return messages
+
+        # Oldest-and-largest first; the latest turn is never a candidate
+        n = len(units)
+        candidates = sorted(
+            range(n - 1),
+            key=lambda i: self.estimate_tokens(units[i]) * (n - i),
+            reverse=True,
+        )
+        evicted = set()
+        freed = 0
+        for i in candidates:
+            if freed >= to_free:
+                break
+            evicted.add(i)
+            freed += self.estimate_tokens(units[i])
 
-        summary_text = self._summarize_middle(middle)
+        summary_lines = []
+        for text in prior_summaries:
+            summary_lines.append(text.split("\n\n", 1)[-1])
+        for i in sorted(evicted):
+            summary_lines.extend(self._archive_turn(units[i]))
 
+        summary_text = "\n".join(summary_lines) or "No significant activity in compressed section."
         compressed = head + [{
             "role": "user",
-            "content": f"[CONTEXT COMPRESSED — earlier tool calls summarized to save context]\n\n{summary_text}"
-        }] + tail
+            "content": (
+                f"{COMPRESSED_MARKER} — earlier tool calls summarized to save context. "
+                "Full results are archived; pass a ref to `get_debate_state` to recover one]\n\n"
+                f"{summary_text}"
+            ),
+        }]
+        for i, unit in enumerate(units):
+            if i not in evicted:
+                compressed.extend(unit)
 
+        self.last_compaction = {"turns_evicted": len(evicted), "tokens_freed_est": freed}
+        self._pruned_through = 0
+        self.ledger.reset(compressed)
         return compressed
 
+    def load_archived(self, ref: str) -> str | None:
+        """Return an archived tool result by reference, or None if unknown."""
+        path = self.archive_dir / f"{Path(ref).name}.json"
+        if not path.exists():
+            return None
+        record = json.loads(path.read_text())
+        return (
+            f"## Archived result {ref}\n"
+            f"- Tool: {record.get('tool')}\n"
+            f"- Input: {json.dumps(record.get('input'))[:500]}\n\n"
+            f"{record.get('result', '')}"
+        )
+
+    def _split_turns(self, messages: list) -> tuple[list[str], list[list]]:
+        """Split history into (earlier compaction summaries, turns).
+
+        A turn starts at an assistant message and runs until the next one.
+        """
+        prior_summaries = []
+        units: list[list] = []
+        for msg in messages:
+            role = _get_attr(msg, "role", "")
+            content = _get_attr(msg, "content", "")
+            if role == "assistant" or not units:
+                if (
+                    role == "user" and not units and isinstance(content, str)
+                    and content.startswith(COMPRESSED_MARKER)
+                ):
+                    prior_summaries.append(content)
+                    continue
+                units.append([msg])
+            else:
+                units[-1].append(msg)
+        return prior_summaries, units
+
+    def _archive_turn(self, unit: list) -> list[str]:
+        """Write a turn's tool results to the archive and return summary lines."""
+        lines = []
+        calls = {}
+        for msg in unit:
+            role = _get_attr(msg, "role", "")
+            content = _get_attr(msg, "content", "")
+            if role == "assistant" and isinstance(content, list):
+                for b in content:
+                    if _get_type(b) == "tool_use":
+                        calls[_get_attr(b, "id")] = (_get_attr(b, "name", "?"), _get_attr(b, "input", {}))
+                text = " ".join(
+                    str(_get_attr(b, "text", "")) for b in content if _get_type(b) == "text"
+                ).strip()
+                if text:
+                    lines.append(f"Observer reasoning: {text[:200]}...")
+            elif role == "user" and isinstance(content, list):
+                for item in content:
+                    if _get_type(item) != "tool_result":
+                        continue
+                    ref = _get_attr(item, "tool_use_id", "")
+                    name, tool_input = calls.get(ref, ("?", {}))
+                    result_text = _get_attr(item, "content", "")
+                    if not isinstance(result_text, str):
+                        result_text = json.dumps(result_text, default=str)
+                    self._write_archive(ref, name, tool_input, result_text)
+                    args = ", ".join(f"{k}={v}" for k, v in tool_input.items() if k != "focus_instructions")
+                    line = f"- {name}({args[:120]}) → ref `{ref}`: {result_text[:150]}..."
+                    if name == "call_specialist":
+                        line += (
+                            f" [full output: debate/round_{tool_input.get('round')}"
+                            f"/{tool_input.get('specialist_type')}.json]"
+                        )
+                    elif name == "run_round":
+                        line += f" [full outputs: debate/round_{tool_input.get('round')}/]"
+                    lines.append(line)
+            elif role == "user" and isinstance(content, str):
+                lines.append(f"System: {content[:200]}...")
+        return lines
+
+    def _write_archive(self, ref: str, tool_name: str, tool_input: dict, result: str):
+        try:
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            (self.archive_dir / f"{ref}.json").write_text(json.dumps({
+                "tool_use_id": ref,
+                "tool": tool_name,
+                "input": tool_input,
+                "result": result,
+            }, indent=2, default=str))
+        except OSError:
+            pass  # The summary line still carries a preview
+
     def summarize_specialist_output(self, full_output: dict) -> str:
         """Summarize a specialist's output for context efficiency.
 
@@ -103,48 +429,13 @@ class ContextManager:
         }
         return json.dumps(summary, indent=2)
 
-    def _summarize_middle(self, messages: list) -> str:
-        """Build a text summary of middle conversation turns.
-
-        Handles both dict-based messages and Anthropic API response objects
-        (Pydantic models with .type, .text, .name attributes).
-        """
-        parts = []
 
-        def _get_attr(obj, key, default=""):
-            """Get attribute from dict or Pydantic object."""
-            if isinstance(obj, dict):
-                return obj.get(key, default)
-            return getattr(obj, key, default)
+def _get_attr(obj, key, default=""):
+    """Get attribute from dict or Pydantic object."""
+    if isinstance(obj, dict):
+        return obj.get(key, default)
+    return getattr(obj, key, default)
 
-        def _get_type(obj):
-            return _get_attr(obj, "type", "")
-
-        for msg in messages:
-            role = _get_attr(msg, "role", "unknown")
-            content = _get_attr(msg, "content", "")
 
-            if role == "assistant":
-                if isinstance(content, list):
-                    tool_calls = [b for b in content if _get_type(b) == "tool_use"]
-                    text_blocks = [b for b in content if _get_type(b) == "text"]
-                    if tool_calls:
-                        call_names = [_get_attr(tc, "name", "?") for tc in tool_calls]
-                        parts.append(f"Observer called: {', '.join(call_names)}")
-                    if text_blocks:
-                        text = " ".join(str(_get_attr(b, "text", "")) for b in text_blocks)
-                        parts.append(f"Observer reasoning: {text[:200]}...")
-                elif isinstance(content, str):
-                    parts.append(f"Observer: {content[:200]}...")
-
-            elif role == "user":
-                if isinstance(content, list):
-                    for item in content:
-                        if _get_type(item) == "tool_result":
-                            result_text = _get_attr(item, "content", "")
-                            if isinstance(result_text, str):
-                                parts.append(f"Tool result: {result_text[:150]}...")
-                elif isinstance(content, str):
-                    parts.append(f"System: {content[:200]}...")
-
-        return "\n".join(parts) if parts else "No significant activity in compressed section."
+def _get_type(obj):
+    return _get_attr(obj, "type", "")
@@ -0,0 +1,274 @@
+"""Convergence — deterministic, local scoring of how far a debate round agrees.
+
+review_round used to count unique lowercased hypotheses, so "Batten disease
+(CLN2)" and "CLN2 neuronal ceroid lipofuscinosis" looked like disagreement
+and the Observer paid for another round. assess_round() scores a round from
+the specialist outputs alone, with no model call:
+
+- agreement: hypotheses are compared through the diagnosis lexicon (same
+  concept = agreement; a concept and its own subtype = partial agreement;
+  two different subtypes of a family, e.g. CLN2 vs CLN3, or unrelated
+  concepts = disagreement) and,
+  when the lexicon doesn't know one of them, by TF-IDF cosine over
+  normalized tokens (the IDF is fitted on the round's own text); they are
+  then clustered, and agreement is the share of specialists in the
+  largest cluster
+- confidence: mean and spread (max - min) of the reported confidences
+- differential / evidence overlap: mean pairwise Jaccard of the tokens of
+  each specialist's dissenting considerations and key evidence
+- change: against the previous round, how similar each specialist's
+  hypothesis stayed (stability) and how much agreement moved
+
+These combine into a 0-1 score and a verdict ("converged", "near",
+"divergent"). A round with no reported confidences gets no credit for
+confidence. The report is shown in review_round, and
+LoopGuards(auto_synthesis_convergence=...) can trigger synthesis from it,
+but only if the agreeing specialists name the same concept (`same_concept`).
+"""
+
+import itertools
+import math
+import re
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+
+from orchestrator.diagnosis_lexicon import get_lexicon
+
+# Hypotheses at least this similar count as the same diagnosis
+SAME_DIAGNOSIS_SIMILARITY = 0.5
+# Lexicon relations that are neither "same" nor "different": a concept and
+# its own subtype (Batten disease / CLN2) agree in part; two subtypes of one
+# family (CLN2 / CLN3) are different diseases with different tests
+SUBTYPE_SIMILARITY = 0.75
+SIBLING_SIMILARITY = 0.25
+
+# Score weights (sum to 1)
+WEIGHTS = {
+    "agreement": 0.6,
+    "confidence": 0.2,
+    "differentials": 0.1,
+    "evidence": 0.1,
+}
+
+CONVERGED_SCORE = 0.75
+CONVERGED_AGREEMENT = 0.75  # And no more than a quarter of specialists dissenting
+CONVERGED_STABILITY = 0.5  # And hypotheses no longer shifting between rounds
+NEAR_SCORE = 0.5
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is",
+    "of", "on", "or", "the", "to", "with", "without", "likely", "probable",
+    "possible", "suspected", "secondary", "due", "vs", "versus", "consistent",
+    # Generic diagnosis words that say nothing about *which* diagnosis
+    "disease", "disorder", "syndrome", "condition", "type", "form",
+}
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased word tokens without stopwords, with a plural 's' stripped."""
+    tokens = []
+    for token in _TOKEN.findall(str(text).lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 4 and token.endswith("s") and not token.endswith(("ss", "is", "us")):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+class TfidfIndex:
+    """Smoothed IDF over a small corpus, for cosine similarity between texts."""
+
+    def __init__(self, documents: list[list[str]]):
+        df = Counter(token for doc in documents for token in set(doc))
+        n = len(documents)
+        self.idf = {token: math.log((1 + n) / (1 + count)) + 1 for token, count in df.items()}
+        self.default_idf = math.log(1 + n) + 1
+
+    def vector(self, tokens: list[str]) -> dict[str, float]:
+        counts = Counter(tokens)
+        return {t: c * self.idf.get(t, self.default_idf) for t, c in counts.items()}
+
+    def similarity(self, a: list[str], b: list[str]) -> float:
+        va, vb = self.vector(a), self.vector(b)
+        dot = sum(w * vb.get(t, 0.0) for t, w in va.items())
+        norm = math.sqrt(sum(w * w for w in va.values())) * math.sqrt(sum(w * w for w in vb.values()))
+        return dot / norm if norm else 0.0
+
+
+def hypothesis_similarity(a: str, b: str, index: TfidfIndex) -> float:
+    """1.0 for the same concept, partial for related ones, 0.0 for different ones, else TF-IDF cosine."""
+    lexicon = get_lexicon()
+    relation = lexicon.compare(a, b)
+    if relation == "same":
+        return 1.0
+    if relation == "related":
+        match_a, match_b = lexicon.lookup(a), lexicon.lookup(b)
+        if (
+            match_a.concept_id in lexicon.ancestors(match_b.concept_id)
+            or match_b.concept_id in lexicon.ancestors(match_a.concept_id)
+        ):
+            return SUBTYPE_SIMILARITY
+        return SIBLING_SIMILARITY
+    if relation == "different":
+        return 0.0
+    return index.similarity(tokenize(a), tokenize(b))
+
+
+def _jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a | b else 0.0
+
+
+def _mean_pairwise(sets: list[set]) -> float:
+    pairs = list(itertools.combinations(sets, 2))
+    return sum(_jaccard(a, b) for a, b in pairs) / len(pairs) if pairs else 1.0
+
+
+def _items(value) -> list[str]:
+    if isinstance(value, list):
+        return [str(v) for v in value]
+    return [str(value)] if value else []
+
+
+@dataclass
+class ConvergenceReport:
+    round_number: int
+    specialists: int
+    clusters: list[list[str]] = field(default_factory=list)  # Largest first
+    diagnoses: list[str] = field(default_factory=list)  # Canonical name per cluster
+    agreement: float = 0.0
+    # The largest cluster's hypotheses all name one lexicon concept (or none
+    # the lexicon knows); False when it mixes a concept with its subtypes
+    same_concept: bool = True
+    mean_confidence: float | None = None
+    confidence_spread: float | None = None
+    differential_overlap: float = 0.0
+    evidence_overlap: float = 0.0
+    stability: float | None = None  # vs the previous round
+    agreement_change: float | None = None
+    score: float = 0.0
+    verdict: str = "divergent"
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def lines(self) -> list[str]:
+        """Markdown bullet lines for the review_round output."""
+        lines = [
+            f"- Convergence score: {self.score:.2f} — **{self.verdict.upper()}**",
+            f"- Agreement: {self.agreement:.0%} of specialists in the largest hypothesis cluster "
+            f"({len(self.clusters)} cluster(s): "
+            + "; ".join(
+                f"{d} [{', '.join(c)}]" for d, c in zip(self.diagnoses, self.clusters)
+            ) + ")",
+        ]
+        if not self.same_concept:
+            lines.append("- The largest cluster mixes a diagnosis with its subtypes — specificity still differs")
+        if self.confidence_spread is not None:
+            lines.append(f"- Confidence: mean {self.mean_confidence:.2f}, spread {self.confidence_spread:.2f}")
+        lines.append(
+            f"- Overlap: differentials {self.differential_overlap:.2f}, evidence {self.evidence_overlap:.2f}"
+        )
+        if self.stability is not None:
+            lines.append(
+                f"- Change vs previous round: hypothesis stability {self.stability:.2f}, "
+                f"agreement {self.agreement_change:+.0%}"
+            )
+        return lines
+
+
+def assess_round(
+    outputs: dict[str, dict],
+    round_number: int,
+    previous: dict[str, dict] | None = None,
+) -> ConvergenceReport:
+    """Score how far one round's specialist outputs agree.
+
+    Args:
+        outputs: {specialist: output dict} for the round.
+        round_number: The round being assessed.
+        previous: The previous round's outputs, for the change metrics.
+    """
+    outputs = {
+        name: o for name, o in outputs.items()
+        if isinstance(o, dict) and o.get("diagnosis_hypothesis")
+    }
+    names = list(outputs)
+    report = ConvergenceReport(round_number=round_number, specialists=len(names))
+    if not names:
+        return report
+
+    texts = {name: str(outputs[name]["diagnosis_hypothesis"]) for name in names}
+    hypotheses = {name: tokenize(texts[name]) for name in names}
+    evidence = {name: tokenize(" ".join(_items(outputs[name].get("key_evidence")))) for name in names}
+    differentials = {
+        name: tokenize(" ".join(_items(outputs[name].get("dissenting_considerations")))) for name in names
+    }
+    previous_texts = {
+        name: str(o["diagnosis_hypothesis"])
+        for name, o in (previous or {}).items()
+        if isinstance(o, dict) and o.get("diagnosis_hypothesis")
+    }
+    index = TfidfIndex(
+        list(hypotheses.values()) + list(evidence.values()) + list(differentials.values())
+        + [tokenize(t) for t in previous_texts.values()]
+    )
+
+    # Cluster hypotheses (union-find over similar pairs)
+    parent = {name: name for name in names}
+
+    def _root(name):
+        while parent[name] != name:
+            name = parent[name]
+        return name
+
+    for a, b in itertools.combinations(names, 2):
+        if hypothesis_similarity(texts[a], texts[b], index) >= SAME_DIAGNOSIS_SIMILARITY:
+            parent[_root(b)] = _root(a)
+    clusters: dict[str, list[str]] = {}
+    for name in names:
+        clusters.setdefault(_root(name), []).append(name)
+    report.clusters = sorted(clusters.values(), key=len, reverse=True)
+    report.agreement = len(report.clusters[0]) / len(names)
+    report.diagnoses = [get_lexicon().canonical(texts[c[0]])[:60] for c in report.clusters]
+    matched = [get_lexicon().lookup(texts[name]) for name in report.clusters[0]]
+    concepts = {m.concept_id for m in matched if m is not None}
+    report.same_concept = len(concepts) <= 1 and (all(matched) or not concepts)
+
+    confidences = [
+        float(o["confidence"]) for o in outputs.values()
+        if isinstance(o.get("confidence"), (int, float))
+    ]
+    if confidences:
+        report.mean_confidence = sum(confidences) / len(confidences)
+        report.confidence_spread = max(confidences) - min(confidences)
+
+    report.differential_overlap = _mean_pairwise([set(t) for t in differentials.values()])
+    report.evidence_overlap = _mean_pairwise([set(t) for t in evidence.values()])
+
+    if previous_texts:
+        shared = [name for name in names if name in previous_texts]
+        if shared:
+            report.stability = sum(
+                hypothesis_similarity(texts[n], previous_texts[n], index) for n in shared
+            ) / len(shared)
+        report.agreement_change = report.agreement - assess_round(previous, round_number - 1).agreement
+
+    report.score = (
+        WEIGHTS["agreement"] * report.agreement
+        + WEIGHTS["confidence"] * (1.0 - report.confidence_spread if report.confidence_spread is not None else 0.0)
+        + WEIGHTS["differentials"] * report.differential_overlap
+        + WEIGHTS["evidence"] * report.evidence_overlap
+    )
+    if (
+        len(names) >= 2
+        and report.agreement >= CONVERGED_AGREEMENT
+        and report.score >= CONVERGED_SCORE
+        and (report.stability is None or report.stability >= CONVERGED_STABILITY)
+    ):
+        report.verdict = "converged"
+    elif report.score >= NEAR_SCORE:
+        report.verdict = "near"
+    return report
@@ -0,0 +1,118 @@
+"""Deadline — one wall-clock budget per run, enforced on every model call.
+
+LoopGuards only checks the clock between loop iterations, so a single hung
+stream could run past the budget. A Deadline is created once per run and
+passed to every caller, which uses two helpers around its API request:
+
+    async def _stream():
+        async with client.messages.stream(
+            ..., **limits(deadline, "synthesis", 16_000, {"type": "adaptive"}),
+        ) as stream:
+            return await stream.get_final_message()
+
+    response = await within(deadline, "synthesis", _stream())
+
+- within() gives the request a timeout equal to the time the stage may use
+  and cancels the in-flight stream when it runs out (DeadlineExceeded).
+- limits() returns max_tokens/thinking for the request, degraded as the
+  deadline approaches: first a smaller max_tokens, then thinking disabled,
+  so late calls are short enough to finish.
+
+Stages that run before synthesis (specialists, observer reviews) may not eat
+into `synthesis_reserve` seconds, which are kept for a forced synthesis.
+Both helpers accept deadline=None and then change nothing.
+"""
+
+import asyncio
+import time
+
+from orchestrator.scheduler import call_stage
+
+# Stages that must leave the synthesis reserve untouched
+PRE_SYNTHESIS_STAGES = {"specialist", "observer_review"}
+
+# (seconds available below which to degrade, max_tokens divisor, thinking off)
+DEGRADATION_TIERS = [
+    (120, 4, True),
+    (300, 2, False),
+]
+MIN_MAX_TOKENS = 2_000
+
+
+class DeadlineExceeded(TimeoutError):
+    """A model call was cancelled (or not started) because the run deadline passed."""
+
+
+class Deadline:
+    def __init__(self, seconds: float, synthesis_reserve: float = 180.0):
+        self.expires_at = time.monotonic() + seconds
+        self.synthesis_reserve = synthesis_reserve
+
+    def charge(self, seconds: float):
+        """Count time already spent (e.g. by the run before a resume) against the budget."""
+        self.expires_at -= seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def available(self, stage: str) -> float:
+        """Seconds a call in `stage` may take."""
+        remaining = self.remaining()
+        if stage in PRE_SYNTHESIS_STAGES:
+            remaining -= self.synthesis_reserve
+        return max(0.0, remaining)
+
+    def limits(self, stage: str, max_tokens: int, thinking: dict | None = None) -> dict:
+        """Request kwargs for max_tokens (and thinking, if the call uses it), degraded to fit."""
+        available = self.available(stage)
+        kwargs = {"max_tokens": max_tokens}
+        if thinking is not None:
+            kwargs["thinking"] = thinking
+
+        for threshold, divisor, thinking_off in DEGRADATION_TIERS:
+            if available < threshold:
+                kwargs["max_tokens"] = max(MIN_MAX_TOKENS, max_tokens // divisor)
+                if thinking_off and thinking is not None:
+                    kwargs["thinking"] = {"type": "disabled"}
+                print(
+                    f"  [DEADLINE] {stage}: {available:.0f}s available — "
+                    f"max_tokens {kwargs['max_tokens']:,}"
+                    + (", thinking off" if kwargs.get("thinking") == {"type": "disabled"} else "")
+                )
+                break
+        return kwargs
+
+    async def run(self, coro, stage: str):
+        """Await `coro`, cancelling it if the stage's time runs out."""
+        available = self.available(stage)
+        if available <= 0:
+            coro.close()
+            raise DeadlineExceeded(f"No time left for {stage} (deadline passed or reserved for synthesis)")
+        try:
+            return await asyncio.wait_for(coro, timeout=available)
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(f"{stage} cancelled after {available:.0f}s — run deadline reached") from None
+
+
+def limits(deadline: Deadline | None, stage: str, max_tokens: int, thinking: dict | None = None) -> dict:
+    """Deadline.limits(), or the unchanged values when there is no deadline."""
+    if deadline is None:
+        kwargs = {"max_tokens": max_tokens}
+        if thinking is not None:
+            kwargs["thinking"] = thinking
+        return kwargs
+    return deadline.limits(stage, max_tokens, thinking)
+
+
+async def within(deadline: Deadline | None, stage: str, coro):
+    """Deadline.run(), or a plain await when there is no deadline.
+
+    Also labels the request with `stage` for the rate-limit scheduler.
+    """
+    with call_stage(stage):
+        if deadline is None:
+            return await coro
+        return await deadline.run(coro, stage)
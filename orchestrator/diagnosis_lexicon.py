@@ -0,0 +1,320 @@
+"""Diagnosis lexicon — map free-text hypotheses to canonical diagnosis concepts.
+
+Specialists name the same diagnosis many ways ("Batten disease (CLN2)",
+"CLN2 neuronal ceroid lipofuscinosis", "TPP1 deficiency"). The lexicon in
+shared/diagnosis_lexicon.json lists concepts with their synonyms,
+abbreviations and gene/subtype aliases; a concept may have a `parent`
+(CLN2 disease → neuronal ceroid lipofuscinosis), and the root of that chain
+is its family.
+
+An abbreviation is only listed as an alias if it names one diagnosis in
+clinical text: "ASD" (autism or atrial septal defect), "PE", "PD", "CP",
+"SCD", "CHD", "NPC" and "NPH" are left out, so a text that only uses one of
+them matches nothing rather than the wrong concept. The same goes for
+eponyms shared by unrelated diagnoses ("syndrome X": metabolic or cardiac).
+
+lookup() finds the concept a text names, with no model call:
+
+1. Exact: a token trie over every alias, matched at each position of the
+   text. When both a concept and one of its subtypes are named, the
+   subtype wins; otherwise the first mention wins.
+2. Fuzzy, only if nothing matched exactly: windows of 1-4 tokens are
+   compared with aliases by character-trigram Dice similarity (through a
+   trigram → alias index), which absorbs misspellings. A window must have
+   about as many tokens as the alias (one more or one fewer), and windows of
+   only generic words ("syndrome", "disease of the") are not compared, so
+   an unlisted "Marfan syndrome" matches nothing.
+
+Mentions in a negated clause are skipped by both steps: after a cue such as
+"not", "no", "without" or "rule out" up to the end of the clause, or before
+"ruled out", "excluded" or "unlikely" ("Not Rett syndrome; likely CLN2"
+names CLN2). A clause ends at , ; : . ( ) or "but".
+
+Lookups are cached, so repeated hypotheses cost a dict access. compare()
+says whether two texts name the same concept, related concepts (same
+family) or different ones. Used by the convergence scoring, the legacy
+round comparison and the reference check at the end of a run.
+"""
+
+import json
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+from orchestrator.utils import SHARED_DIR
+
+LEXICON_PATH = SHARED_DIR / "diagnosis_lexicon.json"
+
+FUZZY_THRESHOLD = 0.8  # Trigram Dice similarity for a fuzzy match
+MAX_FUZZY_WINDOW = 4  # Longest token window compared fuzzily
+MIN_FUZZY_CHARS = 5  # Shorter windows are too ambiguous to match fuzzily
+CACHE_SIZE = 4096
+
+# Words that name no diagnosis on their own; windows made only of them are
+# never matched fuzzily (cf. convergence.STOPWORDS)
+GENERIC_WORDS = {
+    "disease", "disorder", "syndrome", "condition", "type", "form",
+    "of", "the", "and", "with", "a", "an", "in",
+}
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+# Captured, so split() keeps the separators and the tokens match normalize()'s
+_CLAUSE_BREAK = re.compile(r"([,;:.()\[\]\n]|\b(?:but|however|whereas)\b)")
+# Negation cues as token sequences: before the mentions they negate...
+_NEGATION_BEFORE = [("not",), ("no",), ("without",), ("excluding",), ("exclude",), ("r", "o"),
+                    ("rule", "out"), ("rules", "out"), ("ruling", "out"), ("negative", "for")]
+# ...and after them
+_NEGATION_AFTER = [("ruled", "out"), ("excluded",), ("unlikely",), ("less", "likely")]
+_CUE_WORDS = {cue[0] for cue in _NEGATION_BEFORE + _NEGATION_AFTER}
+
+
+def normalize(text: str) -> list[str]:
+    """Lowercased alphanumeric tokens ("Cushing's" → ["cushing", "s"])."""
+    return _TOKEN.findall(str(text).lower())
+
+
+def _cue_at(tokens: list[str], i: int, cues: list[tuple]) -> int:
+    """Length of the cue starting at tokens[i], or 0."""
+    for cue in cues:
+        if tuple(tokens[i:i + len(cue)]) == cue:
+            return len(cue)
+    return 0
+
+
+def tokenize_clauses(text: str) -> tuple[list[str], set[int]]:
+    """normalize()'s tokens, and the positions of the negated ones."""
+    text = str(text).lower()
+    tokens = _TOKEN.findall(text)
+    if _CUE_WORDS.isdisjoint(tokens):
+        return tokens, set()
+    tokens = []
+    negated: set[int] = set()
+    for clause in _CLAUSE_BREAK.split(text):
+        words = _TOKEN.findall(clause)
+        offset = len(tokens)
+        tokens.extend(words)
+        for i in range(len(words)):
+            if words[i] not in _CUE_WORDS:
+                continue
+            if n := _cue_at(words, i, _NEGATION_BEFORE):
+                negated.update(range(offset + i + n, offset + len(words)))
+            elif _cue_at(words, i, _NEGATION_AFTER):
+                negated.update(range(offset, offset + i))
+    return tokens, negated
+
+
+def _trigrams(text: str) -> frozenset[str]:
+    padded = f"  {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+@dataclass(frozen=True)
+class LexiconMatch:
+    concept_id: str
+    name: str  # Canonical name
+    family: str  # Root concept id
+    alias: str  # The alias that matched
+    score: float  # 1.0 for exact matches
+    method: str  # "exact" or "fuzzy"
+
+
+class DiagnosisLexicon:
+    def __init__(self, concepts: list[dict]):
+        self.concepts = {c["id"]: c for c in concepts}
+        self._trie: dict = {}
+        self._aliases: list[tuple[str, str, frozenset]] = []  # (alias, concept_id, trigrams)
+        self._trigram_index: dict[str, set[int]] = {}
+        self._cache: dict[str, LexiconMatch | None] = {}
+
+        for concept in concepts:
+            for alias in {concept["name"], *concept.get("aliases", [])}:
+                tokens = normalize(alias)
+                if not tokens:
+                    continue
+                node = self._trie
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                node.setdefault(None, set()).add(concept["id"])
+
+                joined = " ".join(tokens)
+                grams = _trigrams(joined)
+                for gram in grams:
+                    self._trigram_index.setdefault(gram, set()).add(len(self._aliases))
+                self._aliases.append((joined, concept["id"], grams))
+
+    @classmethod
+    def load(cls, path: Path = LEXICON_PATH) -> "DiagnosisLexicon":
+        data = json.loads(Path(path).read_text())
+        return cls(data.get("concepts", []))
+
+    # ── Concepts ───────────────────────────────────────────────────────
+
+    def ancestors(self, concept_id: str) -> list[str]:
+        """Parent, grandparent, ... of a concept."""
+        chain = []
+        parent = self.concepts[concept_id].get("parent")
+        while parent and parent in self.concepts and parent not in chain:
+            chain.append(parent)
+            parent = self.concepts[parent].get("parent")
+        return chain
+
+    def family(self, concept_id: str) -> str:
+        chain = self.ancestors(concept_id)
+        return chain[-1] if chain else concept_id
+
+    def _match(self, concept_id: str, alias: str, score: float, method: str) -> LexiconMatch:
+        return LexiconMatch(
+            concept_id=concept_id,
+            name=self.concepts[concept_id]["name"],
+            family=self.family(concept_id),
+            alias=alias,
+            score=score,
+            method=method,
+        )
+
+    # ── Lookup ─────────────────────────────────────────────────────────
+
+    def lookup(self, text: str) -> LexiconMatch | None:
+        """The concept `text` names, or None if nothing in the lexicon matches."""
+        if text in self._cache:
+            return self._cache[text]
+        tokens, negated = tokenize_clauses(text)
+        match = self._exact(tokens, negated) or self._fuzzy(tokens, negated)
+        if len(self._cache) >= CACHE_SIZE:
+            self._cache.clear()
+        self._cache[text] = match
+        return match
+
+    def matches(self, text: str) -> list[LexiconMatch]:
+        """Every concept named exactly (and not negated) in `text`, in order, ancestors of others dropped."""
+        return self._exact_all(*tokenize_clauses(text))
+
+    def _exact_all(self, tokens: list[str], negated: set[int] = frozenset()) -> list[LexiconMatch]:
+        found: list[tuple[int, int, str]] = []  # (start, length, concept_id)
+        for start in range(len(tokens)):
+            if start in negated:
+                continue
+            node = self._trie
+            for end in range(start, len(tokens)):
+                node = node.get(tokens[end])
+                if node is None:
+                    break
+                for concept_id in node.get(None, ()):
+                    found.append((start, end + 1 - start, concept_id))
+        if not found:
+            return []
+
+        named = {concept_id for _, _, concept_id in found}
+        covered = {a for concept_id in named for a in self.ancestors(concept_id)}
+        result, seen = [], set()
+        # First mention first; the longest alias wins at the same position
+        for start, length, concept_id in sorted(found, key=lambda f: (f[0], -f[1])):
+            if concept_id in covered or concept_id in seen:
+                continue
+            seen.add(concept_id)
+            result.append(self._match(concept_id, " ".join(tokens[start:start + length]), 1.0, "exact"))
+        return result
+
+    def _exact(self, tokens: list[str], negated: set[int] = frozenset()) -> LexiconMatch | None:
+        found = self._exact_all(tokens, negated)
+        return found[0] if found else None
+
+    def _fuzzy(self, tokens: list[str], negated: set[int] = frozenset()) -> LexiconMatch | None:
+        best = None
+        for size in range(1, MAX_FUZZY_WINDOW + 1):
+            for start in range(len(tokens) - size + 1):
+                if negated.intersection(range(start, start + size)):
+                    continue
+                if GENERIC_WORDS.issuperset(tokens[start:start + size]):
+                    continue
+                window = " ".join(tokens[start:start + size])
+                if len(window) < MIN_FUZZY_CHARS:
+                    continue
+                grams = _trigrams(window)
+                shared = Counter()
+                for gram in grams:
+                    shared.update(self._trigram_index.get(gram, ()))
+                for i, count in shared.items():
+                    alias, concept_id, alias_grams = self._aliases[i]
+                    if abs(size - (alias.count(" ") + 1)) > 1:
+                        continue
+                    # Dice similarity of the two trigram sets
+                    score = 2 * count / (len(grams) + len(alias_grams))
+                    if score >= FUZZY_THRESHOLD and (best is None or score > best.score):
+                        best = self._match(concept_id, alias, score, "fuzzy")
+        return best
+
+    # ── Comparison ─────────────────────────────────────────────────────
+
+    def canonical(self, text: str) -> str:
+        """The canonical name of the concept `text` names, or `text` itself."""
+        match = self.lookup(text)
+        return match.name if match else text
+
+    def compare(self, a: str, b: str) -> str:
+        """"same" concept, "related" (same family), "different", or "unknown"."""
+        match_a, match_b = self.lookup(a), self.lookup(b)
+        if match_a is None or match_b is None:
+            return "unknown"
+        if match_a.concept_id == match_b.concept_id:
+            return "same"
+        if match_a.family == match_b.family:
+            return "related"
+        return "different"
+
+
+def reference_diagnosis(case_path: Path, case_data: dict) -> str | None:
+    """The diagnosis a case is known to have, if the case or its reference file says.
+
+    Read from the case's metadata.known_diagnosis, or from the
+    correct_diagnostic_direction of a `<case_NNN>_reference_only.json` next
+    to it.
+    """
+    known = (case_data.get("metadata") or {}).get("known_diagnosis")
+    if known:
+        return known
+    case_path = Path(case_path)
+    prefix = "_".join(case_path.stem.split("_")[:2])
+    reference_path = case_path.parent / f"{prefix}_reference_only.json"
+    if reference_path == case_path or not reference_path.exists():
+        return None
+    try:
+        reference = json.loads(reference_path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    return (reference.get("what_the_system_should_find") or {}).get("correct_diagnostic_direction")
+
+
+def reference_check(diagnosis: dict | None, reference: str | None) -> str | None:
+    """One summary line comparing the final diagnosis with the case's reference."""
+    if not reference or not diagnosis:
+        return None
+    primary = str(diagnosis.get("primary_diagnosis", ""))
+    lexicon = get_lexicon()
+    relation = lexicon.compare(primary, reference)
+    verdict = {
+        "same": "MATCH",
+        "related": "MATCH (same diagnosis family)",
+        "different": "MISS",
+        "unknown": "UNKNOWN (not in the diagnosis lexicon)",
+    }[relation]
+    return (
+        f"Reference check: {verdict} — {lexicon.canonical(primary)[:60]} "
+        f"vs reference {lexicon.canonical(reference)[:60]}"
+    )
+
+
+_lexicon: DiagnosisLexicon | None = None
+
+
+def get_lexicon() -> DiagnosisLexicon:
+    """The shared lexicon, loaded once per process (empty if the file is missing)."""
+    global _lexicon
+    if _lexicon is None:
+        try:
+            _lexicon = DiagnosisLexicon.load()
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"  [LEXICON] Could not load {LEXICON_PATH}: {e} — hypotheses compared as text")
+            _lexicon = DiagnosisLexicon([])
+    return _lexicon
@@ -0,0 +1,189 @@
+"""Hedged requests — cut the latency tail of slow model calls.
+
+Most specialist, observer-review and synthesis calls finish close to the
+median, but a few take several times longer (long thinking, a slow
+replica). With a Hedger, a call that is still running after the stage's
+usual latency (a percentile of its recent history) gets a duplicate
+request. Whichever attempt first returns a valid parsed response wins and
+the other is cancelled.
+
+Callers wrap the request *and* its parsing in an attempt function, so a
+response that fails to parse does not win:
+
+    async def _attempt(client):
+        async with client.messages.stream(...) as stream:
+            response = await stream.get_final_message()
+        return extract_json(...)
+
+    parsed = await hedged(hedger, "specialist", client, _attempt)
+
+Latencies persist in shared/latency_history.json, so the thresholds carry
+over between runs. Every attempt is metered separately; the loser's tokens
+are reported as the extra spend of hedging (see Hedger.summary).
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+from orchestrator.metering import MeteredClient
+
+LATENCY_PATH = Path(__file__).resolve().parent.parent / "shared" / "latency_history.json"
+
+HISTORY_SIZE = 50  # Latencies kept per stage
+MIN_SAMPLES = 5  # No hedging until a stage has this many
+
+
+class LatencyHistory:
+    """Recent call latencies per stage, persisted between runs."""
+
+    def __init__(self, path: Path | None = LATENCY_PATH):
+        self.path = path
+        self.samples: dict[str, list[float]] = {}
+        self._load()
+
+    def record(self, stage: str, seconds: float):
+        samples = self.samples.setdefault(stage, [])
+        samples.append(round(seconds, 2))
+        del samples[:-HISTORY_SIZE]
+        self._save()
+
+    def percentile(self, stage: str, q: float, min_samples: int = MIN_SAMPLES) -> float | None:
+        """The q-quantile (0-1) of the stage's latencies, or None with too few samples."""
+        samples = sorted(self.samples.get(stage, []))
+        if len(samples) < min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def _load(self):
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return
+        self.samples = {
+            stage: [float(s) for s in samples][-HISTORY_SIZE:]
+            for stage, samples in data.items()
+            if isinstance(samples, list)
+        }
+
+    def _save(self):
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self.samples, indent=2))
+        except OSError:
+            pass  # History is best-effort; hedging still works from memory
+
+
+class Hedger:
+    def __init__(
+        self,
+        percentile: float = 0.9,
+        min_samples: int = MIN_SAMPLES,
+        history: LatencyHistory | None = None,
+    ):
+        """
+        Args:
+            percentile: A call is hedged once it has run longer than this
+                quantile of its stage's recent latencies.
+            min_samples: Latencies a stage needs before it is hedged.
+            history: Latency history (default: shared/latency_history.json).
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.history = history or LatencyHistory()
+        self.stats: dict[str, dict] = {}
+
+    async def run(self, stage: str, client, attempt):
+        """Run `attempt(client)`, hedging it if it outlasts the stage's threshold."""
+        stats = self.stats.setdefault(stage, {
+            "calls": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "extra_tokens": 0,
+            "extra_cost_usd": 0.0,
+        })
+        stats["calls"] += 1
+        threshold = self.history.percentile(stage, self.percentile, self.min_samples)
+
+        usage: list[list] = [[], []]  # UsageRecords per attempt
+        started: list[float] = []
+
+        async def _attempt(i: int):
+            started.append(time.monotonic())
+            result = await attempt(MeteredClient(client, usage[i].append))
+            self.history.record(stage, time.monotonic() - started[i])
+            return result
+
+        primary = asyncio.ensure_future(_attempt(0))
+        if threshold is None:
+            return await primary
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=threshold)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        if done:
+            return primary.result()
+
+        print(
+            f"  [HEDGE] {stage}: no response after {threshold:.0f}s "
+            f"(p{self.percentile * 100:.0f}) — sending a duplicate request"
+        )
+        stats["hedged"] += 1
+        attempts = [primary, asyncio.ensure_future(_attempt(1))]
+        pending = set(attempts)
+        winner = None
+        errors = []
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        winner = task
+                        break
+                    errors.append(task.exception())
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if winner is None:
+            raise errors[0]
+
+        loser = 1 - attempts.index(winner)
+        if attempts[loser].cancelled():
+            # Cancelled before finishing: its latency is at least this long
+            self.history.record(stage, time.monotonic() - started[loser])
+        if loser == 0:
+            stats["hedge_wins"] += 1
+        stats["extra_tokens"] += sum(r.total_tokens for r in usage[loser])
+        stats["extra_cost_usd"] += sum(r.cost_usd for r in usage[loser])
+        print(f"  [HEDGE] {stage}: {'duplicate' if loser == 0 else 'original'} request won")
+        return winner.result()
+
+    def summary(self) -> str:
+        calls = sum(s["calls"] for s in self.stats.values())
+        hedged = sum(s["hedged"] for s in self.stats.values())
+        wins = sum(s["hedge_wins"] for s in self.stats.values())
+        tokens = sum(s["extra_tokens"] for s in self.stats.values())
+        cost = sum(s["extra_cost_usd"] for s in self.stats.values())
+        per_stage = ", ".join(
+            f"{stage} {s['hedged']}/{s['calls']}" for stage, s in sorted(self.stats.items())
+        )
+        return (
+            f"Hedging (p{self.percentile * 100:.0f}): {hedged}/{calls} calls hedged, "
+            f"{wins} won by the duplicate, extra spend {tokens:,} tokens (${cost:.2f})"
+            + (f" — {per_stage}" if per_stage else "")
+        )
+
+
+async def hedged(hedger: Hedger | None, stage: str, client, attempt):
+    """Hedger.run(), or a single plain attempt when there is no hedger."""
+    if hedger is None:
+        return await attempt(client)
+    return await hedger.run(stage, client, attempt)
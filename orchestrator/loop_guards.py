@@ -3,12 +3,15 @@
 import time
 from dataclasses import dataclass, field
 
+from orchestrator.metering import UsageRecord
+
 
 @dataclass
 class GuardResult:
     should_force_complete: bool
     reason: str = ""
     should_force_synthesis: bool = False
+    should_auto_synthesize: bool = False  # Run synthesis now, without asking the Observer
 
 
 class LoopGuards:
@@ -19,12 +22,28 @@ class LoopGuards:
         max_tool_calls: int = 20,
         max_iterations: int = 25,
         timeout_seconds: int = 1200,  # 20 minutes
+        synthesis_reserve_seconds: int = 180,
+        max_total_tokens: int | None = None,
+        max_cost_usd: float | None = None,
+        synthesis_budget_fraction: float = 0.8,
+        auto_synthesis_convergence: float | None = None,
     ):
         self.max_rounds = max_rounds
         self.max_specialist_calls = max_specialist_calls
         self.max_tool_calls = max_tool_calls
         self.max_iterations = max_iterations
         self.timeout_seconds = timeout_seconds
+        # The last stretch of the timeout is kept for synthesis (see deadline.py)
+        self.synthesis_reserve_seconds = synthesis_reserve_seconds
+        # Token/dollar budgets (None = unlimited). Past the fraction, force
+        # synthesis so it still fits; past the full budget, force completion.
+        self.max_total_tokens = max_total_tokens
+        self.max_cost_usd = max_cost_usd
+        self.synthesis_budget_fraction = synthesis_budget_fraction
+        # Convergence score (see orchestrator.convergence) at or above which a
+        # "converged" round naming a single concept triggers synthesis directly
+        # (None = off)
+        self.auto_synthesis_convergence = auto_synthesis_convergence
 
         self.start_time = time.time()
         self.specialist_calls = 0
@@ -34,6 +53,51 @@ class LoopGuards:
         self.synthesis_triggered = False
         self.translation_triggered = False
         self.amendments_triggered = False
+        self.convergence: dict | None = None  # Latest review_round's report
+        # Repeated call_specialist calls: served from the memo, held as
+        # near-duplicates, or forced to run again (see ToolHandler)
+        self.duplicate_calls = {"served": 0, "held": 0, "forced": 0}
+
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_write_tokens = 0
+        self.cache_read_tokens = 0
+        self.thinking_tokens = 0
+        self.cost_usd = 0.0
+        self.cost_by_model: dict[str, float] = {}
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens + self.cache_write_tokens + self.cache_read_tokens
+
+    def record_usage(self, record: UsageRecord):
+        """Add one model response's usage (see orchestrator.metering.MeteredClient)."""
+        self.input_tokens += record.input_tokens
+        self.output_tokens += record.output_tokens
+        self.cache_write_tokens += record.cache_write_tokens
+        self.cache_read_tokens += record.cache_read_tokens
+        self.thinking_tokens += record.thinking_tokens
+        self.cost_usd += record.cost_usd
+        self.cost_by_model[record.model] = self.cost_by_model.get(record.model, 0.0) + record.cost_usd
+
+    def record_convergence(self, report):
+        """Keep the latest review_round's ConvergenceReport for the auto-synthesis policy."""
+        self.convergence = report.to_dict()
+
+    def record_duplicate(self, kind: str):
+        """Count a repeated specialist call; one that made no model call is refunded."""
+        self.duplicate_calls[kind] = self.duplicate_calls.get(kind, 0) + 1
+        if kind in ("served", "held"):
+            self.specialist_calls = max(0, self.specialist_calls - 1)
+
+    def budget_used(self) -> float:
+        """Fraction of the tightest token/dollar budget spent (0.0 if none is set)."""
+        used = 0.0
+        if self.max_total_tokens:
+            used = max(used, self.total_tokens / self.max_total_tokens)
+        if self.max_cost_usd:
+            used = max(used, self.cost_usd / self.max_cost_usd)
+        return used
 
     def record_tool_call(self, tool_name: str, tool_input: dict = None):
         """Record a tool call and update counters."""
@@ -43,6 +107,12 @@ class LoopGuards:
             if tool_input:
                 round_num = tool_input.get("round", 1)
                 self.highest_round = max(self.highest_round, round_num)
+        elif tool_name == "run_round":
+            if tool_input:
+                # Each specialist runs once per round (repeats in the list are skipped)
+                self.specialist_calls += len({s.get("specialist_type") for s in tool_input.get("specialists") or []})
+                round_num = tool_input.get("round", 1)
+                self.highest_round = max(self.highest_round, round_num)
         elif tool_name == "trigger_synthesis":
             self.synthesis_triggered = True
         elif tool_name == "trigger_translation":
@@ -61,6 +131,14 @@ class LoopGuards:
                 reason=f"Timeout: {elapsed:.0f}s elapsed (limit: {self.timeout_seconds}s)",
             )
 
+        # Token/dollar budget exhausted
+        budget_used = self.budget_used()
+        if budget_used >= 1.0:
+            return GuardResult(
+                should_force_complete=True,
+                reason=f"Budget exhausted: {self._budget_status()}",
+            )
+
         # Max tool calls — force immediate completion
         if self.tool_calls >= self.max_tool_calls:
             return GuardResult(
@@ -91,6 +169,40 @@ class LoopGuards:
                 reason=f"Max debate rounds reached: {self.highest_round}/{self.max_rounds}. Synthesize now.",
             )
 
+        # Into the time reserved for synthesis — synthesize now
+        if elapsed > self.timeout_seconds - self.synthesis_reserve_seconds and not self.synthesis_triggered:
+            return GuardResult(
+                should_force_complete=False,
+                should_force_synthesis=True,
+                reason=f"{self.timeout_seconds - elapsed:.0f}s left before timeout. Synthesize now.",
+            )
+
+        # Most of the budget spent — force synthesis while it still fits
+        if budget_used >= self.synthesis_budget_fraction and not self.synthesis_triggered:
+            return GuardResult(
+                should_force_complete=False,
+                should_force_synthesis=True,
+                reason=f"{budget_used:.0%} of budget spent ({self._budget_status()}). Synthesize now.",
+            )
+
+        # Debate has converged — synthesize without another Observer turn
+        if (
+            self.auto_synthesis_convergence is not None
+            and not self.synthesis_triggered
+            and self.convergence
+            and self.convergence["verdict"] == "converged"
+            and self.convergence.get("same_concept", True)
+            and self.convergence["score"] >= self.auto_synthesis_convergence
+        ):
+            return GuardResult(
+                should_force_complete=False,
+                should_auto_synthesize=True,
+                reason=(
+                    f"Round {self.convergence['round_number']} converged "
+                    f"(score {self.convergence['score']:.2f} >= {self.auto_synthesis_convergence:.2f})"
+                ),
+            )
+
         # Post-synthesis: if synthesis + translation + amendments all done, nudge toward complete
         if self.synthesis_triggered and self.translation_triggered and self.amendments_triggered:
             return GuardResult(
@@ -100,6 +212,27 @@ class LoopGuards:
 
         return GuardResult(should_force_complete=False)
 
+    # Counters restored on resume; the elapsed time is saved alongside and
+    # carried over, so the time between the kill and the resume is not spent
+    _STATE_FIELDS = (
+        "specialist_calls", "tool_calls", "iterations", "highest_round",
+        "synthesis_triggered", "translation_triggered", "amendments_triggered", "convergence",
+        "duplicate_calls",
+        "input_tokens", "output_tokens", "cache_write_tokens", "cache_read_tokens",
+        "thinking_tokens", "cost_usd", "cost_by_model",
+    )
+
+    def state_dict(self) -> dict:
+        state = {name: getattr(self, name) for name in self._STATE_FIELDS}
+        state["elapsed_seconds"] = round(self.elapsed_seconds(), 1)
+        return state
+
+    def load_state_dict(self, state: dict):
+        for name in self._STATE_FIELDS:
+            if name in state:
+                setattr(self, name, state[name])
+        self.start_time -= state.get("elapsed_seconds", 0.0)
+
     def increment_iteration(self):
         self.iterations += 1
 
@@ -107,10 +240,32 @@ class LoopGuards:
         return time.time() - self.start_time
 
     def summary(self) -> str:
+        duplicates = ""
+        if any(self.duplicate_calls.values()):
+            d = self.duplicate_calls
+            duplicates = f" ({d['served']} repeat(s) served, {d['held']} held, {d['forced']} forced)"
         return (
             f"Iterations: {self.iterations}/{self.max_iterations} | "
-            f"Specialist calls: {self.specialist_calls}/{self.max_specialist_calls} | "
+            f"Specialist calls: {self.specialist_calls}/{self.max_specialist_calls}{duplicates} | "
             f"Tool calls: {self.tool_calls}/{self.max_tool_calls} | "
             f"Rounds: {self.highest_round}/{self.max_rounds} | "
-            f"Elapsed: {self.elapsed_seconds():.0f}s/{self.timeout_seconds}s"
+            f"Elapsed: {self.elapsed_seconds():.0f}s/{self.timeout_seconds}s | "
+            f"{self._budget_status()}"
+        )
+
+    def _budget_status(self) -> str:
+        tokens = f"Tokens: {self.total_tokens:,}"
+        if self.max_total_tokens:
+            tokens += f"/{self.max_total_tokens:,} ({max(0, self.max_total_tokens - self.total_tokens):,} left)"
+        cost = f"Cost: ${self.cost_usd:.2f}"
+        if self.max_cost_usd:
+            cost += f"/${self.max_cost_usd:.2f} (${max(0.0, self.max_cost_usd - self.cost_usd):.2f} left)"
+        return f"{tokens} | {cost}"
+
+    def usage_summary(self) -> str:
+        by_model = ", ".join(f"{m} ${c:.2f}" for m, c in sorted(self.cost_by_model.items()))
+        return (
+            f"Usage: {self.input_tokens:,} input / {self.output_tokens:,} output "
+            f"(~{self.thinking_tokens:,} thinking) / {self.cache_write_tokens:,} cache write / "
+            f"{self.cache_read_tokens:,} cache read tokens | ${self.cost_usd:.2f} ({by_model or 'no calls'})"
         )
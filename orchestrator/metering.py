@@ -0,0 +1,135 @@
+"""Metering — token and dollar accounting for every model call in a run.
+
+MeteredClient wraps an AsyncAnthropic client and reports the usage of each
+response (from messages.create or messages.stream) to a callback, so the
+Observer loop and every caller that receives the client are metered without
+changing their code. LoopGuards.record_usage is the usual callback.
+"""
+
+from dataclasses import dataclass
+
+from orchestrator.token_estimator import get_estimator
+
+
+@dataclass(frozen=True)
+class ModelPrice:
+    """USD per million tokens."""
+    input: float
+    output: float
+    cache_write: float
+    cache_read: float
+
+
+# Longest matching prefix wins; unknown models are priced as Opus
+PRICING = {
+    "claude-opus-4-6": ModelPrice(input=5.00, output=25.00, cache_write=6.25, cache_read=0.50),
+    "claude-opus-4-5": ModelPrice(input=5.00, output=25.00, cache_write=6.25, cache_read=0.50),
+    "claude-opus-4": ModelPrice(input=15.00, output=75.00, cache_write=18.75, cache_read=1.50),
+    "claude-sonnet-4": ModelPrice(input=3.00, output=15.00, cache_write=3.75, cache_read=0.30),
+    "claude-haiku-4": ModelPrice(input=1.00, output=5.00, cache_write=1.25, cache_read=0.10),
+}
+DEFAULT_PRICE = PRICING["claude-opus-4-6"]
+
+
+def price_for(model: str | None) -> ModelPrice:
+    matches = [prefix for prefix in PRICING if (model or "").startswith(prefix)]
+    return PRICING[max(matches, key=len)] if matches else DEFAULT_PRICE
+
+
+@dataclass
+class UsageRecord:
+    """Token counts of one response, and what they cost."""
+    model: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_write_tokens: int = 0
+    cache_read_tokens: int = 0
+    thinking_tokens: int = 0  # Estimated from the thinking text; billed as output
+    cost_usd: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens + self.cache_write_tokens + self.cache_read_tokens
+
+    @classmethod
+    def from_response(cls, model: str | None, response) -> "UsageRecord":
+        usage = getattr(response, "usage", None)
+        record = cls(
+            model=getattr(response, "model", None) or model or "unknown",
+            input_tokens=getattr(usage, "input_tokens", 0) or 0,
+            output_tokens=getattr(usage, "output_tokens", 0) or 0,
+            cache_write_tokens=getattr(usage, "cache_creation_input_tokens", 0) or 0,
+            cache_read_tokens=getattr(usage, "cache_read_input_tokens", 0) or 0,
+            thinking_tokens=_thinking_tokens(response),
+        )
+        price = price_for(model or record.model)
+        record.cost_usd = (
+            record.input_tokens * price.input
+            + record.output_tokens * price.output
+            + record.cache_write_tokens * price.cache_write
+            + record.cache_read_tokens * price.cache_read
+        ) / 1_000_000
+        return record
+
+
+def _thinking_tokens(response) -> int:
+    text = "".join(
+        getattr(block, "thinking", "") or ""
+        for block in getattr(response, "content", None) or []
+        if getattr(block, "type", "") == "thinking"
+    )
+    return get_estimator().estimate(text, "prose") if text else 0
+
+
+class MeteredClient:
+    """AsyncAnthropic proxy that reports every response's usage to `on_usage`.
+
+    `on_usage` is called with a UsageRecord. Streams are metered when their
+    context exits, from the final (or, if cancelled, partial) message
+    snapshot, so interrupted calls are still counted.
+    """
+
+    def __init__(self, client, on_usage):
+        self._client = client
+        self.messages = _MeteredMessages(client.messages, on_usage)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class _MeteredMessages:
+    def __init__(self, messages, on_usage):
+        self._messages = messages
+        self._on_usage = on_usage
+
+    async def create(self, **kwargs):
+        response = await self._messages.create(**kwargs)
+        self._on_usage(UsageRecord.from_response(kwargs.get("model"), response))
+        return response
+
+    def stream(self, **kwargs):
+        return _MeteredStream(self._messages.stream(**kwargs), kwargs.get("model"), self._on_usage)
+
+    def __getattr__(self, name):
+        return getattr(self._messages, name)
+
+
+class _MeteredStream:
+    def __init__(self, manager, model, on_usage):
+        self._manager = manager
+        self._model = model
+        self._on_usage = on_usage
+        self._stream = None
+
+    async def __aenter__(self):
+        self._stream = await self._manager.__aenter__()
+        return self._stream
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            snapshot = self._stream.current_message_snapshot
+        except Exception:
+            snapshot = None  # No message_start received — nothing was billed
+        if snapshot is not None:
+            self._on_usage(UsageRecord.from_response(self._model, snapshot))
+        return await self._manager.__aexit__(exc_type, exc, tb)
@@ -8,6 +8,8 @@ import json
 
 from anthropic import AsyncAnthropic
 
+from orchestrator.deadline import Deadline, limits, within
+from orchestrator.hedging import Hedger, hedged
 from orchestrator.utils import extract_json, THINKING_BUDGET
 
 
@@ -67,6 +69,8 @@ async def call_observer(
     case_data: dict,
     round_num: int = 1,
     prior_observer: dict | None = None,
+    deadline: Deadline | None = None,
+    hedger: Hedger | None = None,
 ) -> dict:
     """Call the Metacognitive Observer on specialist outputs for any round."""
     print(f"  ⏳ Launching Metacognitive Observer (Round {round_num})...")
@@ -100,20 +104,21 @@ async def call_observer(
         "Respond with ONLY the JSON object."
     )
 
-    async with client.messages.stream(
-        model=observer_def["model"],
-        max_tokens=16_000,
-        thinking={"type": "adaptive"},
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_message}],
-    ) as stream:
-        response = await stream.get_final_message()
-
-    text_content = "".join(
-        block.text for block in response.content if block.type == "text"
-    )
+    async def _attempt(client):
+        async with client.messages.stream(
+            model=observer_def["model"],
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_message}],
+            **limits(deadline, "observer_review", 16_000, {"type": "adaptive"}),
+        ) as stream:
+            response = await stream.get_final_message()
+
+        text_content = "".join(
+            block.text for block in response.content if block.type == "text"
+        )
+        return extract_json(text_content)
 
-    parsed = extract_json(text_content)
+    parsed = await within(deadline, "observer_review", hedged(hedger, "observer_review", client, _attempt))
     n_biases = len(parsed.get("biases_detected", []))
     print(f"  ✅ Observer complete — {n_biases} bias(es) detected")
     return parsed
@@ -15,11 +15,34 @@ import sys
 from pathlib import Path
 
 from anthropic import AsyncAnthropic
+from anthropic.types import ToolUseBlock
 
-from orchestrator.tools import TOOL_DEFINITIONS, ToolHandler
+from orchestrator.tools import (
+    CONCURRENT_TOOLS,
+    DEFAULT_SPECULATIVE_ROSTER,
+    TOOL_DEFINITIONS,
+    ToolHandler,
+)
+from orchestrator.deadline import Deadline, DeadlineExceeded, limits, within
 from orchestrator.loop_guards import LoopGuards
-from orchestrator.context_manager import ContextManager
+from orchestrator.metering import MeteredClient
+from orchestrator.resilience import ResilientClient
+from orchestrator.scheduler import ScheduledClient
+from orchestrator.checkpoint import RunCheckpoint
+from orchestrator.context_manager import ContextManager, to_plain_content
+from orchestrator.diagnosis_lexicon import reference_check, reference_diagnosis
 from orchestrator.progress_reporter import ProgressReporter
+from orchestrator.quorum import QuorumPolicy
+from orchestrator.hedging import Hedger
+from orchestrator.peer_context import DEFAULT_TOKEN_CAP as DEFAULT_PEER_CONTEXT_TOKENS
+from orchestrator.token_estimator import get_estimator
+from orchestrator.triage import log_triage, triage
+from orchestrator.prompt_cache import (
+    CacheStats,
+    cached_system,
+    cached_tools,
+    with_message_breakpoints,
+)
 from orchestrator.utils import (
     load_case,
     load_constitution,
@@ -32,6 +55,13 @@ from orchestrator.utils import (
 )
 
 
+# The Observer sees a preview of the full records; specialists get them whole
+OBSERVER_RECORDS_TOKENS = 12_500
+
+# Consecutive failed Observer turns (each already retried) before giving up
+MAX_OBSERVER_FAILURES = 3
+
+
 # ── Observer-Orchestrator System Prompt ────────────────────────────────────
 
 def _build_observer_orchestrator_prompt(
@@ -124,13 +154,13 @@ Follow this protocol for every case:
 3. Formulate specific focus instructions for each specialist — tell them exactly what aspects of the case require their domain expertise.
 
 ### Phase 2: Debate Rounds
-4. Call your selected specialists for Round 1 (independent analysis).
-5. After all Round 1 specialists complete, use `review_round` to see their outputs.
+4. Run Round 1 (independent analysis) with `run_round`, listing your selected specialists and their focus instructions. It calls them concurrently and returns the round's review in one step. (`call_specialist` + `review_round` do the same one specialist at a time, e.g. to add a specialist to a round.)
+5. Read the review of the Round 1 outputs.
 6. In your response after reviewing, provide your bias analysis — identify cognitive biases, reasoning quality issues, and whether the differential is broad enough.
 7. Decide: Is another round needed?
    - **YES** if: significant biases detected, narrow differentials, low confidence, important conditions not considered
    - **NO** if: good convergence, broad differentials considered, high evidence quality
-8. If YES: Call specialists for Round 2+ with focus instructions that address the biases you detected.
+8. If YES: `run_round` for Round 2+ with focus instructions that address the biases you detected.
 9. Review again. Repeat up to 4 rounds maximum.
 
 ### Phase 3: Synthesis & Completion
@@ -157,17 +187,305 @@ Follow this protocol for every case:
 Think carefully about the diagnostic strategy. The quality of the institution's diagnosis depends on YOUR orchestration decisions."""
 
 
+# ── Tool Execution ────────────────────────────────────────────────────────
+
+async def _execute_tool_calls(
+    tool_use_blocks: list,
+    tool_handler: ToolHandler,
+    guards: LoopGuards,
+    concurrent: bool = True,
+    turn_state: dict | None = None,
+    on_progress=None,
+    started: dict[str, asyncio.Task] | None = None,
+) -> tuple[list[dict], bool]:
+    """Execute the tool_use blocks from one Observer response.
+
+    Consecutive calls to tools in CONCURRENT_TOOLS (e.g. all `call_specialist`
+    blocks for a round) are fanned out with asyncio.gather, so a round takes
+    the slowest specialist's latency instead of the sum. Any other tool acts
+    as a barrier: the pending batch finishes first, then the tool runs on its
+    own, which keeps synthesis → translation → complete strictly ordered.
+
+    Calls are recorded in the guards in emission order, and the returned
+    tool_result list matches the order of tool_use_blocks.
+
+    `turn_state` ({"recorded": [ids], "results": {id: result}}) tracks the
+    turn's progress for checkpoints: calls already in it are neither
+    re-recorded nor re-run, which is how a resumed run finishes a turn that
+    was interrupted. `on_progress` is called after each call completes.
+
+    `started` maps tool_use ids to tasks that were dispatched while the
+    Observer was still streaming (see _stream_observer_turn); those calls
+    are awaited instead of being run again.
+
+    With a quorum policy on the tool handler, a concurrent batch returns
+    once its quorum is in: calls still running get a "still running" tool
+    result and report back later through tool_handler.take_late_results().
+
+    Returns:
+        (tool_results, pipeline_complete)
+    """
+    if turn_state is None:
+        turn_state = {"recorded": [], "results": {}}
+    started = started or {}
+    done = turn_state["results"]
+    results: list[str | None] = [done.get(block.id) for block in tool_use_blocks]
+    batch: list[int] = []  # indices of the pending concurrent batch
+
+    async def _call(i: int) -> str:
+        block = tool_use_blocks[i]
+        task = started.pop(block.id, None)
+        if task is not None:
+            return await task
+        return await tool_handler.handle(block.name, block.input)
+
+    def _store(i: int, result):
+        block = tool_use_blocks[i]
+        results[i] = result if isinstance(result, str) else f"ERROR in {block.name}: {result!r}"
+        done[block.id] = results[i]
+        if on_progress is not None:
+            on_progress(f"tool:{block.name}")
+
+    async def _run(i: int):
+        _store(i, await _call(i))
+
+    async def _flush_batch():
+        if not batch:
+            return
+        if len(batch) > 1:
+            names = ", ".join(tool_use_blocks[i].input.get("specialist_type", tool_use_blocks[i].name) for i in batch)
+            print(f"  [Tool] Running {len(batch)} calls concurrently: {names}")
+        if tool_handler.quorum is None or len(batch) < 2:
+            await asyncio.gather(*(_run(i) for i in batch))
+        else:
+            keys = {}  # readable key per call, e.g. "neurologist"
+            for i in batch:
+                key = tool_use_blocks[i].input.get("specialist_type", tool_use_blocks[i].name)
+                keys[f"{key}#{i}" if key in keys else key] = i
+            inputs = {key: tool_use_blocks[i].input for key, i in keys.items()}
+            finished = await tool_handler.quorum_round(inputs).run({key: _call(i) for key, i in keys.items()})
+            for key, i in keys.items():
+                _store(i, finished[key] if key in finished else tool_handler.pending_result(inputs[key]))
+        batch.clear()
+
+    pipeline_complete = False
+    for i, block in enumerate(tool_use_blocks):
+        tool_name = block.name
+        tool_input = block.input
+        deferrable = concurrent and tool_name in CONCURRENT_TOOLS
+
+        if tool_name == "complete":
+            pipeline_complete = True
+
+        if block.id in done:
+            print(f"  [Tool] {tool_name} — restored from checkpoint")
+            continue
+
+        # Order-dependent tool: drain the pending batch before it runs
+        if not deferrable:
+            await _flush_batch()
+
+        print(f"  [Tool] {tool_name}({json.dumps(tool_input)[:200]})")
+
+        # Record in guards
+        if block.id not in turn_state["recorded"]:
+            guards.record_tool_call(tool_name, tool_input)
+            turn_state["recorded"].append(block.id)
+
+        if deferrable:
+            batch.append(i)
+            continue
+
+        await _run(i)
+
+    await _flush_batch()
+
+    tool_results = [
+        {
+            "type": "tool_result",
+            "tool_use_id": block.id,
+            "content": result,
+        }
+        for block, result in zip(tool_use_blocks, results)
+    ]
+    return tool_results, pipeline_complete
+
+
+async def _stream_observer_turn(
+    client,
+    request: dict,
+    tool_handler: ToolHandler,
+    progress: ProgressReporter,
+    dispatch_early: bool = True,
+):
+    """Stream one Observer turn, relaying it to the frontend as it arrives.
+
+    Text is emitted a paragraph at a time and each tool call is announced
+    when its block starts. With `dispatch_early`, a call to a tool in
+    CONCURRENT_TOOLS starts as soon as its input is complete, so specialists
+    run while the Observer is still writing the rest of the turn. Dispatch
+    stops at the first other tool: everything after a barrier waits for
+    _execute_tool_calls, as before.
+
+    Returns:
+        (final message, {tool_use_id: task} for the calls already started)
+    """
+    started: dict[str, asyncio.Task] = {}
+    barrier = not dispatch_early
+    try:
+        async with client.messages.stream(**request) as stream:
+            async for event in stream:
+                if event.type == "text":
+                    progress.observer_text(event.text)
+                elif event.type == "content_block_start" and event.content_block.type == "tool_use":
+                    progress.flush_observer_text()
+                    progress.emit_observer_event(
+                        "tool_use_start", tool=event.content_block.name, id=event.content_block.id,
+                    )
+                elif event.type == "content_block_stop":
+                    block = event.content_block
+                    if block.type == "text":
+                        progress.flush_observer_text()
+                    elif block.type == "tool_use":
+                        if barrier or block.name not in CONCURRENT_TOOLS:
+                            barrier = True
+                            continue
+                        label = block.input.get("specialist_type", block.name)
+                        print(f"  [Tool] {block.name}({label}) dispatched while the Observer streams")
+                        started[block.id] = asyncio.create_task(tool_handler.handle(block.name, block.input))
+            response = await stream.get_final_message()
+    except BaseException:
+        # The turn will be retried or abandoned, so its early calls must stop too
+        for task in started.values():
+            task.cancel()
+        raise
+    finally:
+        progress.flush_observer_text()
+    return response, started
+
+
 # ── Main Agentic Loop ─────────────────────────────────────────────────────
 
-async def run_observer_orchestrator(case_path: Path):
+_NUDGE = (
+    "You ended your turn without calling any tools. "
+    "Please continue the diagnostic pipeline by calling the appropriate tool. "
+    "If you haven't started yet, call `run_round` for Round 1 with your selected specialists. "
+    "If debate rounds are done, call `trigger_synthesis`. "
+    "If everything is done, call `complete`."
+)
+
+# turn_state id of the Round 1 that local triage runs before the first turn
+_FAST_PATH_ID = "local_triage_round_1"
+
+
+def _with_late_results(content, tool_handler: ToolHandler):
+    """Append any specialist results that arrived after their batch's quorum."""
+    late = tool_handler.take_late_results()
+    if not late:
+        return content
+    if isinstance(content, str):
+        content = [{"type": "text", "text": content}]
+    return content + [{"type": "text", "text": text} for text in late]
+
+
+def _speculative_roster(team_topology: dict) -> list[str]:
+    """Most likely Round 1 team: the topology's active specialists, else the default."""
+    roster = [
+        s.get("agent") if isinstance(s, dict) else s
+        for s in team_topology.get("active_specialists", [])
+    ]
+    return [s for s in roster if s] or list(DEFAULT_SPECULATIVE_ROSTER)
+
+
+def _round_1_roster(tool_use_blocks: list) -> list[str]:
+    """Specialists the Observer called for Round 1 in one response."""
+    roster = []
+    for block in tool_use_blocks:
+        if block.name == "call_specialist" and block.input.get("round", 1) == 1:
+            roster.append(block.input.get("specialist_type"))
+        elif block.name == "run_round" and block.input.get("round", 1) == 1:
+            roster.extend(spec.get("specialist_type") for spec in block.input.get("specialists") or [])
+    return list(dict.fromkeys(s for s in roster if s))
+
+
+async def run_observer_orchestrator(
+    case_path: Path,
+    concurrent_tools: bool = True,
+    speculative_round_1: bool = False,
+    speculative_roster: list[str] | None = None,
+    prompt_layout: str = "standard",
+    max_total_tokens: int | None = None,
+    max_cost_usd: float | None = None,
+    resume_dir: Path | None = None,
+    quorum_size: int | None = None,
+    straggler_grace: float = 0.0,
+    hedge_percentile: float | None = None,
+    auto_synthesis_convergence: float | None = None,
+    peer_context_tokens: int | None = DEFAULT_PEER_CONTEXT_TOKENS,
+    specialist_sessions: bool = False,
+    local_triage: float | None = None,
+):
     """Run the Observer-as-Orchestrator agentic pipeline.
 
     The Observer receives tools and autonomously decides:
     - Which specialists to call
     - How many rounds to run
     - When to synthesize, translate, amend, and complete
+
+    Args:
+        case_path: Path to the case JSON file.
+        concurrent_tools: Fan out independent tool calls from the same
+            Observer response (see _execute_tool_calls). Set False to run
+            every tool call sequentially.
+        speculative_round_1: Start Round 1 specialists while the Observer is
+            still triaging, and reuse whichever ones it actually picks.
+        speculative_roster: Specialists to prefetch. Defaults to the
+            topology's active_specialists.
+        prompt_layout: Specialist prompt layout, "standard" or
+            "shared-prefix" (see orchestrator.specialist_caller).
+        max_total_tokens: Per-case token budget across every model call
+            (None = unlimited).
+        max_cost_usd: Per-case dollar budget across every model call
+            (None = unlimited).
+        resume_dir: Run directory (shared/runs/...) to resume from its last
+            checkpoint instead of starting a new run.
+        quorum_size: Let a batch of concurrent specialist calls return once
+            this many are done (None = wait for all); stragglers are
+            reported to the Observer as late results.
+        straggler_grace: Seconds to keep waiting for stragglers once the
+            quorum is reached.
+        hedge_percentile: Hedge specialist and synthesis calls that run
+            longer than this quantile of their recent latencies, e.g. 0.9
+            (None = no hedging; see orchestrator.hedging).
+        auto_synthesis_convergence: Run synthesis as soon as review_round
+            finds a converged round scoring at least this (0-1), instead of
+            waiting for the Observer to call it (None = off; see
+            orchestrator.convergence).
+        peer_context_tokens: Token cap for the digest of the prior round
+            given to Round 2+ specialists (None = every prior output as
+            full JSON; see orchestrator.peer_context).
+        specialist_sessions: Answer a specialist's Round 2+ calls as new
+            turns of its own earlier conversation, read from the prompt
+            cache, instead of fresh requests (see
+            orchestrator.specialist_session).
+        local_triage: Pick the Round 1 team from the case locally (see
+            orchestrator.triage); at or above this confidence (0-1), run
+            Round 1 with it before the Observer's first turn, so the
+            Observer starts from the review instead of triaging. Below it,
+            the Observer triages and its pick is compared with the local
+            one (None = off).
     """
-    client = AsyncAnthropic()
+    guards = LoopGuards(
+        max_total_tokens=max_total_tokens,
+        max_cost_usd=max_cost_usd,
+        auto_synthesis_convergence=auto_synthesis_convergence,
+    )
+    # Hard wall-clock budget for every model call, matching the guard timeout
+    deadline = Deadline(guards.timeout_seconds, synthesis_reserve=guards.synthesis_reserve_seconds)
+    # Every caller gets this client, so all usage lands in the guards, every
+    # request is admitted by the rate-limit scheduler and retried on its own
+    # (the SDK's retries are off)
+    client = ResilientClient(ScheduledClient(MeteredClient(AsyncAnthropic(max_retries=0), guards.record_usage)))
 
     # ── Setup ──────────────────────────────────────────────────────────
     print("\n" + "=" * 60)
@@ -177,7 +495,6 @@ async def run_observer_orchestrator(case_path: Path):
 
     # Initialize components
     progress = ProgressReporter(structured=True)
-    guards = LoopGuards()
     context_mgr = ContextManager()
 
     # Load case data
@@ -222,7 +539,15 @@ async def run_observer_orchestrator(case_path: Path):
         case_data=case_data,
     )
 
+    # The system prompt and tool list never change during a run, so both are
+    # sent with cache breakpoints; message breakpoints are re-applied on
+    # every request (see prompt_cache.with_message_breakpoints).
+    cached_system_prompt = cached_system(system_prompt)
+    cached_tool_definitions = cached_tools(TOOL_DEFINITIONS)
+    cache_stats = CacheStats()
+
     # ── Initialize tool handler ────────────────────────────────────────
+    hedger = Hedger(percentile=hedge_percentile) if hedge_percentile else None
     tool_handler = ToolHandler(
         client=client,
         case_data=case_data,
@@ -230,6 +555,14 @@ async def run_observer_orchestrator(case_path: Path):
         agent_defs=agent_defs,
         progress_reporter=progress,
         context_manager=context_mgr,
+        prompt_layout=prompt_layout,
+        deadline=deadline,
+        quorum=QuorumPolicy(quorum_size, straggler_grace) if quorum_size else None,
+        hedger=hedger,
+        on_convergence=guards.record_convergence,
+        on_duplicate=guards.record_duplicate,
+        peer_context_tokens=peer_context_tokens,
+        specialist_sessions=specialist_sessions,
     )
 
     # ── Build initial message with full case data ──────────────────────
@@ -247,29 +580,154 @@ async def run_observer_orchestrator(case_path: Path):
 
     if full_records:
         # Include records but cap for the Observer's context
-        records_preview = full_records[:50_000]
-        if len(full_records) > 50_000:
-            records_preview += f"\n\n[... {len(full_records) - 50_000:,} more characters in full records — specialists will receive the complete records ...]"
+        records_preview, truncated = get_estimator().truncate(full_records, OBSERVER_RECORDS_TOKENS)
+        if truncated:
+            records_preview += f"\n\n[... {len(full_records) - len(records_preview):,} more characters in full records — specialists will receive the complete records ...]"
         initial_message += (
             "## Full Medical Records\n\n"
             f"```\n{records_preview}\n```\n\n"
         )
 
-    initial_message += (
+    triage_request = (
         "Please triage this case:\n"
         "1. Identify the key clinical features and diagnostic puzzles\n"
         "2. Select 2-4 specialists and explain your team composition rationale\n"
         "3. Call each specialist with targeted focus instructions\n"
     )
 
-    messages = [{"role": "user", "content": initial_message}]
+    # ── Checkpointing ──────────────────────────────────────────────────
+    # The state is saved after every Observer turn and every completed tool
+    # call; `turn_state` holds the current turn's finished tool calls.
+    messages = []
+    turn_state = {"recorded": [], "results": {}}
+    if resume_dir is not None:
+        checkpoint = RunCheckpoint.load(resume_dir)
+        tool_handler.load_state_dict(checkpoint.get("tool_handler", {}))
+        guards.load_state_dict(checkpoint.get("guards", {}))
+        deadline.charge(checkpoint.get("guards", {}).get("elapsed_seconds", 0.0))
+        messages = checkpoint.get("messages", [])
+        turn_state = checkpoint.get("turn_state", turn_state)
+        context_mgr.ledger.reset(messages)
+    else:
+        checkpoint = RunCheckpoint.create("agentic", case_path, {
+            "concurrent_tools": concurrent_tools,
+            "speculative_round_1": speculative_round_1,
+            "speculative_roster": speculative_roster,
+            "prompt_layout": prompt_layout,
+            "max_total_tokens": max_total_tokens,
+            "max_cost_usd": max_cost_usd,
+            "quorum_size": quorum_size,
+            "straggler_grace": straggler_grace,
+            "hedge_percentile": hedge_percentile,
+            "auto_synthesis_convergence": auto_synthesis_convergence,
+            "peer_context_tokens": peer_context_tokens,
+            "specialist_sessions": specialist_sessions,
+            "local_triage": local_triage,
+        })
+
+    def _checkpoint(label: str, **extra):
+        checkpoint.save(
+            label,
+            tool_handler=tool_handler.state_dict(),
+            guards=guards.state_dict(),
+            messages=messages,
+            turn_state=turn_state,
+            **extra,
+        )
+
+    # ── Local triage ───────────────────────────────────────────────────
+    # A confident local pick runs Round 1 now and the Observer starts from
+    # its review; otherwise the Observer triages and the picks are compared
+    local_pick = None
+    fast_path = False
+    if local_triage is not None and not messages:
+        local_pick = triage(case_data, team_topology.get("available_specialists"))
+        for line in local_pick.lines():
+            print(f"  [TRIAGE] {line}")
+        fast_path = local_pick.confidence >= local_triage
+        if fast_path:
+            print(f"  [TRIAGE] Confidence >= {local_triage} — running Round 1 before the Observer's first turn")
+            round_input = {
+                "round": 1,
+                "specialists": [
+                    {"specialist_type": s, "focus_instructions": local_pick.focus(s)} for s in local_pick.roster
+                ],
+            }
+            # Tracked in turn_state like an Observer tool call, so a run
+            # interrupted during or after the round resumes without
+            # recounting it (or re-running it once it has finished)
+            if _FAST_PATH_ID not in turn_state["recorded"]:
+                guards.record_tool_call("run_round", round_input)
+                turn_state["recorded"].append(_FAST_PATH_ID)
+                _checkpoint("local_triage")
+            review = turn_state["results"].get(_FAST_PATH_ID)
+            if review is None:
+                review = await tool_handler.handle("run_round", round_input)
+                turn_state["results"][_FAST_PATH_ID] = review
+                _checkpoint("tool:run_round")
+                log_triage(case_id, local_pick, None, fast_path=True)
+            else:
+                print("  [Tool] run_round — restored from checkpoint")
+            triage_request = (
+                "## Local Triage (automated)\n"
+                f"The Round 1 team was picked from the case features by rule-based triage "
+                f"(confidence {local_pick.confidence:.2f}) and Round 1 has already run:\n\n"
+                f"{review}\n\n"
+                "Continue from Phase 2: give your bias analysis of Round 1 and decide "
+                "whether another round is needed. If the team misses a domain, add a "
+                "specialist to Round 1 with `call_specialist` or include it in Round 2.\n"
+            )
+        else:
+            print(f"  [TRIAGE] Confidence < {local_triage} — the Observer triages")
+
+    # ── Speculative Round 1 prefetch ───────────────────────────────────
+    # Started with the first message, which tells the Observer how to take
+    # the prefetched answers
+    speculation_pending = False
+    if speculative_round_1 and not messages and not fast_path:
+        roster = speculative_roster or (local_pick.roster if local_pick else _speculative_roster(team_topology))
+        launched = tool_handler.start_speculative_round_1(roster)
+        speculation_pending = True
+        if launched:
+            triage_request += (
+                "\n## Speculative Round 1\n"
+                f"Round 1 calls for {', '.join(launched)} are already running with a general "
+                "focus. To take one of these answers, call that specialist for Round 1 with "
+                'empty focus_instructions (""). With your own focus instructions it runs '
+                "fresh and the prefetched answer is discarded.\n"
+            )
+
+    if not messages:
+        context_mgr.append(messages, {"role": "user", "content": initial_message + triage_request})
+        turn_state = {"recorded": [], "results": {}}
+        _checkpoint("start")
+    triage_pending = local_pick is not None and not fast_path
 
     # ── Agentic Loop ──────────────────────────────────────────────────
     print("\n" + "─" * 60)
     print("  Observer-Orchestrator loop starting...")
     print("─" * 60 + "\n")
 
-    pipeline_complete = False
+    pipeline_complete = checkpoint.get("completed", False)
+    observer_failures = 0  # Consecutive Observer turns that failed after retries
+
+    # Resumed mid-turn: finish the Observer's last turn before asking for more
+    if not pipeline_complete and messages and messages[-1]["role"] == "assistant":
+        pending = [
+            ToolUseBlock.model_validate(b) for b in messages[-1]["content"]
+            if isinstance(b, dict) and b.get("type") == "tool_use"
+        ]
+        if pending:
+            print("  [CHECKPOINT] Finishing the interrupted Observer turn...")
+            tool_results, pipeline_complete = await _execute_tool_calls(
+                pending, tool_handler, guards, concurrent=concurrent_tools,
+                turn_state=turn_state, on_progress=_checkpoint,
+            )
+            context_mgr.append(messages, {"role": "user", "content": tool_results})
+        else:
+            context_mgr.append(messages, {"role": "user", "content": _NUDGE})
+        turn_state = {"recorded": [], "results": {}}
+        _checkpoint("turn_complete")
 
     while not pipeline_complete:
         guards.increment_iteration()
@@ -294,10 +752,26 @@ async def run_observer_orchestrator(case_path: Path):
             pipeline_complete = True
             break
 
+        if guard_result.should_auto_synthesize:
+            print(f"\n  [GUARD] Auto-synthesis: {guard_result.reason}")
+            guards.record_tool_call("trigger_synthesis")
+            synthesis_result = await tool_handler.handle("trigger_synthesis", {
+                "convergence_assessment": f"Auto-synthesis: {guard_result.reason}"
+            })
+            context_mgr.append(messages, {
+                "role": "user",
+                "content": (
+                    f"[SYSTEM] {guard_result.reason}, so synthesis was run automatically.\n\n"
+                    f"{synthesis_result}\n\n"
+                    "Now call `trigger_translation`, `trigger_amendments`, and `complete`."
+                ),
+            })
+            _checkpoint("auto_synthesis")
+
         if guard_result.should_force_synthesis:
             print(f"\n  [GUARD] Forcing synthesis: {guard_result.reason}")
             # Inject a system message telling the Observer to synthesize
-            messages.append({
+            context_mgr.append(messages, {
                 "role": "user",
                 "content": (
                     f"[SYSTEM] Budget limit reached: {guard_result.reason}\n"
@@ -306,37 +780,63 @@ async def run_observer_orchestrator(case_path: Path):
                 ),
             })
 
-        # ── Context compression ────────────────────────────────────────
-        if context_mgr.approaching_limit(messages):
+        # ── History hygiene and compression ────────────────────────────
+        # Old thinking is never needed again, but dropping it rewrites the
+        # cached prefix, so it only goes once the history nears its limit
+        # (where compaction would rewrite the prefix anyway). Compaction
+        # only runs if that was not enough.
+        if context_mgr.approaching_limit():
+            freed = context_mgr.prune_stale_thinking(messages)
+            if freed:
+                print(f"  [CONTEXT] Dropped stale thinking (~{freed:,} tokens)")
+        if context_mgr.approaching_limit():
             print("  [CONTEXT] Compressing conversation history...")
+            before = context_mgr.ledger.total
             messages = context_mgr.compress(messages)
+            print(
+                f"  [CONTEXT] ~{before:,} → ~{context_mgr.ledger.total:,} tokens "
+                f"({context_mgr.last_compaction.get('turns_evicted', 0)} turn(s) archived)"
+            )
 
         # ── Call the Observer-Orchestrator ──────────────────────────────
         print(f"  [Loop {guards.iterations}] Calling Observer-Orchestrator... ({guards.summary()})")
 
         try:
-            response = await client.messages.create(
-                model=observer_def.get("model", "claude-opus-4-6"),
-                max_tokens=16_000,
-                thinking={"type": "adaptive"},
-                system=system_prompt,
-                tools=TOOL_DEFINITIONS,
-                messages=messages,
-            )
+            response, started = await within(deadline, "observer", _stream_observer_turn(
+                client,
+                dict(
+                    model=observer_def.get("model", "claude-opus-4-6"),
+                    system=cached_system_prompt,
+                    tools=cached_tool_definitions,
+                    messages=with_message_breakpoints(messages),
+                    **limits(deadline, "observer", 16_000, {"type": "adaptive"}),
+                ),
+                tool_handler,
+                progress,
+                dispatch_early=concurrent_tools,
+            ))
+        except DeadlineExceeded as e:
+            # The guards force completion on the next check
+            print(f"\n  [DEADLINE] {e}")
+            continue
         except Exception as e:
+            # The client has already retried this call with backoff
             print(f"\n  [ERROR] API call failed: {type(e).__name__}: {e}")
-            if guards.iterations >= 3:
-                print("  [ERROR] Multiple failures — aborting pipeline.")
+            observer_failures += 1
+            if observer_failures >= MAX_OBSERVER_FAILURES:
+                print(f"  [ERROR] {observer_failures} Observer turns failed in a row — aborting pipeline.")
                 pipeline_complete = True
                 break
-            # Wait briefly and retry
-            await asyncio.sleep(2)
             continue
+        observer_failures = 0
 
         # ── Process response ───────────────────────────────────────────
+        print(f"  [CACHE] {cache_stats.record(response.usage)}")
+        context_mgr.record_usage(response.usage)
 
         # Append assistant message to conversation
-        messages.append({"role": "assistant", "content": response.content})
+        context_mgr.append(messages, {"role": "assistant", "content": to_plain_content(response.content)})
+        _checkpoint(f"observer_turn_{guards.iterations}")
 
         # Extract and print any text reasoning from the Observer
         for block in response.content:
@@ -356,50 +856,43 @@ async def run_observer_orchestrator(case_path: Path):
         ]
 
         if tool_use_blocks:
-            tool_results = []
-
-            for block in tool_use_blocks:
-                tool_name = block.name
-                tool_input = block.input
-
-                print(f"  [Tool] {tool_name}({json.dumps(tool_input)[:200]})")
-
-                # Record in guards
-                guards.record_tool_call(tool_name, tool_input)
-
-                # Execute the tool
-                result = await tool_handler.handle(tool_name, tool_input)
-
-                tool_results.append({
-                    "type": "tool_result",
-                    "tool_use_id": block.id,
-                    "content": result,
-                })
+            tool_results, pipeline_complete = await _execute_tool_calls(
+                tool_use_blocks, tool_handler, guards, concurrent=concurrent_tools,
+                turn_state=turn_state, on_progress=_checkpoint, started=started,
+            )
 
-                # Check for pipeline completion
-                if tool_name == "complete":
-                    pipeline_complete = True
+            # The first response that picks Round 1 specialists settles the
+            # speculation: anything the Observer did not choose is cancelled.
+            if speculation_pending and any(
+                b.name in ("call_specialist", "run_round") and b.input.get("round", 1) == 1
+                for b in tool_use_blocks
+            ):
+                tool_handler.settle_speculation()
+                speculation_pending = False
+
+            # Log how the Observer's own Round 1 pick compares to the local one
+            if triage_pending and _round_1_roster(tool_use_blocks):
+                picked = _round_1_roster(tool_use_blocks)
+                entry = log_triage(case_id, local_pick, picked, fast_path=False)
+                print(f"  [TRIAGE] Observer picked {', '.join(picked)} — {entry['agreement']:.0%} agreement with local triage")
+                triage_pending = False
 
             # Append tool results to conversation
-            messages.append({"role": "user", "content": tool_results})
+            context_mgr.append(messages, {"role": "user", "content": _with_late_results(tool_results, tool_handler)})
+            turn_state = {"recorded": [], "results": {}}
+            _checkpoint("turn_complete")
 
         elif response.stop_reason == "end_turn":
             # The Observer finished without calling any tools.
             # This might be a reasoning-only turn, or it might mean
             # the Observer is stuck. Nudge it to continue.
             print("  [Loop] Observer ended turn without tool calls — nudging...")
-            messages.append({
-                "role": "user",
-                "content": (
-                    "You ended your turn without calling any tools. "
-                    "Please continue the diagnostic pipeline by calling the appropriate tool. "
-                    "If you haven't started yet, call `call_specialist` for your selected specialists. "
-                    "If debate rounds are done, call `trigger_synthesis`. "
-                    "If everything is done, call `complete`."
-                ),
-            })
+            context_mgr.append(messages, {"role": "user", "content": _with_late_results(_NUDGE, tool_handler)})
+            _checkpoint("nudge")
 
     # ── Pipeline Complete ──────────────────────────────────────────────
+    await tool_handler.aclose()
+    _checkpoint("complete", completed=True)
     elapsed = guards.elapsed_seconds()
 
     print("\n" + "=" * 60)
@@ -407,6 +900,21 @@ async def run_observer_orchestrator(case_path: Path):
     print("=" * 60)
     print(f"  Duration: {elapsed:.0f}s ({elapsed/60:.1f} minutes)")
     print(f"  {guards.summary()}")
+    print(f"  {guards.usage_summary()}")
+    reference_line = reference_check(tool_handler.diagnosis, reference_diagnosis(case_path, case_data))
+    if reference_line:
+        print(f"  {reference_line}")
+    print(f"  {client.summary()}")
+    print(f"  {client.scheduler.summary()}")
+    print(f"  {cache_stats.summary()}")
+    print(f"  {context_mgr.hygiene_summary()}")
+    print(f"  {tool_handler.peer_context_stats.summary()}")
+    print(f"  {tool_handler.specialist_stats.summary()}")
+    print(f"  {get_estimator().summary()}")
+    if hedger is not None:
+        print(f"  {hedger.summary()}")
+    if speculative_round_1:
+        print(f"  {tool_handler.speculation_summary()}")
 
     if tool_handler.diagnosis:
         primary = tool_handler.diagnosis.get("primary_diagnosis", "N/A")
@@ -0,0 +1,335 @@
+"""Peer context — a compact digest of the prior round for Round 2+ specialists.
+
+Each Round 2+ specialist used to receive every peer's prior-round output,
+and every Observer report, as indented JSON. With n specialists that is n
+copies of n outputs per round, and it grows with every round.
+build_peer_context() sends a digest instead:
+
+- the specialist's own previous analysis, in full but without JSON framing
+- per peer: hypothesis and confidence, what changed since the peer's
+  previous round (hypothesis, confidence delta), and only the evidence that
+  is new to the reader (not already in its own evidence or shown for an
+  earlier peer) or that contradicts the reader's hypothesis
+- the Observer's findings as one line per bias, the reader's own first
+
+The digest is kept under a token cap: the per-peer item limit is lowered
+until it fits, then the text is cut. PeerContextStats reports the prompt
+tokens saved against the full JSON layout (full_peer_context()), which is
+still used with a cap of None.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+
+from orchestrator.convergence import tokenize
+from orchestrator.diagnosis_lexicon import get_lexicon
+from orchestrator.token_estimator import get_estimator
+
+DEFAULT_TOKEN_CAP = 4_000  # Per specialist prompt
+MAX_PEER_ITEMS = 4  # Evidence / contradiction items per peer before the cap trims
+MAX_ITEM_CHARS = 240
+NOVEL_OVERLAP = 0.5  # An item this similar to one the reader has seen is not new
+
+_NEGATION = re.compile(
+    r"(?i)\b(no|not|normal|absent|negative|unremarkable|rules? out|ruled out|against|"
+    r"inconsistent|unlikely|does not|doesn't|argues? against|atypical for)\b"
+)
+
+
+def _items(value) -> list[str]:
+    if isinstance(value, list):
+        return [str(v) for v in value]
+    return [str(value)] if value else []
+
+
+def _clip(text: str) -> str:
+    text = " ".join(str(text).split())
+    return text if len(text) <= MAX_ITEM_CHARS else text[:MAX_ITEM_CHARS - 1] + "…"
+
+
+def _display(name: str) -> str:
+    return name.replace("_", " ").title()
+
+
+def _jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a | b else 0.0
+
+
+def _confidence(output: dict) -> float | None:
+    value = output.get("confidence")
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+@dataclass
+class PeerContext:
+    text: str
+    tokens: int  # Estimated tokens of `text`
+    full_tokens: int  # Estimated tokens of the full JSON layout
+    truncated: bool = False
+
+    @property
+    def saved(self) -> int:
+        return max(0, self.full_tokens - self.tokens)
+
+
+def full_peer_context(
+    specialist: str,
+    rounds: dict[int, dict[str, dict]],
+    observer_analyses: dict[int, dict],
+    include_own: bool = True,
+) -> str:
+    """Every prior output and Observer report as indented JSON (the original layout).
+
+    Includes this specialist's own outputs from all prior rounds (unless
+    `include_own` is False, e.g. when they are already in its session), the
+    other specialists' outputs from the most recent one, and the Observer
+    analyses of all prior rounds.
+    """
+    prior_rounds = sorted(rounds)
+    if not prior_rounds:
+        return ""
+    parts = []
+
+    for r in prior_rounds if include_own else ():
+        own_output = rounds[r].get(specialist)
+        if own_output:
+            parts.append(
+                f"## Your Round {r} Analysis\n"
+                f"```json\n{json.dumps(own_output, indent=2)}\n```"
+            )
+
+    latest_prior = prior_rounds[-1]
+    other_outputs = {name: o for name, o in rounds[latest_prior].items() if name != specialist}
+    if other_outputs:
+        parts.append(f"## Other Specialists' Round {latest_prior} Analyses")
+        for name, output in other_outputs.items():
+            parts.append(
+                f"### {_display(name)}\n"
+                f"```json\n{json.dumps(output, indent=2)}\n```"
+            )
+
+    for r in prior_rounds:
+        obs = observer_analyses.get(r)
+        if obs:
+            title = "Bias Pre-screen (source: local heuristics, not the Observer)" if obs.get("source") == "local" else "Observer"
+            parts.append(
+                f"## {title} Round {r} Bias Report\n"
+                f"```json\n{json.dumps(obs, indent=2)}\n```"
+            )
+
+    return "\n\n".join(parts)
+
+
+def _own_section(round_num: int, own: dict) -> list[str]:
+    lines = [
+        f"## Your Round {round_num} Analysis",
+        f"- Hypothesis: {own.get('diagnosis_hypothesis', 'N/A')} (confidence {own.get('confidence', 'N/A')})",
+    ]
+    evidence = _items(own.get("key_evidence"))
+    if evidence:
+        lines.append("- Key evidence:")
+        lines.extend(f"  - {_clip(e)}" for e in evidence)
+    dissent = _items(own.get("dissenting_considerations"))
+    if dissent:
+        lines.append("- Dissenting considerations:")
+        lines.extend(f"  - {_clip(d)}" for d in dissent)
+    if own.get("bias_acknowledgment"):
+        lines.append(f"- Bias acknowledgment: {_clip(own['bias_acknowledgment'])}")
+    return lines
+
+
+def _peer_section(
+    name: str,
+    output: dict,
+    previous: dict | None,
+    own: dict,
+    seen: list[set],
+    limit: int,
+) -> list[str]:
+    """Digest of one peer; appends the evidence it shows to `seen`."""
+    lexicon = get_lexicon()
+    hypothesis = str(output.get("diagnosis_hypothesis", "N/A"))
+    confidence = _confidence(output)
+    header = f"### {_display(name)} — {_clip(hypothesis)}"
+    if confidence is not None:
+        header += f", confidence {confidence:.2f}"
+
+    change = []
+    if isinstance(previous, dict) and previous.get("diagnosis_hypothesis"):
+        before = str(previous["diagnosis_hypothesis"])
+        relation = lexicon.compare(hypothesis, before)
+        if relation == "same" or (relation == "unknown" and before.strip().lower() == hypothesis.strip().lower()):
+            change.append("hypothesis unchanged")
+        else:
+            change.append(f"changed from \"{_clip(before)[:80]}\"")
+        before_confidence = _confidence(previous)
+        if confidence is not None and before_confidence is not None and abs(confidence - before_confidence) >= 0.05:
+            change.append(f"confidence {before_confidence:.2f} → {confidence:.2f}")
+
+    own_hypothesis = str(own.get("diagnosis_hypothesis", ""))
+    own_evidence = [set(tokenize(e)) for e in _items(own.get("key_evidence"))]
+    previous_evidence = [set(tokenize(e)) for e in _items((previous or {}).get("key_evidence"))]
+
+    def _contradicts(text: str) -> bool:
+        if not own_hypothesis or not _NEGATION.search(text):
+            return False
+        if any(lexicon.compare(m.name, own_hypothesis) in ("same", "related") for m in lexicon.matches(text)):
+            return True
+        tokens = set(tokenize(text))
+        return len(tokens & set(tokenize(own_hypothesis))) >= 2
+
+    new, contra = [], []
+    for item in _items(output.get("key_evidence")):
+        tokens = set(tokenize(item))
+        if _contradicts(item):
+            contra.append(item)
+        elif all(_jaccard(tokens, s) < NOVEL_OVERLAP for s in own_evidence + seen):
+            marker = " (new this round)" if previous_evidence and all(
+                _jaccard(tokens, s) < NOVEL_OVERLAP for s in previous_evidence
+            ) else ""
+            new.append(item + marker)
+        else:
+            continue
+        seen.append(tokens)
+    contra.extend(d for d in _items(output.get("dissenting_considerations")) if _contradicts(d))
+
+    lines = [header]
+    if change:
+        lines.append(f"- Since the previous round: {'; '.join(change)}")
+    if new[:limit]:
+        lines.append("- Evidence you have not cited:")
+        lines.extend(f"  - {_clip(e)}" for e in new[:limit])
+        if len(new) > limit:
+            lines.append(f"  - (+{len(new) - limit} more)")
+    if contra[:limit]:
+        lines.append("- Contradicts your hypothesis:")
+        lines.extend(f"  - {_clip(c)}" for c in contra[:limit])
+    if not new and not contra:
+        lines.append("- No evidence beyond what you already cite")
+    return lines
+
+
+def _observer_section(specialist: str, round_num: int, analysis: dict, limit: int) -> list[str]:
+    if analysis.get("source") == "local":
+        # Stood in for a skipped Observer call (see orchestrator.bias_prescreen)
+        lines = [f"## Round {round_num} Bias Pre-screen (source: local heuristics, not the Observer)"]
+    else:
+        lines = [f"## Observer Round {round_num} Findings"]
+    quality = analysis.get("reasoning_quality") or {}
+    if quality:
+        lines.append("- Reasoning quality: " + ", ".join(
+            f"{k.replace('_score', '').replace('_', ' ')} {v}" for k, v in quality.items()
+        ))
+    biases = [b for b in analysis.get("biases_detected") or [] if isinstance(b, dict)]
+    # The reader's own biases first, then the team's, then other specialists'
+    own_key = specialist.replace("_", " ").lower()
+
+    def _rank(bias):
+        agent = str(bias.get("agent", "")).replace("_", " ").lower()
+        return 0 if agent == own_key else 1 if agent in ("team", "all", "") else 2
+
+    biases.sort(key=_rank)
+    shown = [b for b in biases if _rank(b) < 2] + [b for b in biases if _rank(b) == 2][:limit]
+    for bias in shown:
+        line = (
+            f"- {str(bias.get('severity', '')).upper()} {bias.get('bias_type', 'bias')} "
+            f"({bias.get('agent', 'team')}): {_clip(bias.get('evidence', ''))}"
+        )
+        if bias.get("recommendation"):
+            line += f" → {_clip(bias['recommendation'])}"
+        lines.append(line)
+    if len(shown) < len(biases):
+        lines.append(f"- (+{len(biases) - len(shown)} finding(s) about other specialists)")
+    if analysis.get("interrupt_recommended"):
+        lines.append(f"- Interrupt recommended: {_clip(analysis.get('interrupt_reason', ''))}")
+    for key in ("convergence_assessment", "process_observations", "note"):
+        if analysis.get(key) and not biases:
+            lines.append(f"- {key.replace('_', ' ').capitalize()}: {_clip(analysis[key])}")
+            break
+    return lines
+
+
+def build_peer_context(
+    specialist: str,
+    rounds: dict[int, dict[str, dict]],
+    observer_analyses: dict[int, dict],
+    token_cap: int = DEFAULT_TOKEN_CAP,
+    include_own: bool = True,
+) -> PeerContext:
+    """Compact prior-round context for one Round 2+ specialist.
+
+    Args:
+        specialist: The reader's key (e.g. "neurologist").
+        rounds: {round: {specialist: output}} for the rounds before the current one.
+        observer_analyses: {round: Observer output} for those rounds.
+        token_cap: Estimated token budget for the digest.
+        include_own: Restate the reader's own previous analysis (False
+            when it is already in the reader's session). The peer digest
+            still compares against it.
+    """
+    estimator = get_estimator()
+    full = full_peer_context(specialist, rounds, observer_analyses, include_own)
+    prior_rounds = sorted(rounds)
+    if not prior_rounds:
+        return PeerContext("", 0, 0)
+
+    latest = prior_rounds[-1]
+    before = prior_rounds[-2] if len(prior_rounds) > 1 else None
+    own = rounds[latest].get(specialist) or {}
+    peers = {name: o for name, o in rounds[latest].items() if name != specialist and isinstance(o, dict)}
+
+    def _render(limit: int) -> str:
+        sections = []
+        if own and include_own:
+            sections.append("\n".join(_own_section(latest, own)))
+        if peers:
+            seen: list[set] = []
+            peer_lines = [f"## Other Specialists in Round {latest} (digest: new or contradicting evidence only)"]
+            for name, output in peers.items():
+                previous = rounds[before].get(name) if before is not None else None
+                peer_lines.extend(_peer_section(name, output, previous, own, seen, limit))
+            sections.append("\n".join(peer_lines))
+        analysis = observer_analyses.get(latest)
+        if isinstance(analysis, dict) and analysis:
+            sections.append("\n".join(_observer_section(specialist, latest, analysis, limit)))
+        return "\n\n".join(sections)
+
+    for limit in range(MAX_PEER_ITEMS, 0, -1):
+        text = _render(limit)
+        tokens = estimator.estimate(text)
+        if tokens <= token_cap:
+            return PeerContext(text, tokens, estimator.estimate(full))
+    text, _ = estimator.truncate(text, token_cap)
+    return PeerContext(text, estimator.estimate(text), estimator.estimate(full), truncated=True)
+
+
+class PeerContextStats:
+    """Prompt tokens sent as peer context per round, against the full JSON layout."""
+
+    def __init__(self):
+        self.rounds: dict[int, dict] = {}
+
+    def record(self, round_num: int, context: PeerContext):
+        stats = self.rounds.setdefault(
+            round_num, {"prompts": 0, "tokens": 0, "full_tokens": 0, "truncated": 0}
+        )
+        stats["prompts"] += 1
+        stats["tokens"] += context.tokens
+        stats["full_tokens"] += context.full_tokens
+        stats["truncated"] += context.truncated
+
+    def saved(self, round_num: int) -> int:
+        stats = self.rounds.get(round_num)
+        return max(0, stats["full_tokens"] - stats["tokens"]) if stats else 0
+
+    def summary(self) -> str:
+        if not self.rounds:
+            return "Peer context: no Round 2+ prompts"
+        parts = [
+            f"R{r} ~{s['tokens']:,}/{s['full_tokens']:,} tokens over {s['prompts']} prompt(s)"
+            + (f", {s['truncated']} capped" if s["truncated"] else "")
+            for r, s in sorted(self.rounds.items())
+        ]
+        total = sum(self.saved(r) for r in self.rounds)
+        return f"Peer context: {' | '.join(parts)} | ~{total:,} prompt tokens saved"
@@ -15,10 +15,14 @@ class ProgressReporter:
     2. Structured: print('[STAGE] {"name": ..., "message": ...}') — for dynamic stages
     """
 
+    # Streamed Observer text is flushed at paragraph breaks, or once this long
+    OBSERVER_TEXT_CHUNK = 400
+
     def __init__(self, structured: bool = True):
         self.structured = structured
         self.stages = []
         self.current_index = 0
+        self._observer_text = ""
 
     def emit(self, name: str, message: str, agent: str = None, round_num: int = None):
         """Emit a stage event.
@@ -87,6 +91,32 @@ class ProgressReporter:
         elif tool_name == "complete":
             self.emit(name="complete", message="Pipeline complete")
 
+    def emit_observer_event(self, event: str, **data):
+        """Emit a live event from a streamed Observer turn.
+
+        Printed as '[OBSERVER] {"event": ..., ...}' — server.js relays these to
+        the frontend as they arrive, before the turn has finished.
+        """
+        if self.structured:
+            print(f"[OBSERVER] {json.dumps({'event': event, **data})}", flush=True)
+
+    def observer_text(self, delta: str):
+        """Buffer streamed Observer text, emitting it a paragraph at a time."""
+        self._observer_text += delta
+        while "\n\n" in self._observer_text or len(self._observer_text) >= self.OBSERVER_TEXT_CHUNK:
+            head, sep, rest = self._observer_text.partition("\n\n")
+            if not sep:
+                head, rest = self._observer_text, ""
+            self._observer_text = rest
+            if head.strip():
+                self.emit_observer_event("text", text=head.strip())
+
+    def flush_observer_text(self):
+        """Emit whatever Observer text is still buffered (end of a text block)."""
+        text, self._observer_text = self._observer_text.strip(), ""
+        if text:
+            self.emit_observer_event("text", text=text)
+
     def emit_loading(self):
         """Emit the initial loading stage."""
         self.emit(name="loading", message="Loading case and constitution")
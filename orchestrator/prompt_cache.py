@@ -0,0 +1,143 @@
+"""Prompt caching — cache_control breakpoints and cache hit accounting.
+
+The agentic loop re-sends the same tools, system prompt and growing message
+history on every iteration. Marking the end of each stable section with a
+cache breakpoint lets the API serve that prefix from cache, so each request
+only pays full price for the new suffix.
+
+Breakpoints are applied to a copy of the request at send time rather than
+stored in the history, so they always sit on the latest messages — including
+after ContextManager.compress() has rewritten the history. The API allows at
+most 4 breakpoints per request: tools, system, and two on the messages.
+"""
+
+import asyncio
+
+EPHEMERAL = {"type": "ephemeral"}
+
+
+def cached_system(text: str) -> list[dict]:
+    """Wrap a system prompt string as a single cached text block."""
+    return [{"type": "text", "text": text, "cache_control": EPHEMERAL}]
+
+
+def cached_tools(tools: list[dict]) -> list[dict]:
+    """Return a copy of the tool list with a breakpoint on the last definition."""
+    if not tools:
+        return tools
+    return tools[:-1] + [{**tools[-1], "cache_control": EPHEMERAL}]
+
+
+def _with_breakpoint(message: dict) -> dict:
+    """Return a copy of a user message whose last content block is cached."""
+    content = message["content"]
+    if isinstance(content, str):
+        blocks = [{"type": "text", "text": content}]
+    else:
+        blocks = list(content)
+    if not blocks or not isinstance(blocks[-1], dict):
+        return message
+    blocks[-1] = {**blocks[-1], "cache_control": EPHEMERAL}
+    return {**message, "content": blocks}
+
+
+def with_message_breakpoints(messages: list) -> list:
+    """Return a copy of the history with breakpoints on its two stable points.
+
+    - The final message: everything up to here is written to the cache so
+      the next iteration can read it.
+    - The last user message before the latest assistant turn: this is where
+      the previous request ended, so this request reads its cached prefix
+      even when the new suffix is longer than the API's lookback window.
+
+    Only user messages are marked; assistant content is sent back untouched.
+    """
+    if not messages:
+        return messages
+    marked = list(messages)
+    targets = []
+    if _role(marked[-1]) == "user":
+        targets.append(len(marked) - 1)
+
+    last_assistant = next(
+        (i for i in range(len(marked) - 1, -1, -1) if _role(marked[i]) == "assistant"),
+        None,
+    )
+    if last_assistant is not None and last_assistant > 0 and _role(marked[last_assistant - 1]) == "user":
+        targets.append(last_assistant - 1)
+
+    for i in targets:
+        marked[i] = _with_breakpoint(marked[i])
+    return marked
+
+
+def _role(message) -> str:
+    if isinstance(message, dict):
+        return message.get("role", "")
+    return getattr(message, "role", "")
+
+
+class CacheStats:
+    """Accumulates prompt-cache token counts from response.usage across a run."""
+
+    def __init__(self):
+        self.requests = 0
+        self.input_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+
+    def record(self, usage) -> str:
+        """Add one response's usage and return a one-line per-request report."""
+        uncached = getattr(usage, "input_tokens", 0) or 0
+        read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+
+        self.requests += 1
+        self.input_tokens += uncached
+        self.cache_read_tokens += read
+        self.cache_write_tokens += write
+
+        total = uncached + read + write
+        hit_rate = read / total if total else 0.0
+        return (
+            f"read {read:,} | write {write:,} | uncached {uncached:,} "
+            f"| hit rate {hit_rate:.0%}"
+        )
+
+    def summary(self) -> str:
+        total = self.input_tokens + self.cache_read_tokens + self.cache_write_tokens
+        hit_rate = self.cache_read_tokens / total if total else 0.0
+        return (
+            f"Prompt cache: {self.requests} requests | "
+            f"{self.cache_read_tokens:,} read / {self.cache_write_tokens:,} written / "
+            f"{self.input_tokens:,} uncached input tokens | hit rate {hit_rate:.0%}"
+        )
+
+
+class PrefixWarmer:
+    """Holds back a fan-out of requests until the first has cached their shared prefix.
+
+    The first caller to acquire() becomes the leader and is sent straight
+    away; every later caller waits until the leader calls release() (once
+    its prompt has been processed) or until `timeout` seconds pass, then goes
+    ahead and reads the prefix from the cache instead of rewriting it.
+    """
+
+    def __init__(self, timeout: float = 60.0):
+        self.timeout = timeout
+        self._claimed = False
+        self._ready = asyncio.Event()
+
+    async def acquire(self) -> bool:
+        """Return True for the leader; otherwise wait for the warm cache and return False."""
+        if not self._claimed:
+            self._claimed = True
+            return True
+        try:
+            await asyncio.wait_for(self._ready.wait(), self.timeout)
+        except asyncio.TimeoutError:
+            pass
+        return False
+
+    def release(self):
+        self._ready.set()
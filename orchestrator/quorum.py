@@ -0,0 +1,109 @@
+"""Quorum — finish a debate round without waiting on straggler specialists.
+
+A round normally waits for every specialist, so one slow response (heavy
+thinking, a long retry) holds up the Observer's review. With a QuorumPolicy
+the round returns once `min_complete` specialists have succeeded and the
+rest have had `grace_seconds` more to finish. Anything still running keeps
+running: when it finishes, the round's `on_late` callback merges it into
+the debate state and round files and flags it to the Observer as late.
+
+Both pipelines use it — the legacy round functions for their fixed team and
+the agentic loop for each batch of concurrent `call_specialist` calls.
+"""
+
+import asyncio
+import time
+
+
+class QuorumPolicy:
+    def __init__(self, min_complete: int | None = None, grace_seconds: float = 0.0):
+        """
+        Args:
+            min_complete: Successful results needed before the round may end
+                (None = every call).
+            grace_seconds: How long to keep waiting for the rest once the
+                quorum is reached.
+        """
+        self.min_complete = min_complete
+        self.grace_seconds = grace_seconds
+
+    def required(self, n: int) -> int:
+        if self.min_complete is None:
+            return n
+        return max(1, min(n, self.min_complete))
+
+
+class QuorumRound:
+    """Runs one round's calls and returns as soon as its policy is satisfied."""
+
+    def __init__(self, policy: QuorumPolicy | None = None, on_late=None, label: str = "round"):
+        """
+        Args:
+            policy: When to stop waiting (None = wait for every call, like gather).
+            on_late: Called as on_late(key, result) for each call that finishes
+                after run() returned; `result` is the exception if it failed.
+            label: Used in log lines.
+        """
+        self.policy = policy or QuorumPolicy()
+        self.on_late = on_late
+        self.label = label
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._results: dict = {}
+        self._returned = False
+
+    @property
+    def pending(self) -> list[str]:
+        """Keys of the calls still running after run() returned."""
+        return [key for key, task in self._tasks.items() if not task.done()]
+
+    async def run(self, calls: dict) -> dict:
+        """Run `calls` ({key: awaitable}) and return {key: result or exception}.
+
+        Keys missing from the result are still running (see `pending`).
+        """
+        self._tasks = {key: asyncio.ensure_future(self._track(key, call)) for key, call in calls.items()}
+        needed = self.policy.required(len(calls))
+        pending = set(self._tasks.values())
+        quorum_at = None
+
+        while pending:
+            timeout = None
+            if quorum_at is not None:
+                timeout = max(0.0, quorum_at + self.policy.grace_seconds - time.monotonic())
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break  # Grace period over
+            succeeded = sum(1 for r in self._results.values() if not isinstance(r, BaseException))
+            if quorum_at is None and succeeded >= needed and pending:
+                quorum_at = time.monotonic()
+                print(
+                    f"  [QUORUM] {self.label}: {succeeded}/{len(calls)} done — "
+                    f"waiting up to {self.policy.grace_seconds:g}s for stragglers"
+                )
+
+        self._returned = True
+        if self.pending:
+            print(f"  [QUORUM] {self.label}: proceeding without {', '.join(map(str, self.pending))} (will merge when done)")
+        return dict(self._results)
+
+    async def drain(self):
+        """Wait for the stragglers; on_late fires for each as it finishes."""
+        tasks = [task for task in self._tasks.values() if not task.done()]
+        if tasks:
+            print(f"  [QUORUM] {self.label}: waiting for {len(tasks)} straggler(s)...")
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def cancel(self):
+        for task in self._tasks.values():
+            task.cancel()
+
+    async def _track(self, key: str, call):
+        try:
+            result = await call
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            result = e
+        self._results[key] = result
+        if self._returned and self.on_late is not None:
+            self.on_late(key, result)
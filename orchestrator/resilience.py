@@ -0,0 +1,242 @@
+"""Resilient client — per-call retries with backoff, a run-wide retry budget
+and a circuit breaker per model.
+
+ResilientClient wraps an AsyncAnthropic client (or a MeteredClient around
+one) and is handed to every caller in place of it, so transient failures
+are retried where they happen: one overloaded specialist call is retried on
+its own instead of failing the round or costing the Observer a turn.
+
+- Retryable errors (429, 5xx, 529 overloaded, connection errors and the
+  equivalent errors sent mid-stream) are retried with exponential backoff
+  and full jitter. A `retry-after` / `retry-after-ms` header wins over the
+  computed delay.
+- `retry_budget` caps the retries of the whole run, so a degraded API fails
+  the run quickly instead of multiplying its latency.
+- After `breaker_threshold` consecutive retryable failures a model's
+  circuit opens: calls to it fail fast with CircuitOpenError for
+  `breaker_cooldown` seconds, then one call is let through to probe it.
+
+Streams are retried when they are opened and in get_final_message(), which
+reopens the request. An error while the caller iterates events is raised
+as-is, since those events cannot be replayed.
+
+Create the underlying client with max_retries=0 so retries are not doubled
+by the SDK's own.
+"""
+
+import asyncio
+import random
+import time
+
+import anthropic
+
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+# Error types an SSE "error" event can carry mid-stream
+RETRYABLE_ERROR_TYPES = {"overloaded_error", "rate_limit_error", "api_error", "timeout_error"}
+
+
+class CircuitOpenError(RuntimeError):
+    """Calls to a model are suspended after repeated failures."""
+
+
+def is_retryable(error: BaseException) -> bool:
+    if isinstance(error, anthropic.APIConnectionError):
+        return True  # Includes APITimeoutError
+    if isinstance(error, anthropic.APIStatusError):
+        detail = error.body.get("error") if isinstance(error.body, dict) else None
+        error_type = detail.get("type") if isinstance(detail, dict) else None
+        return error.status_code in RETRYABLE_STATUS or error_type in RETRYABLE_ERROR_TYPES
+    return False
+
+
+def retry_after(error: BaseException) -> float | None:
+    """Seconds the server asked us to wait, if it said."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        try:
+            return float(headers[header]) * scale
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+
+class CircuitBreaker:
+    def __init__(self, threshold: int = 5, cooldown: float = 60.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures: dict[str, int] = {}
+        self._open_until: dict[str, float] = {}
+        self.opened = 0
+
+    def is_open(self, model: str) -> bool:
+        return self._open_until.get(model, 0.0) > time.monotonic()
+
+    def check(self, model: str):
+        """Raise CircuitOpenError while the model's circuit is open."""
+        remaining = self._open_until.get(model, 0.0) - time.monotonic()
+        if remaining > 0:
+            raise CircuitOpenError(
+                f"Circuit open for {model} after {self._failures[model]} consecutive failures "
+                f"— retry in {remaining:.0f}s"
+            )
+
+    def record_success(self, model: str):
+        self._failures.pop(model, None)
+        self._open_until.pop(model, None)
+
+    def record_failure(self, model: str):
+        self._failures[model] = self._failures.get(model, 0) + 1
+        if self._failures[model] >= self.threshold:
+            # Opens on the threshold, and again whenever a probe call fails
+            self._open_until[model] = time.monotonic() + self.cooldown
+            self.opened += 1
+            print(f"  [CIRCUIT] {model}: {self._failures[model]} consecutive failures — pausing calls for {self.cooldown:.0f}s")
+
+
+class ResilientClient:
+    """AsyncAnthropic proxy that retries failed requests (see module docstring)."""
+
+    def __init__(
+        self,
+        client,
+        max_attempts: int = 4,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        retry_budget: int = 30,
+        breaker_threshold: int = 5,
+        breaker_cooldown: float = 60.0,
+    ):
+        self._client = client
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_budget = retry_budget
+        self.breaker = CircuitBreaker(breaker_threshold, breaker_cooldown)
+        self.retries = 0
+        self.recovered = 0  # Calls that succeeded after at least one retry
+        self.failed = 0  # Calls that gave up on a retryable error
+        self.messages = _ResilientMessages(client.messages, self)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    async def call(self, model: str | None, fn):
+        """Await fn() (a fresh request each time), retrying retryable failures."""
+        model = model or "unknown"
+        attempt = 0
+        while True:
+            self.breaker.check(model)
+            try:
+                result = await fn()
+            except Exception as e:
+                if not is_retryable(e):
+                    raise
+                self.breaker.record_failure(model)
+                attempt += 1
+                if attempt >= self.max_attempts or self.breaker.is_open(model):
+                    self.failed += 1
+                    raise
+                if self.retries >= self.retry_budget:
+                    self.failed += 1
+                    print(f"  [RETRY] Run retry budget ({self.retry_budget}) exhausted — not retrying {model}")
+                    raise
+                delay = self._delay(attempt, e)
+                self.retries += 1
+                print(
+                    f"  [RETRY] {model}: {type(e).__name__} — retry {attempt}/{self.max_attempts - 1} "
+                    f"in {delay:.1f}s ({self.retry_budget - self.retries} left in run budget)"
+                )
+                await asyncio.sleep(delay)
+                continue
+            self.breaker.record_success(model)
+            if attempt:
+                self.recovered += 1
+            return result
+
+    def _delay(self, attempt: int, error: BaseException) -> float:
+        """Exponential backoff with full jitter, unless the server said how long to wait."""
+        jittered = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        server_delay = retry_after(error)
+        if server_delay is not None:
+            return server_delay + jittered * 0.1
+        return jittered
+
+    def summary(self) -> str:
+        return (
+            f"Retries: {self.retries}/{self.retry_budget} used, {self.recovered} call(s) recovered, "
+            f"{self.failed} gave up, {self.breaker.opened} circuit opening(s)"
+        )
+
+
+class _ResilientMessages:
+    def __init__(self, messages, owner: ResilientClient):
+        self._messages = messages
+        self._owner = owner
+
+    async def create(self, **kwargs):
+        return await self._owner.call(kwargs.get("model"), lambda: self._messages.create(**kwargs))
+
+    def stream(self, **kwargs):
+        return _ResilientStream(self._messages, kwargs, self._owner)
+
+    def __getattr__(self, name):
+        return getattr(self._messages, name)
+
+
+class _ResilientStream:
+    """Stream context manager that (re)opens its request with retries."""
+
+    def __init__(self, messages, kwargs: dict, owner: ResilientClient):
+        self._messages = messages
+        self._kwargs = kwargs
+        self._owner = owner
+        self._model = kwargs.get("model")
+        self._manager = None
+        self._stream = None
+
+    async def _open(self):
+        await self._close()
+        manager = self._messages.stream(**self._kwargs)
+        self._stream = await manager.__aenter__()
+        self._manager = manager
+
+    async def _close(self, exc_info=(None, None, None)):
+        manager, self._manager = self._manager, None
+        if manager is not None:
+            try:
+                await manager.__aexit__(*exc_info)
+            except Exception:
+                pass  # The failed attempt is being replaced anyway
+
+    async def __aenter__(self):
+        await self._owner.call(self._model, self._open)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        manager, self._manager = self._manager, None
+        if manager is not None:
+            return await manager.__aexit__(exc_type, exc, tb)
+        return False
+
+    async def get_final_message(self):
+        first = True
+
+        async def _final():
+            nonlocal first
+            if not first:
+                await self._open()  # Retry: send the request again
+            first = False
+            return await self._stream.get_final_message()
+
+        return await self._owner.call(self._model, _final)
+
+    def __aiter__(self):
+        return self._stream.__aiter__()
+
+    async def __anext__(self):
+        return await self._stream.__anext__()
+
+    def __getattr__(self, name):
+        # current_message_snapshot, text_stream, ...
+        return getattr(self._stream, name)
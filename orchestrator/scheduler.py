@@ -0,0 +1,379 @@
+"""Scheduler — rate-limit-aware admission for every model call in the process.
+
+A round of 6-8 specialists, each sending 100K+ input tokens, or several
+cases at once, can exceed the organization's input-tokens-per-minute limit
+in one burst. Every call then gets a 429 and backs off at the same time.
+The scheduler admits calls instead of letting them race:
+
+- Per model, a token bucket for requests and one for estimated input
+  tokens. Both start unlimited (or at the limits given) and are set from
+  the `anthropic-ratelimit-*` headers of each response.
+- A concurrency limit per model, halved on a 429 and grown back by one per
+  successful call.
+- A 429 pauses admission for that model until its `retry-after` has
+  passed, so queued calls wait instead of all failing.
+- Waiting calls are admitted by stage priority (STAGE_PRIORITY): synthesis
+  goes ahead of specialists, and speculative prefetches go last.
+
+ScheduledClient wraps a client so every request goes through the
+process-wide scheduler (get_scheduler()). The stage comes from the
+deadline.within() call around the request (see call_stage()).
+benchmarks/fake_anthropic_server.py is a local server that enforces rate
+limits with 429s, for exercising this offline.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import time
+
+from orchestrator.context_manager import estimate_message_tokens
+from orchestrator.token_estimator import get_estimator
+
+# Lower runs first
+STAGE_PRIORITY = {
+    "synthesis": 0,
+    "observer": 1,
+    "observer_review": 2,
+    "translation": 3,
+    "amendments": 3,
+    "specialist": 4,
+    "speculative": 6,
+}
+DEFAULT_PRIORITY = 5
+
+DEFAULT_PAUSE_SECONDS = 5.0  # After a 429 without retry-after
+IMAGE_TOKENS = 1_600  # Rough cost of one attached image
+
+_stage: contextvars.ContextVar[str | None] = contextvars.ContextVar("model_call_stage", default=None)
+
+
+@contextlib.contextmanager
+def call_stage(stage: str):
+    """Label the model calls made inside this block with `stage`.
+
+    An outer label wins, so a speculative prefetch stays "speculative" even
+    though its specialist call labels itself "specialist".
+    """
+    token = _stage.set(stage) if _stage.get() is None else None
+    try:
+        yield
+    finally:
+        if token is not None:
+            _stage.reset(token)
+
+
+async def as_stage(stage: str, coro):
+    """Await `coro` with its model calls labelled `stage` (for background tasks)."""
+    with call_stage(stage):
+        return await coro
+
+
+def current_stage() -> str:
+    return _stage.get() or "default"
+
+
+class TokenBucket:
+    """Refills at `per_minute` per minute up to one minute's worth (None = unlimited)."""
+
+    def __init__(self, per_minute: float | None = None):
+        self.per_minute = per_minute
+        self.level = per_minute or 0.0
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        if self.per_minute:
+            self.level = min(self.per_minute, self.level + (now - self.updated) * self.per_minute / 60)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` can be taken (capped at one full bucket)."""
+        if not self.per_minute:
+            return 0.0
+        self._refill()
+        amount = min(amount, self.per_minute)
+        return max(0.0, (amount - self.level) * 60 / self.per_minute)
+
+    def take(self, amount: float):
+        if self.per_minute:
+            self._refill()
+            self.level -= amount  # May go negative: the debt delays the next call
+
+    def sync(self, limit: float | None, remaining: float | None):
+        """Adopt the server's view of this limit."""
+        self._refill()
+        if limit:
+            if not self.per_minute:
+                self.level = limit
+            self.per_minute = limit
+        if remaining is not None and self.per_minute:
+            self.level = min(self.level, remaining)
+
+
+class _ModelState:
+    def __init__(self, requests_per_minute, input_tokens_per_minute, max_concurrency):
+        self.requests = TokenBucket(requests_per_minute)
+        self.input_tokens = TokenBucket(input_tokens_per_minute)
+        self.max_concurrency = max_concurrency
+        self.concurrency = max_concurrency
+        self.in_flight = 0
+        self.paused_until = 0.0
+
+    def admission_delay(self, tokens: int) -> float | None:
+        """Seconds until a call of `tokens` may start (None = wait for a slot to free up)."""
+        if self.in_flight >= self.concurrency:
+            return None
+        return max(
+            self.paused_until - time.monotonic(),
+            self.requests.wait_time(1),
+            self.input_tokens.wait_time(tokens),
+            0.0,
+        )
+
+
+class Ticket:
+    """An admitted call; hand it back with RateLimitScheduler.release()."""
+
+    def __init__(self, model: str, stage: str, tokens: int, waited: float):
+        self.model = model
+        self.stage = stage
+        self.tokens = tokens
+        self.waited = waited
+
+
+class RateLimitScheduler:
+    def __init__(
+        self,
+        requests_per_minute: float | None = None,
+        input_tokens_per_minute: float | None = None,
+        max_concurrency: int = 8,
+    ):
+        """
+        Args:
+            requests_per_minute: Starting request limit per model (None =
+                unlimited until response headers say otherwise).
+            input_tokens_per_minute: Starting input-token limit per model.
+            max_concurrency: Most calls in flight per model.
+        """
+        self.requests_per_minute = requests_per_minute
+        self.input_tokens_per_minute = input_tokens_per_minute
+        self.max_concurrency = max_concurrency
+        self._models: dict[str, _ModelState] = {}
+        self._waiting: list = []  # heap of [priority, seq, model, tokens]
+        self._seq = itertools.count()
+        self._changed = asyncio.Event()
+        self.stats = {"admitted": 0, "delayed": 0, "wait_seconds": 0.0, "rate_limited": 0}
+
+    def _state(self, model: str) -> _ModelState:
+        if model not in self._models:
+            self._models[model] = _ModelState(
+                self.requests_per_minute, self.input_tokens_per_minute, self.max_concurrency,
+            )
+        return self._models[model]
+
+    def _notify(self):
+        # Wake every waiter; each re-checks whether it is next
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _is_next(self, entry: list) -> bool:
+        model = entry[2]
+        return min((e for e in self._waiting if e[2] == model), key=lambda e: (e[0], e[1])) is entry
+
+    async def acquire(self, model: str, tokens: int, stage: str | None = None) -> Ticket:
+        """Wait until a call to `model` with ~`tokens` input tokens may start."""
+        stage = stage or current_stage()
+        state = self._state(model)
+        entry = [STAGE_PRIORITY.get(stage, DEFAULT_PRIORITY), next(self._seq), model, tokens]
+        heapq.heappush(self._waiting, entry)
+        start = time.monotonic()
+        try:
+            while True:
+                delay = state.admission_delay(tokens) if self._is_next(entry) else None
+                if delay == 0:
+                    break
+                changed = self._changed
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._waiting.remove(entry)
+            heapq.heapify(self._waiting)
+            self._notify()
+
+        state.in_flight += 1
+        state.requests.take(1)
+        state.input_tokens.take(tokens)
+        waited = time.monotonic() - start
+        self.stats["admitted"] += 1
+        if waited > 0.05:
+            self.stats["delayed"] += 1
+            self.stats["wait_seconds"] += waited
+            print(f"  [SCHEDULER] {stage} call to {model} admitted after {waited:.1f}s (~{tokens:,} input tokens)")
+        return Ticket(model, stage, tokens, waited)
+
+    def release(self, ticket: Ticket, usage=None, headers=None, error: BaseException | None = None):
+        """Return an admitted call's slot and learn from its outcome."""
+        state = self._state(ticket.model)
+        state.in_flight -= 1
+        if usage is not None:
+            # Replace the estimate with what the API counted against the limit
+            actual = getattr(usage, "input_tokens", 0) or 0
+            actual += getattr(usage, "cache_creation_input_tokens", 0) or 0
+            state.input_tokens.take(actual - ticket.tokens)
+        if headers is None and error is not None:
+            headers = getattr(getattr(error, "response", None), "headers", None)
+        if headers is not None:
+            self._sync_headers(state, headers)
+
+        if getattr(error, "status_code", None) == 429:
+            self.stats["rate_limited"] += 1
+            pause = _retry_after(headers) or DEFAULT_PAUSE_SECONDS
+            state.paused_until = max(state.paused_until, time.monotonic() + pause)
+            state.concurrency = max(1, state.concurrency // 2)
+            print(
+                f"  [SCHEDULER] {ticket.model} rate limited — pausing {pause:.1f}s, "
+                f"concurrency {state.concurrency}"
+            )
+        elif error is None and state.concurrency < state.max_concurrency:
+            state.concurrency += 1
+        self._notify()
+
+    @staticmethod
+    def _sync_headers(state: _ModelState, headers):
+        def _number(name):
+            try:
+                return float(headers.get(f"anthropic-ratelimit-{name}"))
+            except (TypeError, ValueError):
+                return None
+
+        state.requests.sync(_number("requests-limit"), _number("requests-remaining"))
+        state.input_tokens.sync(_number("input-tokens-limit"), _number("input-tokens-remaining"))
+
+    def summary(self) -> str:
+        limits = ", ".join(
+            f"{model} {s.requests.per_minute or '∞'} RPM / {s.input_tokens.per_minute or '∞'} ITPM"
+            for model, s in sorted(self._models.items())
+        )
+        return (
+            f"Scheduler: {self.stats['admitted']} calls, {self.stats['delayed']} delayed "
+            f"({self.stats['wait_seconds']:.0f}s total), {self.stats['rate_limited']} rate-limited"
+            + (f" — {limits}" if limits else "")
+        )
+
+
+def _retry_after(headers) -> float | None:
+    if headers is None:
+        return None
+    for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        try:
+            return float(headers.get(header)) * scale
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def estimate_request_tokens(kwargs: dict) -> int:
+    """Input tokens a messages request will be charged, estimated before sending."""
+    system = kwargs.get("system") or ""
+    if isinstance(system, list):
+        system = "\n\n".join(block.get("text", "") for block in system)
+    tokens = get_estimator().estimate(system)
+    for message in kwargs.get("messages", []):
+        tokens += estimate_message_tokens(message)
+        content = message.get("content") if isinstance(message, dict) else None
+        if isinstance(content, list):
+            tokens += IMAGE_TOKENS * sum(1 for b in content if isinstance(b, dict) and b.get("type") == "image")
+    if kwargs.get("tools"):
+        tokens += get_estimator().estimate(str(kwargs["tools"]), "json")
+    return tokens
+
+
+_scheduler: RateLimitScheduler | None = None
+
+
+def get_scheduler() -> RateLimitScheduler:
+    """Process-wide scheduler, shared by every run (and case) in this process."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = RateLimitScheduler()
+    return _scheduler
+
+
+class ScheduledClient:
+    """AsyncAnthropic proxy that admits every request through a RateLimitScheduler."""
+
+    def __init__(self, client, scheduler: RateLimitScheduler | None = None):
+        self._client = client
+        self.scheduler = scheduler or get_scheduler()
+        self.messages = _ScheduledMessages(client.messages, self.scheduler)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class _ScheduledMessages:
+    def __init__(self, messages, scheduler: RateLimitScheduler):
+        self._messages = messages
+        self._scheduler = scheduler
+
+    async def create(self, **kwargs):
+        ticket = await self._scheduler.acquire(kwargs.get("model", "unknown"), estimate_request_tokens(kwargs))
+        try:
+            response = await self._messages.create(**kwargs)
+        except BaseException as e:
+            self._scheduler.release(ticket, error=e)
+            raise
+        self._scheduler.release(ticket, usage=getattr(response, "usage", None))
+        return response
+
+    def stream(self, **kwargs):
+        return _ScheduledStream(self._messages.stream(**kwargs), kwargs, self._scheduler)
+
+    def __getattr__(self, name):
+        return getattr(self._messages, name)
+
+
+class _ScheduledStream:
+    def __init__(self, manager, kwargs: dict, scheduler: RateLimitScheduler):
+        self._manager = manager
+        self._kwargs = kwargs
+        self._scheduler = scheduler
+        self._ticket = None
+        self._stream = None
+
+    async def __aenter__(self):
+        self._ticket = await self._scheduler.acquire(
+            self._kwargs.get("model", "unknown"), estimate_request_tokens(self._kwargs),
+        )
+        try:
+            self._stream = await self._manager.__aenter__()
+        except BaseException as e:
+            self._scheduler.release(self._ticket, error=e)
+            self._ticket = None
+            raise
+        return self._stream
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            if self._ticket is not None:
+                try:
+                    snapshot = self._stream.current_message_snapshot
+                except Exception:
+                    snapshot = None  # Ended before message_start (API error or cancel)
+                response = getattr(self._stream, "response", None)
+                ticket, self._ticket = self._ticket, None
+                self._scheduler.release(
+                    ticket,
+                    usage=getattr(snapshot, "usage", None),
+                    headers=getattr(response, "headers", None),
+                    error=exc,
+                )
+        finally:
+            # Always close the HTTP stream, whatever happened to the slot
+            suppress = await self._manager.__aexit__(exc_type, exc, tb)
+        return suppress
@@ -3,42 +3,42 @@ Specialist Caller — extracted from orchestrator.py
 ====================================================
 Builds system prompts for Round 1 and Round 2 specialists,
 and makes individual specialist API calls.
+
+Two prompt layouts are supported:
+- "standard": role → focus → constitution in the system prompt, case data
+  in the user message (the original layout).
+- "shared-prefix": constitution in the system prompt, then the case data,
+  then role/focus/round rules. Everything up to the end of the case data is
+  identical for every specialist in a run and carries cache breakpoints, so
+  parallel specialists read the (often 100K+ token) case from the cache.
+
+Either layout can keep a SpecialistSession: Round 1 is recorded, and
+continue_specialist() answers a later round as a new turn of the same
+conversation (see orchestrator.specialist_session).
 """
 
 import base64
 import json
+import time
 from pathlib import Path
 
 from anthropic import AsyncAnthropic
 
+from orchestrator.deadline import Deadline, limits, within
+from orchestrator.hedging import Hedger, hedged
+from orchestrator.prompt_cache import EPHEMERAL, PrefixWarmer, with_message_breakpoints
+from orchestrator.specialist_session import SpecialistCallStats, SpecialistSession
+from orchestrator.token_estimator import char_counts, get_estimator, merge_counts
 from orchestrator.utils import extract_json, normalize_specialist_output, THINKING_BUDGET
 
+PROMPT_LAYOUTS = ("standard", "shared-prefix")
 
-# ── Prompt Builders ──────────────────────────────────────────────────────────
-
-def build_specialist_system_prompt(
-    agent_def: dict,
-    display_name: str,
-    role_override: str | None,
-    focus: str,
-    constitution: str,
-) -> str:
-    """Build the full system prompt for a specialist agent."""
-    role_section = role_override if role_override else agent_def["system_prompt"]
-    agent_key = display_name.lower().replace(" ", "_")
-
-    return f"""You are participating in a multi-specialist diagnostic consultation as part of The Emergent Diagnostic Institution.
 
-## Your Role
-{role_section}
+# ── Prompt Sections ─────────────────────────────────────────────────────────
 
-## Your Specific Focus for This Case
-{focus}
-
-## Clinical Constitution (You MUST follow these principles)
-{constitution}
-
-## CRITICAL: Round 1 Rules (Article 1.1)
+def _round_1_rules(agent_key: str) -> str:
+    """Round 1 independence rules and output schema."""
+    return f"""## CRITICAL: Round 1 Rules (Article 1.1)
 This is Round 1. You MUST form your analysis INDEPENDENTLY. You have NOT seen any other specialist's output. Do not speculate about what others might think. Focus entirely on your own domain expertise applied to the case data.
 
 ## Required Output Format
@@ -61,29 +61,9 @@ Respond with ONLY valid JSON — no markdown fences, no preamble, no commentary
 Be thorough. Cite specific data points from the case (ages, test results, imaging findings, timeline events). Your confidence score must reflect genuine uncertainty — per Article 1.4, overconfidence (>0.9) without definitive evidence triggers Observer review."""
 
 
-def build_round_2_specialist_system_prompt(
-    agent_def: dict,
-    display_name: str,
-    role_override: str | None,
-    focus: str,
-    constitution: str,
-) -> str:
-    """Build the system prompt for a Round 2 specialist (debate round)."""
-    role_section = role_override if role_override else agent_def["system_prompt"]
-    agent_key = display_name.lower().replace(" ", "_")
-
-    return f"""You are participating in Round 2 of a multi-specialist diagnostic consultation as part of The Emergent Diagnostic Institution.
-
-## Your Role
-{role_section}
-
-## Your Specific Focus for This Case
-{focus}
-
-## Clinical Constitution (You MUST follow these principles)
-{constitution}
-
-## CRITICAL: Round 2 Rules (Debate Phase)
+def _round_2_rules(agent_key: str) -> str:
+    """Round 2+ debate rules and output schema."""
+    return f"""## CRITICAL: Round 2 Rules (Debate Phase)
 This is Round 2. You have now seen:
 - Your own Round 1 analysis
 - All other specialists' Round 1 analyses
@@ -118,30 +98,168 @@ Respond with ONLY valid JSON — no markdown fences, no preamble, no commentary
 Your confidence may go UP (if peer analyses reinforce your hypothesis) or DOWN (if valid challenges emerged). Be honest about uncertainty."""
 
 
+# ── Prompt Builders ──────────────────────────────────────────────────────────
+
+def build_specialist_system_prompt(
+    agent_def: dict,
+    display_name: str,
+    role_override: str | None,
+    focus: str,
+    constitution: str,
+) -> str:
+    """Build the full system prompt for a specialist agent."""
+    role_section = role_override if role_override else agent_def["system_prompt"]
+    agent_key = display_name.lower().replace(" ", "_")
+
+    return f"""You are participating in a multi-specialist diagnostic consultation as part of The Emergent Diagnostic Institution.
+
+## Your Role
+{role_section}
+
+## Your Specific Focus for This Case
+{focus}
+
+## Clinical Constitution (You MUST follow these principles)
+{constitution}
+
+{_round_1_rules(agent_key)}"""
+
+
+def build_round_2_specialist_system_prompt(
+    agent_def: dict,
+    display_name: str,
+    role_override: str | None,
+    focus: str,
+    constitution: str,
+) -> str:
+    """Build the system prompt for a Round 2 specialist (debate round)."""
+    role_section = role_override if role_override else agent_def["system_prompt"]
+    agent_key = display_name.lower().replace(" ", "_")
+
+    return f"""You are participating in Round 2 of a multi-specialist diagnostic consultation as part of The Emergent Diagnostic Institution.
+
+## Your Role
+{role_section}
+
+## Your Specific Focus for This Case
+{focus}
+
+## Clinical Constitution (You MUST follow these principles)
+{constitution}
+
+{_round_2_rules(agent_key)}"""
+
+
+def build_shared_specialist_system_prompt(constitution: str) -> list[dict]:
+    """Build the cached system prompt shared by every specialist (shared-prefix layout)."""
+    text = f"""You are participating in a multi-specialist diagnostic consultation as part of The Emergent Diagnostic Institution. Your role, your specific focus, and the rules for this round are given after the case data.
+
+## Clinical Constitution (You MUST follow these principles)
+{constitution}"""
+    return [{"type": "text", "text": text, "cache_control": EPHEMERAL}]
+
+
+def build_specialist_instructions(
+    agent_def: dict,
+    display_name: str,
+    role_override: str | None,
+    focus: str,
+    round_num: int = 1,
+    prior_context: str = "",
+) -> str:
+    """Build the per-specialist tail of a shared-prefix prompt.
+
+    Holds everything that differs between specialists — role, focus, prior
+    round context (Round 2+), round rules and output schema — so it can come
+    after the shared, cached case data.
+    """
+    role_section = role_override if role_override else agent_def["system_prompt"]
+    agent_key = display_name.lower().replace(" ", "_")
+    rules = _round_1_rules(agent_key) if round_num == 1 else _round_2_rules(agent_key)
+
+    parts = [
+        f"## Your Role\n{role_section}",
+        f"## Your Specific Focus for This Case\n{focus}",
+    ]
+    if prior_context:
+        parts.append(prior_context)
+    parts.append(rules)
+    return "\n\n".join(parts)
+
+
+def build_followup_instructions(
+    display_name: str,
+    round_num: int,
+    prior_context: str = "",
+    focus: str | None = None,
+) -> str:
+    """Build the user turn that continues a specialist session in Round 2+.
+
+    The role, the case and the specialist's own earlier answers are already
+    in the conversation; this adds the prior round context, a new focus if
+    it changed, and the debate rules.
+    """
+    agent_key = display_name.lower().replace(" ", "_")
+    parts = [f"# Round {round_num}"]
+    if prior_context:
+        parts.append(prior_context)
+    if focus:
+        parts.append(f"## Your Specific Focus for This Round\n{focus}")
+    parts.append(_round_2_rules(agent_key))
+    parts.append("Respond with ONLY the JSON object described above.")
+    return "\n\n".join(parts)
+
+
 # ── API Calls ────────────────────────────────────────────────────────────────
 
 async def call_specialist(
     client: AsyncAnthropic,
     agent_def: dict,
     display_name: str,
-    system_prompt: str,
+    system_prompt: str | list[dict],
     case_json: str,
     attached_images: list[dict] | None = None,
+    instructions: str | None = None,
+    prefix_warmer: PrefixWarmer | None = None,
+    deadline: Deadline | None = None,
+    hedger: Hedger | None = None,
+    session: SpecialistSession | None = None,
+    round_num: int = 1,
+    call_stats: SpecialistCallStats | None = None,
 ) -> dict:
-    """Call a single specialist via the Anthropic API and return parsed JSON."""
-    print(f"  ⏳ Launching {display_name}...")
+    """Call a single specialist via the Anthropic API and return parsed JSON.
+
+    Standard layout: `system_prompt` is the full prompt from
+    build_specialist_system_prompt() and `instructions` is None.
+
+    Shared-prefix layout: `system_prompt` comes from
+    build_shared_specialist_system_prompt(), `case_json` must be identical
+    for every specialist, and `instructions` holds the per-specialist tail.
+    With a `prefix_warmer`, only the first call of a fan-out is sent right
+    away; the others wait until its prompt has been processed (first stream
+    event), by which point the shared prefix is in the cache.
+
+    With a `hedger`, a call that runs unusually long is duplicated and the
+    first valid parsed response is used (see orchestrator.hedging).
+
+    With a `session`, the end of the prompt is cached and the request and
+    reply are recorded in it, so continue_specialist() can answer later
+    rounds in the same conversation. `call_stats` records the call's
+    latency and input tokens under `round_num`.
+    """
+    if prefix_warmer is not None and not await prefix_warmer.acquire():
+        print(f"  ⏳ Launching {display_name} (shared prefix cached)...")
+        prefix_warmer = None
+    else:
+        print(f"  ⏳ Launching {display_name}...")
 
     effort = agent_def.get("thinking", {}).get("effort", "high")
     budget = THINKING_BUDGET.get(effort, 10_000)
 
-    text_content_msg = (
-        "## Case Data\n\n"
-        "Analyze the following case and provide your independent diagnostic assessment.\n\n"
-        f"```json\n{case_json}\n```\n\n"
+    image_note = (
+        "The above images are attached medical records/scans for this case. "
+        "Include observations from these images in your analysis.\n\n"
     )
-    if attached_images:
-        text_content_msg += "The above images are attached medical records/scans for this case. Include observations from these images in your analysis.\n\n"
-    text_content_msg += "Respond with ONLY the JSON object described in your instructions."
 
     # Build content blocks — include images if present
     content_blocks = []
@@ -158,25 +276,149 @@ async def call_specialist(
                         "data": image_data,
                     },
                 })
-    content_blocks.append({"type": "text", "text": text_content_msg})
-
-    async with client.messages.stream(
-        model=agent_def["model"],
-        max_tokens=16_000,
-        thinking={"type": "adaptive"},
-        system=system_prompt,
-        messages=[{"role": "user", "content": content_blocks}],
-    ) as stream:
-        response = await stream.get_final_message()
-
-    text_content = "".join(
-        block.text for block in response.content if block.type == "text"
+
+    if instructions is None:
+        text_content_msg = (
+            "## Case Data\n\n"
+            "Analyze the following case and provide your independent diagnostic assessment.\n\n"
+            f"```json\n{case_json}\n```\n\n"
+        )
+        if attached_images:
+            text_content_msg += image_note
+        text_content_msg += "Respond with ONLY the JSON object described in your instructions."
+        content_blocks.append({"type": "text", "text": text_content_msg})
+    else:
+        # Shared prefix ends with the case data; the tail is per-specialist
+        content_blocks.append({
+            "type": "text",
+            "text": f"## Case Data\n\n```json\n{case_json}\n```",
+            "cache_control": EPHEMERAL,
+        })
+        tail = instructions + "\n\n"
+        if attached_images:
+            tail += image_note
+        tail += "Respond with ONLY the JSON object described in your instructions."
+        content_blocks.append({"type": "text", "text": tail})
+
+    if session is not None:
+        # Cache the whole Round 1 prompt so later rounds read it back
+        content_blocks[-1] = {**content_blocks[-1], "cache_control": EPHEMERAL}
+
+    messages = [{"role": "user", "content": content_blocks}]
+    start = time.monotonic()
+    try:
+        parsed, text, usage = await _request(
+            client, agent_def, display_name, system_prompt, messages,
+            observe=not attached_images, prefix_warmer=prefix_warmer, deadline=deadline, hedger=hedger,
+        )
+    finally:
+        if prefix_warmer is not None:
+            prefix_warmer.release()
+
+    if call_stats is not None:
+        call_stats.record(round_num, "fresh", time.monotonic() - start, usage)
+    if session is not None:
+        session.record(round_num, content_blocks, text)
+
+    hypothesis = parsed.get("diagnosis_hypothesis", "N/A")
+    confidence = parsed.get("confidence", "N/A")
+    print(f"  ✅ {display_name} complete — {hypothesis[:80]} (confidence: {confidence})")
+    return parsed
+
+
+async def continue_specialist(
+    client: AsyncAnthropic,
+    agent_def: dict,
+    display_name: str,
+    session: SpecialistSession,
+    followup: str,
+    round_num: int,
+    deadline: Deadline | None = None,
+    hedger: Hedger | None = None,
+    call_stats: SpecialistCallStats | None = None,
+) -> dict:
+    """Answer a later round as a new turn of a specialist's session.
+
+    `followup` comes from build_followup_instructions(). The session's
+    system prompt and earlier turns are re-sent unchanged with cache
+    breakpoints, so they are read from the cache; the new turn and reply
+    are recorded in the session.
+    """
+    print(f"  ⏳ Launching {display_name} (continuing its Round {session.last_round} conversation)...")
+    content = [{"type": "text", "text": followup}]
+    messages = with_message_breakpoints(session.messages + [{"role": "user", "content": content}])
+
+    start = time.monotonic()
+    parsed, text, usage = await _request(
+        client, agent_def, display_name, session.system, messages, deadline=deadline, hedger=hedger,
     )
+    if call_stats is not None:
+        call_stats.record(round_num, "continued", time.monotonic() - start, usage)
+    session.record(round_num, content, text)
 
-    raw = extract_json(text_content)
-    agent_key = display_name.lower().replace(" ", "_")
-    parsed = normalize_specialist_output(raw, agent_key)
     hypothesis = parsed.get("diagnosis_hypothesis", "N/A")
     confidence = parsed.get("confidence", "N/A")
     print(f"  ✅ {display_name} complete — {hypothesis[:80]} (confidence: {confidence})")
     return parsed
+
+
+async def _request(
+    client: AsyncAnthropic,
+    agent_def: dict,
+    display_name: str,
+    system_prompt: str | list[dict],
+    messages: list[dict],
+    observe: bool = False,
+    prefix_warmer: PrefixWarmer | None = None,
+    deadline: Deadline | None = None,
+    hedger: Hedger | None = None,
+) -> tuple[dict, str, object]:
+    """Send one specialist request; return (parsed output, reply text, usage)."""
+
+    async def _attempt(client):
+        async with client.messages.stream(
+            model=agent_def["model"],
+            system=system_prompt,
+            messages=messages,
+            **limits(deadline, "specialist", 16_000, {"type": "adaptive"}),
+        ) as stream:
+            if prefix_warmer is not None:
+                # message_start arrives once the prompt has been processed
+                await anext(stream)
+                prefix_warmer.release()
+            response = await stream.get_final_message()
+
+        if observe:
+            _observe_prompt_size(system_prompt, messages[0]["content"], response.usage)
+
+        text_content = "".join(
+            block.text for block in response.content if block.type == "text"
+        )
+
+        raw = extract_json(text_content)
+        agent_key = display_name.lower().replace(" ", "_")
+        parsed = normalize_specialist_output(raw, agent_key)
+        # Preserve bias_acknowledgment if present in raw but lost in normalize
+        if "bias_acknowledgment" in raw and "bias_acknowledgment" not in parsed:
+            parsed["bias_acknowledgment"] = raw["bias_acknowledgment"]
+        return parsed, text_content, response.usage
+
+    return await within(deadline, "specialist", hedged(hedger, "specialist", client, _attempt))
+
+
+def _observe_prompt_size(system_prompt: str | list[dict], content_blocks: list[dict], usage):
+    """Feed a text-only specialist request's real size to the token estimator."""
+    if isinstance(system_prompt, str):
+        system_blocks = [{"text": system_prompt}]
+    else:
+        system_blocks = system_prompt
+    counts = merge_counts(
+        *(char_counts(b.get("text", "")) for b in system_blocks),
+        *(char_counts(b.get("text", "")) for b in content_blocks),
+    )
+    actual = (
+        (getattr(usage, "input_tokens", 0) or 0)
+        + (getattr(usage, "cache_read_input_tokens", 0) or 0)
+        + (getattr(usage, "cache_creation_input_tokens", 0) or 0)
+    )
+    get_estimator().observe(counts, actual)
@@ -0,0 +1,87 @@
+"""Specialist sessions — continue a specialist's own conversation in later rounds.
+
+A stateless Round 2+ call re-sends the whole case under a different system
+prompt, so the specialist re-reads (and the API re-processes) everything it
+already read in Round 1. With a session, a specialist's Round 1 request and
+reply are kept, and a later round appends one user turn — the peer digest,
+the Observer's feedback and the round rules — to that conversation.
+
+Round 1 marks the end of its prompt with a cache breakpoint, and each later
+request marks its new turn and the end of the previous one (see
+prompt_cache.with_message_breakpoints), so a continued round reads the case
+and the earlier turns from the cache. Cache entries live about five minutes,
+so a round that starts later than that pays a cache write instead.
+
+Sessions live on the run (ToolHandler, or the legacy pipeline) keyed by
+specialist, and are not checkpointed: after --resume a specialist starts a
+fresh conversation. SpecialistCallStats reports latency and input tokens per
+round for fresh (stateless) and continued calls.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class SpecialistSession:
+    specialist: str
+    model: str
+    system: str | list[dict]
+    role_override: str | None = None
+    focus: str = ""
+    messages: list[dict] = field(default_factory=list)
+    rounds: list[int] = field(default_factory=list)  # Rounds answered in this conversation
+
+    @property
+    def last_round(self) -> int | None:
+        return self.rounds[-1] if self.rounds else None
+
+    def record(self, round_num: int, user_content: list[dict], reply_text: str):
+        """Append one answered round (breakpoints are re-applied at send time)."""
+        content = [{k: v for k, v in block.items() if k != "cache_control"} for block in user_content]
+        self.messages.append({"role": "user", "content": content})
+        self.messages.append({"role": "assistant", "content": [{"type": "text", "text": reply_text}]})
+        self.rounds.append(round_num)
+
+    def continues(self, role_override: str | None, answered_round: int | None) -> bool:
+        """Whether a later round can continue this conversation.
+
+        Only with the same role, and only if its last answer is the one
+        recorded for the debate (`answered_round`, e.g. not an unused
+        speculative call).
+        """
+        return bool(self.messages) and self.role_override == role_override and self.last_round == answered_round
+
+
+class SpecialistCallStats:
+    """Latency and input tokens of specialist calls, per round and path."""
+
+    PATHS = ("fresh", "continued")
+
+    def __init__(self):
+        self.rounds: dict[int, dict[str, dict]] = {}
+
+    def record(self, round_num: int, path: str, elapsed: float, usage):
+        stats = self.rounds.setdefault(round_num, {}).setdefault(
+            path, {"calls": 0, "seconds": 0.0, "uncached": 0, "cache_read": 0, "cache_write": 0}
+        )
+        stats["calls"] += 1
+        stats["seconds"] += elapsed
+        stats["uncached"] += getattr(usage, "input_tokens", 0) or 0
+        stats["cache_read"] += getattr(usage, "cache_read_input_tokens", 0) or 0
+        stats["cache_write"] += getattr(usage, "cache_creation_input_tokens", 0) or 0
+
+    def summary(self) -> str:
+        if not self.rounds:
+            return "Specialist requests: none"
+        parts = []
+        for round_num, paths in sorted(self.rounds.items()):
+            for path in self.PATHS:
+                s = paths.get(path)
+                if not s:
+                    continue
+                total = s["uncached"] + s["cache_read"] + s["cache_write"]
+                parts.append(
+                    f"R{round_num} {path}: {s['calls']} call(s), {s['seconds'] / s['calls']:.1f}s mean, "
+                    f"{total:,} input tokens ({s['cache_read']:,} cached)"
+                )
+        return "Specialist requests: " + " | ".join(parts)
@@ -8,6 +8,8 @@ import json
 
 from anthropic import AsyncAnthropic
 
+from orchestrator.deadline import Deadline, limits, within
+from orchestrator.hedging import Hedger, hedged
 from orchestrator.utils import extract_json, update_visualization_state, OUTPUT_DIR
 
 
@@ -18,6 +20,8 @@ async def run_synthesis(
     r2_specialists: dict,
     r1_observer: dict,
     r2_observer: dict,
+    deadline: Deadline | None = None,
+    hedger: Hedger | None = None,
 ) -> dict:
     """Synthesize all debate rounds into a final diagnosis."""
     case_id = case_data.get("case_id", "unknown")
@@ -76,19 +80,21 @@ Respond with ONLY valid JSON — no markdown fences, no preamble. Use exactly th
         "Respond with ONLY the JSON object."
     )
 
-    async with client.messages.stream(
-        model="claude-opus-4-6",
-        max_tokens=16_000,
-        thinking={"type": "adaptive"},
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_message}],
-    ) as stream:
-        response = await stream.get_final_message()
-
-    text_content = "".join(
-        block.text for block in response.content if block.type == "text"
-    )
-    diagnosis = extract_json(text_content)
+    async def _attempt(client):
+        async with client.messages.stream(
+            model="claude-opus-4-6",
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_message}],
+            **limits(deadline, "synthesis", 16_000, {"type": "adaptive"}),
+        ) as stream:
+            response = await stream.get_final_message()
+
+        text_content = "".join(
+            block.text for block in response.content if block.type == "text"
+        )
+        return extract_json(text_content)
+
+    diagnosis = await within(deadline, "synthesis", hedged(hedger, "synthesis", client, _attempt))
 
     # Write to disk
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
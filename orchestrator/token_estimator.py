@@ -0,0 +1,181 @@
+"""Token estimator — character/token ratios learned from API usage.
+
+A flat ~4 characters per token is close for English prose but not for
+medical records: lab panels, vitals tables and abbreviations tokenize much
+denser, and JSON pays for its quotes and braces. This module splits text
+into paragraphs, classifies each as prose, JSON or numeric, and prices it
+with a per-type ratio.
+
+The ratios start from conservative priors and are refined from the `usage`
+of real responses: after a request whose text is known, observe() compares
+the estimate with the API's count and nudges the ratios of the content
+types that made up that request. Learned ratios persist in
+shared/token_ratios.json, so each run starts from what earlier runs learned.
+"""
+
+import json
+import math
+import re
+from pathlib import Path
+
+RATIOS_PATH = Path(__file__).resolve().parent.parent / "shared" / "token_ratios.json"
+
+CONTENT_TYPES = ("prose", "json", "numeric")
+DEFAULT_RATIOS = {"prose": 4.0, "json": 3.4, "numeric": 2.8}
+
+MIN_RATIO, MAX_RATIO = 1.0, 8.0
+MIN_OBSERVED_TOKENS = 200  # Smaller requests are dominated by framing overhead
+MAX_STEP = 2.0  # One observation can move a ratio by at most this factor
+
+_PARAGRAPH = re.compile(r"\n\s*\n")
+_DIGITS = re.compile(r"\d")
+_JSON_CHARS = re.compile(r'[{}\[\]":,]')
+
+
+def classify(text: str) -> str:
+    """Classify one paragraph as 'numeric', 'json' or 'prose'."""
+    if not text:
+        return "prose"
+    n = len(text)
+    if len(_DIGITS.findall(text)) / n >= 0.2:
+        return "numeric"
+    stripped = text.lstrip()
+    if stripped[:1] in ("{", "[") or len(_JSON_CHARS.findall(text)) / n >= 0.08:
+        return "json"
+    return "prose"
+
+
+def char_counts(text: str, kind: str | None = None) -> dict[str, int]:
+    """Characters per content type in `text` (one type if `kind` is given)."""
+    counts = dict.fromkeys(CONTENT_TYPES, 0)
+    if kind is not None:
+        counts[kind] += len(text)
+        return counts
+    for paragraph in _PARAGRAPH.split(text):
+        counts[classify(paragraph)] += len(paragraph)
+    return counts
+
+
+def merge_counts(*all_counts: dict[str, int]) -> dict[str, int]:
+    merged = dict.fromkeys(CONTENT_TYPES, 0)
+    for counts in all_counts:
+        for kind, chars in counts.items():
+            merged[kind] += chars
+    return merged
+
+
+class TokenEstimator:
+    """Estimates token counts with per-content-type ratios and learns them from usage."""
+
+    def __init__(self, path: Path | None = RATIOS_PATH, learning_rate: float = 0.3):
+        self.path = path
+        self.learning_rate = learning_rate
+        self.ratios = dict(DEFAULT_RATIOS)
+        self.observations = 0
+        self._load()
+
+    # ── Estimation ──────────────────────────────────────────────────────
+
+    def estimate_counts(self, counts: dict[str, int]) -> int:
+        return int(sum(chars / self.ratios[kind] for kind, chars in counts.items()))
+
+    def estimate(self, text: str, kind: str | None = None) -> int:
+        """Estimated tokens for `text`."""
+        return self.estimate_counts(char_counts(text, kind))
+
+    def truncate(self, text: str, max_tokens: int) -> tuple[str, bool]:
+        """Cut `text` to about `max_tokens` tokens, at a paragraph boundary where possible.
+
+        Returns (text, truncated).
+        """
+        if self.estimate(text) <= max_tokens:
+            return text, False
+        budget = float(max_tokens)
+        pos = 0
+        for match in [*_PARAGRAPH.finditer(text), None]:
+            end = match.start() if match else len(text)
+            paragraph = text[pos:end]
+            cost = len(paragraph) / self.ratios[classify(paragraph)]
+            if cost > budget:
+                cut = pos + int(budget * self.ratios[classify(paragraph)])
+                return text[:cut], True
+            budget -= cost
+            if match is None:
+                break
+            pos = match.end()
+        return text, False
+
+    # ── Learning ────────────────────────────────────────────────────────
+
+    def observe(self, counts: dict[str, int], actual_tokens: int) -> bool:
+        """Refine the ratios from one request whose content and real size are known.
+
+        `counts` are the characters per content type that were sent and
+        `actual_tokens` is what the API reported for them. Each type's ratio
+        moves in proportion to its share of the estimate. Returns True if
+        the observation was used.
+        """
+        predicted = self.estimate_counts(counts)
+        if predicted < MIN_OBSERVED_TOKENS or actual_tokens < MIN_OBSERVED_TOKENS:
+            return False
+
+        scale = min(max(actual_tokens / predicted, 1 / MAX_STEP), MAX_STEP)
+        for kind, chars in counts.items():
+            if not chars:
+                continue
+            share = (chars / self.ratios[kind]) / predicted
+            adjusted = self.ratios[kind] * math.exp(-self.learning_rate * share * math.log(scale))
+            self.ratios[kind] = min(max(adjusted, MIN_RATIO), MAX_RATIO)
+
+        self.observations += 1
+        self._save()
+        return True
+
+    def summary(self) -> str:
+        ratios = ", ".join(f"{kind} {self.ratios[kind]:.2f}" for kind in CONTENT_TYPES)
+        return f"Token estimator: chars/token {ratios} ({self.observations} observations)"
+
+    # ── Persistence ─────────────────────────────────────────────────────
+
+    def _load(self):
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return
+        for kind in CONTENT_TYPES:
+            ratio = data.get("ratios", {}).get(kind)
+            if isinstance(ratio, (int, float)) and MIN_RATIO <= ratio <= MAX_RATIO:
+                self.ratios[kind] = float(ratio)
+        self.observations = int(data.get("observations", 0))
+
+    def _save(self):
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps({
+                "ratios": self.ratios,
+                "observations": self.observations,
+            }, indent=2))
+        except OSError:
+            pass  # Learning is best-effort; estimates still work from memory
+
+
+_estimator: TokenEstimator | None = None
+
+
+def get_estimator() -> TokenEstimator:
+    """Process-wide estimator, loaded from shared/token_ratios.json on first use."""
+    global _estimator
+    if _estimator is None:
+        _estimator = TokenEstimator()
+    return _estimator
+
+
+def set_estimator(estimator: TokenEstimator):
+    """Replace the process-wide estimator, e.g. with TokenEstimator(path=None)
+    so benchmarks against a fake API neither read nor train the saved ratios."""
+    global _estimator
+    _estimator = estimator
@@ -1,29 +1,62 @@
 """
 Tool Definitions & Handler — Observer-as-Orchestrator tool dispatch
 ===================================================================
-Defines the 7 tools available to the Observer-orchestrator and a
+Defines the 8 tools available to the Observer-orchestrator and a
 ToolHandler class that dispatches tool calls to the appropriate
 backend caller functions.
 """
 
+import asyncio
+import hashlib
 import json
 from pathlib import Path
 
 from anthropic import AsyncAnthropic
 
 from orchestrator.specialist_caller import (
+    build_followup_instructions,
+    build_shared_specialist_system_prompt,
+    build_specialist_instructions,
     build_specialist_system_prompt,
     build_round_2_specialist_system_prompt,
     call_specialist,
+    continue_specialist,
 )
+from orchestrator.bias_prescreen import prescreen, summary_lines as prescreen_summary_lines
+from orchestrator.convergence import assess_round, tokenize
+from orchestrator.deadline import Deadline
+from orchestrator.diagnosis_lexicon import get_lexicon
+from orchestrator.hedging import Hedger
+from orchestrator.peer_context import (
+    DEFAULT_TOKEN_CAP as DEFAULT_PEER_CONTEXT_TOKENS,
+    PeerContextStats,
+    build_peer_context,
+    full_peer_context,
+)
+from orchestrator.prompt_cache import PrefixWarmer
+from orchestrator.quorum import QuorumPolicy, QuorumRound
+from orchestrator.scheduler import as_stage
+from orchestrator.specialist_session import SpecialistCallStats, SpecialistSession
 from orchestrator.synthesis_caller import run_synthesis
-from orchestrator.translator_caller import run_patient_translator
-from orchestrator.amender_caller import run_constitution_amender
+from orchestrator.token_estimator import get_estimator
+from orchestrator.translator_caller import generate_patient_explanation, run_patient_translator
+from orchestrator.amender_caller import propose_amendments, run_constitution_amender
 from orchestrator.utils import DEBATE_DIR, OUTPUT_DIR
 
 
 # ── Tool Definitions (Anthropic API format) ─────────────────────────────────
 
+SPECIALIST_TYPES = [
+    "neurologist",
+    "internist",
+    "cardiologist",
+    "geneticist",
+    "developmental_pediatrician",
+    "immunologist",
+    "endocrinologist",
+    "rheumatologist",
+]
+
 TOOL_DEFINITIONS = [
     {
         "name": "call_specialist",
@@ -32,23 +65,15 @@ TOOL_DEFINITIONS = [
             "an independent diagnostic assessment in Round 1, or a debate-informed "
             "revised assessment in Round 2+. The specialist writes structured JSON "
             "output including diagnosis_hypothesis, confidence, key_evidence, and "
-            "dissenting_considerations."
+            "dissenting_considerations. Repeating a call for the same specialist and "
+            "round returns the stored result; set force to run it again."
         ),
         "input_schema": {
             "type": "object",
             "properties": {
                 "specialist_type": {
                     "type": "string",
-                    "enum": [
-                        "neurologist",
-                        "internist",
-                        "cardiologist",
-                        "geneticist",
-                        "developmental_pediatrician",
-                        "immunologist",
-                        "endocrinologist",
-                        "rheumatologist",
-                    ],
+                    "enum": SPECIALIST_TYPES,
                     "description": (
                         "The type of specialist to call. Standard types map to agent "
                         "definition files in agents/. Non-standard types (geneticist, "
@@ -75,6 +100,15 @@ TOOL_DEFINITIONS = [
                         "Provide a full role description including expertise and focus areas."
                     ),
                 },
+                "force": {
+                    "type": "boolean",
+                    "description": (
+                        "Optional. Run the specialist again even if it already answered "
+                        "this round with the same or similar instructions. Without it, an "
+                        "identical repeat returns the stored result and a similar one "
+                        "returns the earlier summary instead of a new call."
+                    ),
+                },
             },
             "required": ["specialist_type", "round", "focus_instructions"],
         },
@@ -84,7 +118,11 @@ TOOL_DEFINITIONS = [
         "description": (
             "Read all specialist outputs from a given debate round and return them "
             "formatted for review. Use this after all specialists in a round have "
-            "completed to review their analyses before deciding next steps."
+            "completed to review their analyses before deciding next steps. The "
+            "result ends with a convergence score computed from the outputs "
+            "(hypothesis agreement, confidence spread, overlap, change since the "
+            "previous round) and a verdict: converged, near, or divergent, "
+            "followed by heuristic bias flags to verify."
         ),
         "input_schema": {
             "type": "object",
@@ -97,6 +135,51 @@ TOOL_DEFINITIONS = [
             "required": ["round_number"],
         },
     },
+    {
+        "name": "run_round",
+        "description": (
+            "Run a whole debate round in one step: call every listed specialist "
+            "concurrently (same behavior as call_specialist, including the "
+            "repeat/force rules), write the round files, then return the "
+            "review_round output for the round — specialist outputs, convergence "
+            "score and verdict, and heuristic bias flags. Prefer this over "
+            "separate call_specialist + review_round calls when you already know "
+            "the round's team."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "round": {
+                    "type": "integer",
+                    "description": "The debate round number (1 for independent analysis, 2+ for debate rounds).",
+                },
+                "specialists": {
+                    "type": "array",
+                    "description": "The specialists to call this round, one entry each.",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "specialist_type": {"type": "string", "enum": SPECIALIST_TYPES},
+                            "focus_instructions": {
+                                "type": "string",
+                                "description": "What this specialist should focus on (as in call_specialist).",
+                            },
+                            "role_override": {
+                                "type": "string",
+                                "description": "Optional. Role description for non-standard specialists.",
+                            },
+                            "force": {
+                                "type": "boolean",
+                                "description": "Optional. Run again even if already called with similar instructions.",
+                            },
+                        },
+                        "required": ["specialist_type", "focus_instructions"],
+                    },
+                },
+            },
+            "required": ["round", "specialists"],
+        },
+    },
     {
         "name": "trigger_synthesis",
         "description": (
@@ -169,11 +252,21 @@ TOOL_DEFINITIONS = [
         "description": (
             "Return a compressed summary of the entire debate state so far: all "
             "rounds, specialist outputs, observer analyses, and current diagnosis "
-            "status. Useful for orienting yourself or recovering context."
+            "status. Useful for orienting yourself or recovering context. Pass a "
+            "`ref` from a [CONTEXT COMPRESSED] summary to get that archived tool "
+            "result back in full instead."
         ),
         "input_schema": {
             "type": "object",
-            "properties": {},
+            "properties": {
+                "ref": {
+                    "type": "string",
+                    "description": (
+                        "Optional reference of a compressed tool result "
+                        "(as listed in the compression summary)."
+                    ),
+                },
+            },
             "required": [],
         },
     },
@@ -201,6 +294,36 @@ TOOL_DEFINITIONS = [
 ]
 
 
+# Tools whose handlers only write their own slot of the debate state, so
+# several of them from one Observer response can run at the same time. Every
+# other tool reads or advances shared pipeline state (review → synthesis →
+# translation → complete) and must run in the order the Observer emitted it.
+CONCURRENT_TOOLS = {"call_specialist"}
+
+
+# Focus used for speculative Round 1 calls launched before the Observer has
+# written its own focus instructions.
+SPECULATIVE_FOCUS = (
+    "Perform a complete independent diagnostic assessment of this case from "
+    "the perspective of your specialty. Identify the key clinical features, "
+    "red flags, and the diagnoses your domain can confirm or rule out."
+)
+
+# Roster used for speculative Round 1 when team_topology.json has no
+# active_specialists.
+DEFAULT_SPECULATIVE_ROSTER = ["neurologist", "internist", "cardiologist"]
+
+# Specialist calls for the same round whose instructions share this much
+# vocabulary (token Jaccard) are held as near-duplicates unless forced
+NEAR_DUPLICATE_SIMILARITY = 0.8
+
+
+def _instructions_key(focus_instructions: str, role_override: str | None) -> str:
+    """Hash of a specialist call's instructions, ignoring case and whitespace."""
+    text = " ".join(f"{focus_instructions}\n{role_override or ''}".lower().split())
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
 # ── Specialist Type → Agent File Mapping ────────────────────────────────────
 
 # Standard specialists that have their own agent .md files
@@ -233,6 +356,14 @@ class ToolHandler:
         agent_defs: dict,
         progress_reporter,
         context_manager,
+        prompt_layout: str = "standard",
+        deadline: Deadline | None = None,
+        quorum: QuorumPolicy | None = None,
+        hedger: Hedger | None = None,
+        on_convergence=None,
+        peer_context_tokens: int | None = DEFAULT_PEER_CONTEXT_TOKENS,
+        specialist_sessions: bool = False,
+        on_duplicate=None,
     ):
         self.client = client
         self.case_data = case_data
@@ -240,14 +371,84 @@ class ToolHandler:
         self.agent_defs = agent_defs
         self.progress_reporter = progress_reporter
         self.context_manager = context_manager
+        self.prompt_layout = prompt_layout
+        self.deadline = deadline  # Run-wide deadline passed to every model call
+        self.quorum = quorum  # When a batch of specialist calls may stop waiting
+        self.hedger = hedger  # Duplicates slow specialist/synthesis calls (opt-in)
+        # Called with each review_round's ConvergenceReport (e.g. LoopGuards.record_convergence)
+        self.on_convergence = on_convergence
+        # Called with "served" / "held" / "forced" for repeated specialist calls
+        # (e.g. LoopGuards.record_duplicate)
+        self.on_duplicate = on_duplicate
+        # Token cap for the Round 2+ peer digest (None = full prior-round JSON)
+        self.peer_context_tokens = peer_context_tokens
+        self.peer_context_stats = PeerContextStats()
+        # Round 2+ specialists continue their own conversation (opt-in);
+        # {specialist_type: SpecialistSession}, not checkpointed
+        self.specialist_sessions: dict[str, SpecialistSession] | None = {} if specialist_sessions else None
+        self.specialist_stats = SpecialistCallStats()
+
+        # Specialist batches that returned at quorum with calls still running,
+        # and the late results waiting to be shown to the Observer
+        self._stragglers: list[QuorumRound] = []
+        self._late_results: list[str] = []
+
+        # Shared-prefix layout: one cache warmer per round, so the first
+        # specialist of each round writes the case prefix for the others
+        self._prefix_warmers: dict[int, PrefixWarmer] = {}
 
         # Debate state tracking
         self.debate_state: dict[int, dict[str, dict]] = {}  # {round: {specialist: output}}
         self.observer_analyses: dict[int, dict] = {}  # {round: observer_output}
+        self.prescreen_results: dict[int, dict] = {}  # {round: local bias pre-screen}
+        self.convergence: dict[int, dict] = {}  # {round: ConvergenceReport.to_dict()}
+        # Completed specialist calls: {"specialist|round|instructions key": {..., "result"}}
+        self.specialist_memo: dict[str, dict] = {}
+        self._specialist_inflight: dict[str, asyncio.Task] = {}
+        self.duplicate_calls = {"served": 0, "held": 0, "forced": 0}
         self.diagnosis: dict | None = None
         self.translation: str | None = None
         self.amendments: list[dict] | None = None
 
+        # Post-synthesis prefetch: {"translation" | "amendments": Task}
+        self._prefetch: dict[str, asyncio.Task] = {}
+        self._prefetch_observations = ""  # Process observations the amender prefetch used
+
+        # Speculative Round 1 prefetch: {specialist_type: {"task", "input_tokens"}}
+        self._speculative: dict[str, dict] = {}
+        self.speculation_stats = {
+            "launched": 0,
+            "reused": 0,
+            "cancelled": 0,
+            "failed": 0,
+            "completed_unused": 0,
+            "wasted_input_tokens_est": 0,
+        }
+
+    def state_dict(self) -> dict:
+        """Debate progress for a checkpoint (see orchestrator.checkpoint)."""
+        return {
+            "debate_state": self.debate_state,
+            "observer_analyses": self.observer_analyses,
+            "prescreen_results": self.prescreen_results,
+            "convergence": self.convergence,
+            "specialist_memo": self.specialist_memo,
+            "diagnosis": self.diagnosis,
+            "translation": self.translation,
+            "amendments": self.amendments,
+        }
+
+    def load_state_dict(self, state: dict):
+        # JSON turns the integer round keys into strings
+        self.debate_state = {int(r): s for r, s in state.get("debate_state", {}).items()}
+        self.observer_analyses = {int(r): a for r, a in state.get("observer_analyses", {}).items()}
+        self.prescreen_results = {int(r): a for r, a in state.get("prescreen_results", {}).items()}
+        self.convergence = {int(r): c for r, c in state.get("convergence", {}).items()}
+        self.specialist_memo = state.get("specialist_memo", {})
+        self.diagnosis = state.get("diagnosis")
+        self.translation = state.get("translation")
+        self.amendments = state.get("amendments")
+
     async def handle(self, tool_name: str, tool_input: dict) -> str:
         """Dispatch a tool call and return the result as a string."""
         # Emit progress event for the frontend
@@ -256,6 +457,7 @@ class ToolHandler:
         dispatch = {
             "call_specialist": self._handle_call_specialist,
             "review_round": self._handle_review_round,
+            "run_round": self._handle_run_round,
             "trigger_synthesis": self._handle_trigger_synthesis,
             "trigger_translation": self._handle_trigger_translation,
             "trigger_amendments": self._handle_trigger_amendments,
@@ -281,11 +483,160 @@ class ToolHandler:
         focus_instructions = input["focus_instructions"]
         role_override = input.get("role_override")
 
+        # Repeats of a call this run already made (see _instructions_key)
+        memo_key = f"{specialist_type}|{round_num}|{_instructions_key(focus_instructions, role_override)}"
+        if input.get("force"):
+            if any(k.startswith(f"{specialist_type}|{round_num}|") for k in self.specialist_memo):
+                self._record_duplicate("forced")
+        else:
+            repeat = await self._repeat_specialist_call(
+                memo_key, specialist_type, round_num, focus_instructions, role_override
+            )
+            if repeat is not None:
+                return repeat
+
+        task = asyncio.ensure_future(
+            self._run_or_take_specialist(specialist_type, round_num, focus_instructions, role_override)
+        )
+        self._specialist_inflight[memo_key] = task
+        try:
+            result, speculative = await task
+        finally:
+            self._specialist_inflight.pop(memo_key, None)
+        self.specialist_memo[memo_key] = {
+            "focus_instructions": focus_instructions,
+            "role_override": role_override,
+            "result": result,
+        }
+
+        # Write output to disk and store in debate state
+        output_path = self._record_specialist_output(specialist_type, round_num, result)
+
+        # Return summarized output to keep context compact
+        summary = self.context_manager.summarize_specialist_output(result)
+        note = ""
+        if speculative:
+            note = (
+                "(Speculative answer: served from the Round 1 prefetch, which ran "
+                "before triage with a general focus. Call again with "
+                "focus_instructions for a targeted analysis.)\n"
+            )
+        return (
+            f"Specialist '{specialist_type}' Round {round_num} complete.\n"
+            f"{note}"
+            f"Output summary:\n{summary}\n"
+            f"(Full output saved to {output_path})"
+        )
+
+    async def _run_or_take_specialist(
+        self,
+        specialist_type: str,
+        round_num: int,
+        focus_instructions: str,
+        role_override: str | None,
+    ) -> tuple[dict, bool]:
+        """Run a specialist, or take its speculative Round 1 result; returns (result, speculative).
+
+        The speculative result ran with SPECULATIVE_FOCUS, so it only stands
+        in for a call without focus instructions of its own (or with that
+        same focus); otherwise it is discarded and the specialist runs fresh.
+        """
+        if round_num == 1 and not role_override and specialist_type in self._speculative:
+            if focus_instructions and focus_instructions.strip() != SPECULATIVE_FOCUS:
+                print(f"  [SPECULATIVE] {specialist_type}: the Observer gave its own focus — calling fresh")
+                self._discard_speculative(specialist_type, self._speculative.pop(specialist_type))
+            else:
+                result = await self._take_speculative(specialist_type)
+                if result is not None:
+                    return result, True
+        result = await self._run_specialist(specialist_type, round_num, focus_instructions, role_override)
+        return result, False
+
+    async def _repeat_specialist_call(
+        self,
+        memo_key: str,
+        specialist_type: str,
+        round_num: int,
+        focus_instructions: str,
+        role_override: str | None,
+    ) -> str | None:
+        """The tool result for a repeated call_specialist, or None to run it.
+
+        An identical call (same specialist, round and instructions) returns
+        the stored result, waiting for it if that call is still running. A
+        call whose instructions are nearly the same as an earlier one's for
+        the same specialist and round returns that call's summary and asks
+        for force=true to run it again.
+        """
+        if memo_key in self.specialist_memo or memo_key in self._specialist_inflight:
+            if memo_key in self.specialist_memo:
+                result = self.specialist_memo[memo_key]["result"]
+            else:
+                result, _ = await asyncio.shield(self._specialist_inflight[memo_key])
+            self._record_duplicate("served")
+            print(f"  [MEMO] {specialist_type} (Round {round_num}): identical call — stored result returned")
+            return (
+                f"Specialist '{specialist_type}' Round {round_num} was already called with these "
+                f"exact instructions — returning the stored result (no new call was made).\n"
+                f"Output summary:\n{self.context_manager.summarize_specialist_output(result)}"
+            )
+
+        text = set(tokenize(f"{focus_instructions} {role_override or ''}"))
+        for key, entry in self.specialist_memo.items():
+            if not key.startswith(f"{specialist_type}|{round_num}|"):
+                continue
+            earlier = set(tokenize(f"{entry['focus_instructions']} {entry['role_override'] or ''}"))
+            similarity = len(text & earlier) / len(text | earlier) if text | earlier else 1.0
+            if similarity >= NEAR_DUPLICATE_SIMILARITY:
+                self._record_duplicate("held")
+                print(
+                    f"  [MEMO] {specialist_type} (Round {round_num}): near-duplicate call held "
+                    f"(instructions {similarity:.0%} similar)"
+                )
+                return (
+                    f"NOT RUN: Specialist '{specialist_type}' already answered Round {round_num} with "
+                    f"instructions {similarity:.0%} similar to these. Its output:\n"
+                    f"{self.context_manager.summarize_specialist_output(entry['result'])}\n"
+                    f"If the new instructions really call for a new analysis, call "
+                    f"call_specialist again with force=true."
+                )
+        return None
+
+    def _record_duplicate(self, kind: str):
+        self.duplicate_calls[kind] += 1
+        if self.on_duplicate is not None:
+            self.on_duplicate(kind)
+
+    async def _run_specialist(
+        self,
+        specialist_type: str,
+        round_num: int,
+        focus_instructions: str,
+        role_override: str | None,
+    ) -> dict:
+        """Build the prompt for one specialist call and run it."""
         # 1. Determine agent definition and display name
         agent_file, agent_def, display_name = self._resolve_agent(
             specialist_type, role_override
         )
 
+        if self.specialist_sessions is not None:
+            session = self.specialist_sessions.get(specialist_type)
+            answered = max(
+                (r for r, outputs in self.debate_state.items() if r < round_num and specialist_type in outputs),
+                default=None,
+            )
+            if round_num > 1 and session is not None and session.continues(role_override, answered):
+                return await self._continue_specialist(
+                    session, specialist_type, round_num, focus_instructions, agent_def, display_name
+                )
+
+        if self.prompt_layout == "shared-prefix":
+            return await self._run_specialist_shared_prefix(
+                specialist_type, round_num, focus_instructions, role_override,
+                agent_def, display_name,
+            )
+
         # 2. Build the system prompt
         if round_num == 1:
             system_prompt = build_specialist_system_prompt(
@@ -312,32 +663,120 @@ class ToolHandler:
                 case_json += "\n\n" + prior_context
 
         # 4. Call the specialist
-        result = await call_specialist(
+        return await call_specialist(
             client=self.client,
             agent_def=agent_def,
             display_name=display_name,
             system_prompt=system_prompt,
             case_json=case_json,
+            deadline=self.deadline,
+            hedger=self.hedger,
+            session=self._start_session(specialist_type, agent_def, system_prompt, role_override, focus_instructions),
+            round_num=round_num,
+            call_stats=self.specialist_stats,
         )
 
-        # 5. Write output to disk
+    async def _run_specialist_shared_prefix(
+        self,
+        specialist_type: str,
+        round_num: int,
+        focus_instructions: str,
+        role_override: str | None,
+        agent_def: dict,
+        display_name: str,
+    ) -> dict:
+        """Run a specialist with the cacheable constitution → case → role layout."""
+        prior_context = ""
+        if round_num > 1:
+            prior_context = self._build_prior_round_context(specialist_type, round_num)
+
+        warmer = self._prefix_warmers.setdefault(round_num, PrefixWarmer())
+        system_prompt = build_shared_specialist_system_prompt(self.constitution)
+        return await call_specialist(
+            client=self.client,
+            agent_def=agent_def,
+            display_name=display_name,
+            system_prompt=system_prompt,
+            case_json=json.dumps(self.case_data, indent=2),
+            instructions=build_specialist_instructions(
+                agent_def=agent_def,
+                display_name=display_name,
+                role_override=role_override,
+                focus=focus_instructions,
+                round_num=round_num,
+                prior_context=prior_context,
+            ),
+            prefix_warmer=warmer,
+            deadline=self.deadline,
+            hedger=self.hedger,
+            session=self._start_session(specialist_type, agent_def, system_prompt, role_override, focus_instructions),
+            round_num=round_num,
+            call_stats=self.specialist_stats,
+        )
+
+    def _start_session(
+        self,
+        specialist_type: str,
+        agent_def: dict,
+        system_prompt: str | list[dict],
+        role_override: str | None,
+        focus_instructions: str,
+    ) -> SpecialistSession | None:
+        """A new session for a fresh specialist call (None when sessions are off)."""
+        if self.specialist_sessions is None:
+            return None
+        session = SpecialistSession(
+            specialist=specialist_type,
+            model=agent_def["model"],
+            system=system_prompt,
+            role_override=role_override,
+            focus=focus_instructions,
+        )
+        self.specialist_sessions[specialist_type] = session
+        return session
+
+    async def _continue_specialist(
+        self,
+        session: SpecialistSession,
+        specialist_type: str,
+        round_num: int,
+        focus_instructions: str,
+        agent_def: dict,
+        display_name: str,
+    ) -> dict:
+        """Answer a Round 2+ call as a new turn of the specialist's session."""
+        # Its own earlier analyses are already in the conversation
+        prior_context = self._build_prior_round_context(specialist_type, round_num, include_own=False)
+        followup = build_followup_instructions(
+            display_name,
+            round_num,
+            prior_context,
+            focus=focus_instructions if focus_instructions != session.focus else None,
+        )
+        session.focus = focus_instructions
+        return await continue_specialist(
+            client=self.client,
+            agent_def=agent_def,
+            display_name=display_name,
+            session=session,
+            followup=followup,
+            round_num=round_num,
+            deadline=self.deadline,
+            hedger=self.hedger,
+            call_stats=self.specialist_stats,
+        )
+
+    def _record_specialist_output(self, specialist_type: str, round_num: int, result: dict) -> Path:
+        """Write a specialist output to its round file and the debate state."""
         round_dir = DEBATE_DIR / f"round_{round_num}"
         round_dir.mkdir(parents=True, exist_ok=True)
         output_path = round_dir / f"{specialist_type}.json"
         output_path.write_text(json.dumps(result, indent=2))
 
-        # 6. Store in debate state
         if round_num not in self.debate_state:
             self.debate_state[round_num] = {}
         self.debate_state[round_num][specialist_type] = result
-
-        # 7. Return summarized output to keep context compact
-        summary = self.context_manager.summarize_specialist_output(result)
-        return (
-            f"Specialist '{specialist_type}' Round {round_num} complete.\n"
-            f"Output summary:\n{summary}\n"
-            f"(Full output saved to {output_path})"
-        )
+        return output_path
 
     async def _handle_review_round(self, input: dict) -> str:
         """Read all specialist outputs for a round and return them formatted."""
@@ -345,15 +784,7 @@ class ToolHandler:
         round_dir = DEBATE_DIR / f"round_{round_number}"
 
         # Collect outputs from disk (authoritative source)
-        outputs = {}
-        if round_dir.exists():
-            for json_file in sorted(round_dir.glob("*.json")):
-                try:
-                    data = json.loads(json_file.read_text())
-                    specialist_name = json_file.stem
-                    outputs[specialist_name] = data
-                except (json.JSONDecodeError, ValueError) as e:
-                    outputs[json_file.stem] = {"error": f"Failed to parse: {e}"}
+        outputs = self._read_round_outputs(round_number)
 
         if not outputs:
             return f"No specialist outputs found for Round {round_number} in {round_dir}."
@@ -406,22 +837,106 @@ class ToolHandler:
             lines.append(f"- Confidence range: {min(confidences):.2f} - {max(confidences):.2f}")
             lines.append(f"- Mean confidence: {sum(confidences) / len(confidences):.2f}")
 
-        # Check for convergence
+        # Check for convergence (scored locally, see orchestrator.convergence)
+        previous = self._read_round_outputs(round_number - 1) if round_number > 1 else None
+        report = assess_round(outputs, round_number, previous)
+        self.convergence[round_number] = report.to_dict()
+        if self.on_convergence is not None:
+            self.on_convergence(report)
         unique_hypotheses = set(h.lower().strip() for h in hypotheses if h != "N/A")
-        lines.append(f"- Unique hypotheses: {len(unique_hypotheses)}")
-        if len(unique_hypotheses) == 1:
-            lines.append("- **STATUS: Full convergence** — all specialists agree")
-        elif len(unique_hypotheses) <= 2:
+        distinct = set(get_lexicon().canonical(h).lower() for h in unique_hypotheses)
+        lines.append(
+            f"- Unique hypotheses: {len(unique_hypotheses)} as written, "
+            f"{len(distinct)} after canonicalizing diagnosis names"
+        )
+        lines.append("")
+        lines.append("### Convergence")
+        lines.extend(report.lines())
+        if report.verdict == "converged":
+            lines.append("- **STATUS: Converged** — specialists agree; another round is unlikely to change the outcome")
+        elif report.verdict == "near":
             lines.append("- **STATUS: Near convergence** — minor disagreement remains")
         else:
             lines.append("- **STATUS: Divergent** — significant disagreement across specialists")
 
+        # Heuristic bias flags (see orchestrator.bias_prescreen), kept apart
+        # from the Observer's own analyses; synthesis sees them labeled local
+        screened = prescreen(outputs, self.case_data, round_number, previous)
+        self.prescreen_results[round_number] = screened
+        lines.append("")
+        lines.append("### Bias Pre-screen (automated — verify before acting)")
+        lines.extend(prescreen_summary_lines(screened))
+
+        return "\n".join(lines)
+
+    async def _handle_run_round(self, input: dict) -> str:
+        """Call a round's specialists concurrently, then review the round."""
+        round_num = input["round"]
+        calls = {}  # {specialist_type: call_specialist input}
+        skipped = []  # A specialist has one output (and round file) per round
+        for spec in input.get("specialists") or []:
+            if spec["specialist_type"] in calls:
+                skipped.append(spec["specialist_type"])
+            else:
+                calls[spec["specialist_type"]] = {**spec, "round": round_num}
+        if not calls:
+            return "ERROR: run_round needs at least one specialist."
+
+        print(f"  [ROUND] Round {round_num}: running {len(calls)} specialist(s) concurrently: {', '.join(calls)}")
+        for tool_input in calls.values():
+            self.progress_reporter.emit_tool_progress("call_specialist", tool_input)
+        if self.quorum is None or len(calls) < 2:
+            results = await asyncio.gather(
+                *(self._handle_call_specialist(tool_input) for tool_input in calls.values()),
+                return_exceptions=True,
+            )
+            finished = dict(zip(calls, results))
+        else:
+            finished = await self.quorum_round(calls).run(
+                {key: self._handle_call_specialist(tool_input) for key, tool_input in calls.items()}
+            )
+
+        lines = [f"## Round {round_num} calls"]
+        for key, tool_input in calls.items():
+            result = finished.get(key)
+            if key not in finished:
+                result = self.pending_result(tool_input)
+            elif isinstance(result, Exception):
+                result = f"ERROR in call_specialist ({tool_input['specialist_type']}): {type(result).__name__}: {result}"
+            # A completed call is covered by the review below; anything else
+            # (held, still running, failed) is shown in full
+            first = result.splitlines()[0] if result else ""
+            lines.append(f"- {first}" if first.endswith(" complete.") else f"- {result}")
+        for specialist_type in skipped:
+            lines.append(f"- NOT RUN: '{specialist_type}' was listed more than once; only its first entry ran.")
+        lines.append("")
+
+        self.progress_reporter.emit_tool_progress("review_round", {"round_number": round_num})
+        lines.append(await self._handle_review_round({"round_number": round_num}))
         return "\n".join(lines)
 
+    @staticmethod
+    def _read_round_outputs(round_number: int) -> dict[str, dict]:
+        """A round's specialist outputs from disk, keyed by file stem."""
+        round_dir = DEBATE_DIR / f"round_{round_number}"
+        outputs = {}
+        if round_dir.exists():
+            for json_file in sorted(round_dir.glob("*.json")):
+                try:
+                    data = json.loads(json_file.read_text())
+                    specialist_name = json_file.stem
+                    outputs[specialist_name] = data
+                except (json.JSONDecodeError, ValueError) as e:
+                    outputs[json_file.stem] = {"error": f"Failed to parse: {e}"}
+        return outputs
+
     async def _handle_trigger_synthesis(self, input: dict) -> str:
         """Trigger the Chief Diagnostician to produce a final diagnosis."""
         convergence_assessment = input["convergence_assessment"]
 
+        # Synthesis sees every specialist, including the round's stragglers
+        await self.drain_stragglers()
+
         # Build r1 and r2 specialist dicts for the synthesis caller.
         # The synthesis caller expects exactly r1_specialists, r2_specialists,
         # r1_observer, and r2_observer. If we ran more than 2 rounds, we map:
@@ -451,6 +966,13 @@ class ToolHandler:
             r2_observer = dict(r2_observer)
             r2_observer["convergence_assessment"] = convergence_assessment
 
+        # The local pre-screen goes alongside, labeled as such, never as the
+        # Observer's own findings
+        if self.prescreen_results.get(r1_round) and isinstance(r1_observer, dict):
+            r1_observer = {**r1_observer, "local_prescreen": self.prescreen_results[r1_round]}
+        if self.prescreen_results.get(r2_round) and isinstance(r2_observer, dict):
+            r2_observer = {**r2_observer, "local_prescreen": self.prescreen_results[r2_round]}
+
         print(f"\n  Observer convergence assessment: {convergence_assessment[:200]}")
 
         # Call synthesis
@@ -461,8 +983,14 @@ class ToolHandler:
             r2_specialists=r2_specialists,
             r1_observer=r1_observer,
             r2_observer=r2_observer,
+            deadline=self.deadline,
+            hedger=self.hedger,
         )
 
+        # Translation and amendments only need the diagnosis and observer
+        # analyses — start them now, while the Observer takes its next turns.
+        self._start_post_synthesis_prefetch(convergence_assessment)
+
         # Return summary
         primary = self.diagnosis.get("primary_diagnosis", "N/A")
         confidence = self.diagnosis.get("confidence", "N/A")
@@ -500,10 +1028,13 @@ class ToolHandler:
 
         _guidance = input.get("translation_guidance", "")
 
+        explanation = await self._take_prefetch("translation")
         self.translation = await run_patient_translator(
             client=self.client,
             case_data=self.case_data,
             diagnosis=self.diagnosis,
+            explanation=explanation,
+            deadline=self.deadline,
         )
 
         char_count = len(self.translation) if self.translation else 0
@@ -525,28 +1056,15 @@ class ToolHandler:
 
         _process_observations = input.get("process_observations", "")
 
-        # Build observer analyses for r1 and r2.
-        # Same mapping logic as synthesis: first round and latest round.
-        sorted_rounds = sorted(self.observer_analyses.keys()) if self.observer_analyses else []
-
-        if sorted_rounds:
-            r1_round = sorted_rounds[0]
-            r2_round = sorted_rounds[-1] if len(sorted_rounds) > 1 else sorted_rounds[0]
-            r1_observer = self.observer_analyses.get(r1_round, {})
-            r2_observer = self.observer_analyses.get(r2_round, {})
-        else:
-            # In agentic mode, the Observer's analyses are embedded in its
-            # reasoning rather than stored as separate JSON. Provide context
-            # from process_observations instead.
-            r1_observer = {
-                "note": "Observer analysis embedded in orchestrator reasoning (agentic mode)",
-                "process_observations": _process_observations,
-            }
-            r2_observer = {
-                "note": "Observer analysis embedded in orchestrator reasoning (agentic mode)",
-                "process_observations": _process_observations,
-            }
+        r1_observer, r2_observer = self._amender_observer_inputs(_process_observations)
 
+        # The prefetch only stands in for a call with the same observations
+        stale = self._prefetch.get("amendments")
+        if stale is not None and _process_observations and _process_observations != self._prefetch_observations:
+            print("  [PREFETCH] Discarding the amendments prefetch — the Observer gave its own process observations")
+            stale.cancel()
+            del self._prefetch["amendments"]
+        proposal = await self._take_prefetch("amendments")
         self.amendments = await run_constitution_amender(
             client=self.client,
             agent_defs=self.agent_defs,
@@ -555,6 +1073,8 @@ class ToolHandler:
             r1_observer=r1_observer,
             r2_observer=r2_observer,
             diagnosis=self.diagnosis,
+            proposal=proposal,
+            deadline=self.deadline,
         )
 
         count = len(self.amendments) if self.amendments else 0
@@ -571,7 +1091,14 @@ class ToolHandler:
         return "\n".join(lines)
 
     async def _handle_get_debate_state(self, input: dict) -> str:
-        """Return a compressed summary of the entire debate state."""
+        """Return a compressed summary of the entire debate state, or one archived result."""
+        ref = input.get("ref")
+        if ref:
+            archived = self.context_manager.load_archived(ref)
+            if archived is None:
+                return f"No archived result found for ref '{ref}'."
+            return archived
+
         lines = ["## Debate State Summary\n"]
 
         # Rounds and specialist outputs
@@ -645,6 +1172,206 @@ class ToolHandler:
             f"Amendments: {completion_record['amendments_proposed']}"
         )
 
+    # ── Post-Synthesis Prefetch ─────────────────────────────────────────────
+
+    def _start_post_synthesis_prefetch(self, process_observations: str):
+        """Start the translator and amender model calls in the background.
+
+        Only the model calls run here (no files are written), so an unused
+        prefetch can be cancelled without side effects. The amender uses the
+        synthesis convergence assessment as its process observations; if
+        trigger_amendments later brings different ones, the prefetched
+        proposal is discarded and the amender runs on the Observer's input.
+        """
+        self._cancel_prefetch()
+        self._prefetch_observations = process_observations
+        r1_observer, r2_observer = self._amender_observer_inputs(process_observations)
+        print("  [PREFETCH] Starting translation and amendments in the background")
+        self._prefetch["translation"] = asyncio.create_task(
+            generate_patient_explanation(
+                self.client, self.case_data, self.diagnosis, deadline=self.deadline,
+            )
+        )
+        self._prefetch["amendments"] = asyncio.create_task(
+            propose_amendments(
+                self.client, self.agent_defs, self.case_data, self.constitution,
+                r1_observer, r2_observer, self.diagnosis, deadline=self.deadline,
+            )
+        )
+
+    async def _take_prefetch(self, name: str):
+        """Await a prefetched result, or return None so the caller runs it fresh."""
+        task = self._prefetch.pop(name, None)
+        if task is None:
+            return None
+        try:
+            return await task
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"  [PREFETCH] {name} prefetch failed ({type(e).__name__}) — running fresh")
+            return None
+
+    def _cancel_prefetch(self):
+        for task in self._prefetch.values():
+            task.cancel()
+        self._prefetch.clear()
+
+    async def aclose(self):
+        """Cancel any background work the Observer never claimed.
+
+        Called once the loop exits, so unused prefetches (speculative
+        specialists, translation, amendments) do not outlive the run.
+        """
+        tasks = list(self._prefetch.values()) + [e["task"] for e in self._speculative.values()]
+        if self._speculative:
+            self.settle_speculation()
+        self._cancel_prefetch()
+        for gatherer in self._stragglers:
+            gatherer.cancel()
+        self._stragglers.clear()
+        pending = [t for t in tasks if not t.done()]
+        if pending:
+            print(f"  [PREFETCH] Cancelling {len(pending)} unused background call(s)")
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # ── Round quorum ────────────────────────────────────────────────────────
+
+    def quorum_round(self, tool_inputs: dict) -> QuorumRound:
+        """A QuorumRound for one batch of call_specialist calls ({key: tool_input}).
+
+        Stragglers keep running after the batch returns. Their output is
+        recorded in the debate state and round file as usual (flagged
+        `late_arrival`), and their tool result is queued for the Observer
+        (see take_late_results).
+        """
+        def _on_late(key, result):
+            tool_input = tool_inputs[key]
+            specialist_type, round_num = tool_input["specialist_type"], tool_input["round"]
+            output = self.debate_state.get(round_num, {}).get(specialist_type)
+            if output is not None:
+                self._record_specialist_output(specialist_type, round_num, {**output, "late_arrival": True})
+            print(f"  [QUORUM] Late result merged: {specialist_type} (Round {round_num})")
+            self._late_results.append(
+                f"[LATE RESULT] Specialist '{specialist_type}' Round {round_num} finished after "
+                f"you received the rest of its batch. It is now in the debate state.\n{result}"
+            )
+
+        rounds = sorted({tool_input.get("round", 1) for tool_input in tool_inputs.values()})
+        gatherer = QuorumRound(self.quorum, on_late=_on_late, label=f"Round {'/'.join(map(str, rounds))} batch")
+        self._stragglers.append(gatherer)
+        return gatherer
+
+    @staticmethod
+    def pending_result(tool_input: dict) -> str:
+        """Tool result for a call still running when its batch reached quorum."""
+        return (
+            f"Specialist '{tool_input.get('specialist_type')}' Round {tool_input.get('round')} "
+            "is still running (the batch reached its quorum without it). Its result "
+            "will be merged into the debate state and reported to you as a "
+            "[LATE RESULT] when it arrives."
+        )
+
+    def take_late_results(self) -> list[str]:
+        """Late results that arrived since the last call, for the Observer's next message."""
+        results, self._late_results = self._late_results, []
+        return results
+
+    async def drain_stragglers(self):
+        """Wait for every straggler still running."""
+        for gatherer in self._stragglers:
+            await gatherer.drain()
+        self._stragglers = [g for g in self._stragglers if g.pending]
+
+    # ── Speculative Round 1 ─────────────────────────────────────────────────
+
+    def start_speculative_round_1(self, roster: list[str]) -> list[str]:
+        """Launch Round 1 specialist calls before the Observer has picked its team.
+
+        Runs while the Observer's triage turn is in flight. Each call uses the
+        specialist's default role and SPECULATIVE_FOCUS; results are only
+        written to the debate state if the Observer later calls the same
+        specialist for Round 1 without focus instructions of its own (see
+        _run_or_take_specialist). Anything left over is cancelled by
+        settle_speculation(). Returns the specialists launched.
+        """
+        known = set(_STANDARD_AGENT_MAP) | set(_OVERRIDE_AGENT_MAP)
+        for specialist_type in roster:
+            if specialist_type not in known or specialist_type in self._speculative:
+                continue
+            print(f"  [SPECULATIVE] Prefetching Round 1 {specialist_type}")
+            task = asyncio.create_task(as_stage(
+                "speculative", self._run_specialist(specialist_type, 1, SPECULATIVE_FOCUS, None),
+            ))
+            input_tokens = (
+                get_estimator().estimate(self.constitution)
+                + get_estimator().estimate(json.dumps(self.case_data, indent=2))
+            )
+            self._speculative[specialist_type] = {"task": task, "input_tokens": input_tokens}
+            self.speculation_stats["launched"] += 1
+        return list(self._speculative)
+
+    async def _take_speculative(self, specialist_type: str) -> dict | None:
+        """Claim a prefetched Round 1 result, waiting for it if still in flight.
+
+        Returns None if nothing was prefetched for this specialist or the
+        prefetch failed, in which case the caller makes a fresh call.
+        """
+        entry = self._speculative.pop(specialist_type, None)
+        if entry is None:
+            return None
+        try:
+            result = await entry["task"]
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.speculation_stats["failed"] += 1
+            print(f"  [SPECULATIVE] {specialist_type} prefetch failed ({type(e).__name__}) — calling fresh")
+            return None
+        self.speculation_stats["reused"] += 1
+        print(f"  [SPECULATIVE] Reusing prefetched Round 1 {specialist_type}")
+        return result
+
+    def settle_speculation(self) -> dict:
+        """Cancel prefetches the Observer did not pick and report the waste.
+
+        Completed-but-unused calls were paid for in full; cancelled in-flight
+        calls were billed for at least their input. Both are counted in the
+        wasted input tokens, as estimated by the token estimator when the
+        prefetch was launched. Prefetches that raised are counted as failed
+        and left out of the estimate.
+        """
+        for specialist_type, entry in self._speculative.items():
+            self._discard_speculative(specialist_type, entry)
+        self._speculative.clear()
+        return self.speculation_stats
+
+    def _discard_speculative(self, specialist_type: str, entry: dict):
+        """Cancel one unused prefetch (if still running) and count it."""
+        task = entry["task"]
+        if not task.done():
+            task.cancel()
+            self.speculation_stats["cancelled"] += 1
+        elif task.cancelled():
+            self.speculation_stats["cancelled"] += 1
+        elif task.exception() is not None:
+            self.speculation_stats["failed"] += 1
+            print(f"  [SPECULATIVE] Unused prefetch {specialist_type} had failed ({type(task.exception()).__name__})")
+            return
+        else:
+            self.speculation_stats["completed_unused"] += 1
+        self.speculation_stats["wasted_input_tokens_est"] += entry["input_tokens"]
+        print(f"  [SPECULATIVE] Discarding unused prefetch: {specialist_type}")
+
+    def speculation_summary(self) -> str:
+        stats = self.speculation_stats
+        return (
+            f"Speculative R1: {stats['reused']}/{stats['launched']} reused | "
+            f"{stats['cancelled']} cancelled | {stats['failed']} failed | "
+            f"{stats['completed_unused']} completed unused | "
+            f"~{stats['wasted_input_tokens_est']:,} input tokens wasted"
+        )
+
     # ── Internal Helpers ────────────────────────────────────────────────────
 
     def _resolve_agent(
@@ -688,57 +1415,56 @@ class ToolHandler:
             )
         return agent_file, agent_def, display_name
 
-    def _build_prior_round_context(self, specialist_type: str, current_round: int) -> str:
-        """Build prior round context for Round 2+ specialists.
+    def _amender_observer_inputs(self, process_observations: str) -> tuple[dict, dict]:
+        """Pick the (r1_observer, r2_observer) inputs for the Constitution Amender.
 
-        Includes:
-        - This specialist's own prior output (if any)
-        - All other specialists' prior outputs
-        - Observer analyses from prior rounds
+        Same mapping as synthesis: first round and latest round.
         """
-        parts = []
-
-        # Gather all prior rounds
-        prior_rounds = sorted(r for r in self.debate_state.keys() if r < current_round)
-
-        if not prior_rounds:
-            return ""
+        sorted_rounds = sorted(self.observer_analyses.keys()) if self.observer_analyses else []
 
-        # This specialist's own prior output
-        for r in prior_rounds:
-            own_output = self.debate_state.get(r, {}).get(specialist_type)
-            if own_output:
-                parts.append(
-                    f"## Your Round {r} Analysis\n"
-                    f"```json\n{json.dumps(own_output, indent=2)}\n```"
-                )
+        if sorted_rounds:
+            r1_round = sorted_rounds[0]
+            r2_round = sorted_rounds[-1] if len(sorted_rounds) > 1 else sorted_rounds[0]
+            return (
+                self.observer_analyses.get(r1_round, {}),
+                self.observer_analyses.get(r2_round, {}),
+            )
 
-        # Other specialists' prior outputs (from the most recent prior round)
-        latest_prior = prior_rounds[-1]
-        other_outputs = {
-            name: output
-            for name, output in self.debate_state.get(latest_prior, {}).items()
-            if name != specialist_type
+        # In agentic mode, the Observer's analyses are embedded in its
+        # reasoning rather than stored as separate JSON. Provide context
+        # from process_observations instead.
+        note = {
+            "note": "Observer analysis embedded in orchestrator reasoning (agentic mode)",
+            "process_observations": process_observations,
         }
-        if other_outputs:
-            parts.append(f"## Other Specialists' Round {latest_prior} Analyses")
-            for name, output in other_outputs.items():
-                display = name.replace("_", " ").title()
-                parts.append(
-                    f"### {display}\n"
-                    f"```json\n{json.dumps(output, indent=2)}\n```"
-                )
+        return note, dict(note)
 
-        # Observer analyses from prior rounds
-        for r in prior_rounds:
-            obs = self.observer_analyses.get(r)
-            if obs:
-                parts.append(
-                    f"## Observer Round {r} Bias Report\n"
-                    f"```json\n{json.dumps(obs, indent=2)}\n```"
-                )
+    def _build_prior_round_context(
+        self, specialist_type: str, current_round: int, include_own: bool = True
+    ) -> str:
+        """Build prior round context for Round 2+ specialists.
+
+        A compact digest of this specialist's previous analysis, its peers'
+        new or contradicting evidence and the Observer's findings (see
+        orchestrator.peer_context), or every prior output as JSON when
+        peer_context_tokens is None.
+        """
+        rounds = {r: s for r, s in self.debate_state.items() if r < current_round}
+        if not rounds:
+            return ""
+        if self.peer_context_tokens is None:
+            return full_peer_context(specialist_type, rounds, self.observer_analyses, include_own)
 
-        return "\n\n".join(parts)
+        context = build_peer_context(
+            specialist_type, rounds, self.observer_analyses,
+            token_cap=self.peer_context_tokens, include_own=include_own,
+        )
+        self.peer_context_stats.record(current_round, context)
+        print(
+            f"  [PEER] {specialist_type} (Round {current_round}): ~{context.tokens:,} tokens of peer context "
+            f"(~{context.full_tokens:,} as full JSON{', capped' if context.truncated else ''})"
+        )
+        return context.text
 
     def store_observer_analysis(self, round_num: int, analysis: dict):
         """Store an observer analysis for a given round.
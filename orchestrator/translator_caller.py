@@ -8,23 +8,21 @@ import json
 
 from anthropic import AsyncAnthropic
 
+from orchestrator.deadline import Deadline, limits, within
 from orchestrator.utils import update_visualization_state, OUTPUT_DIR, TRANSLATOR_MODEL
 
 
-async def run_patient_translator(
+async def generate_patient_explanation(
     client: AsyncAnthropic,
     case_data: dict,
     diagnosis: dict,
+    deadline: Deadline | None = None,
 ) -> str:
-    """Translate the final diagnosis into a plain-language explanation for the patient's family."""
-    case_id = case_data.get("case_id", "unknown")
-    update_visualization_state("running", case_id, 2, "patient_translation")
-
-    print("[STAGE] translator")
-    print(f"\n💬 Patient Translator: Writing explanation for {case_data.get('patient', {}).get('name', 'the patient')}'s family")
-    print("─" * 50)
-    print("  ⏳ Translating clinical reasoning to plain language...")
+    """Make the Patient Translator model call and return the markdown explanation.
 
+    Has no side effects, so it can run as a background prefetch before the
+    Observer asks for the translation.
+    """
     patient = case_data.get("patient", {})
     patient_name = patient.get("name", "your child")
     parent_context = patient.get("presenting_context", "")
@@ -66,18 +64,46 @@ Write a markdown document with these sections:
         "Output ONLY the markdown document — no JSON wrapper, no code fences around the whole thing."
     )
 
-    async with client.messages.stream(
-        model=TRANSLATOR_MODEL,
-        max_tokens=8_000,
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_message}],
-    ) as stream:
-        response = await stream.get_final_message()
+    async def _stream():
+        async with client.messages.stream(
+            model=TRANSLATOR_MODEL,
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_message}],
+            **limits(deadline, "translation", 8_000),
+        ) as stream:
+            return await stream.get_final_message()
+
+    response = await within(deadline, "translation", _stream())
 
-    explanation = "".join(
+    return "".join(
         block.text for block in response.content if block.type == "text"
     )
 
+
+async def run_patient_translator(
+    client: AsyncAnthropic,
+    case_data: dict,
+    diagnosis: dict,
+    explanation: str | None = None,
+    deadline: Deadline | None = None,
+) -> str:
+    """Translate the final diagnosis into a plain-language explanation for the patient's family.
+
+    If `explanation` is given (e.g. from a background prefetch), the model
+    call is skipped and only the output is written and reported.
+    """
+    case_id = case_data.get("case_id", "unknown")
+    update_visualization_state("running", case_id, 2, "patient_translation")
+
+    print("[STAGE] translator")
+    print(f"\n💬 Patient Translator: Writing explanation for {case_data.get('patient', {}).get('name', 'the patient')}'s family")
+    print("─" * 50)
+    if explanation is None:
+        print("  ⏳ Translating clinical reasoning to plain language...")
+        explanation = await generate_patient_explanation(client, case_data, diagnosis, deadline=deadline)
+    else:
+        print("  ⚡ Using prefetched translation")
+
     # Write to disk
     explanation_path = OUTPUT_DIR / "patient_explanation.md"
     explanation_path.write_text(explanation)
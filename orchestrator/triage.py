@@ -0,0 +1,277 @@
+"""Local triage — pick the Round 1 team from the case itself, in milliseconds.
+
+The Observer's first turn is a max-effort model call whose main output is a
+roster of 2-4 specialists, yet most of that choice follows from the case
+JSON: a chief complaint of seizures, an abnormal MRI or an EEG point to the
+neurologist; a TSH, PTH or DEXA scan to the endocrinologist. triage() scores
+every available specialty (team_topology.json's available_specialists)
+against SPECIALTY_KEYWORDS:
+
+- each case section (chief complaint, description, timeline, exam findings,
+  labs, imaging, ...) adds SOURCE_WEIGHTS[section] per distinct keyword of a
+  specialty it mentions; lab and imaging names count as well as their values
+- a pediatric patient (under PEDIATRIC_AGE) adds PEDIATRIC_BONUS to the
+  developmental pediatrician and the geneticist
+- the case's metadata (which may hold the answer) and the full records are
+  never read
+
+The roster is every specialty scoring at least SELECT_FRACTION of the best
+one (MIN_TEAM to MAX_TEAM of them). `confidence` (0-1) combines how strong
+the signal is (the best score against STRONG_SIGNAL) with how clearly the
+roster separates from the first specialty left out.
+
+The agentic loop runs Round 1 with this roster before the Observer's first
+turn when the confidence reaches its threshold, and otherwise lets the
+Observer triage as usual. Either way the run is appended to
+shared/triage_log.jsonl — with the Observer's own Round 1 pick and its
+agreement with the local roster when there is one — to show at which
+confidence the local pick can be trusted.
+"""
+
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+TRIAGE_LOG_PATH = Path(__file__).resolve().parent.parent / "shared" / "triage_log.jsonl"
+
+DEFAULT_SPECIALTIES = [
+    "neurologist", "internist", "cardiologist",
+    "geneticist", "developmental_pediatrician",
+    "immunologist", "endocrinologist", "rheumatologist",
+]
+
+# Matched as word prefixes in lowercased text ("seizure" matches "seizures"),
+# except that keywords of up to SHORT_KEYWORD letters (abbreviations such as
+# "ana", "tsh", "igg") must be whole words: "ana" is not "analysis"
+SPECIALTY_KEYWORDS = {
+    "neurologist": [
+        "seizure", "epilep", "eeg", "mri brain", "brain mri", "cerebell", "ataxia", "regression",
+        "neuropath", "neurocognitive", "memory", "dementia", "confusion", "headache", "tremor",
+        "numbness", "tingling", "paresthes", "encephal", "gait", "stroke", "nerve", "neurolog",
+        "myoclon", "spastic", "hypotonia", "vision loss",
+    ],
+    "cardiologist": [
+        "chest pain", "palpitation", "murmur", "echocardiogram", "ekg", "ecg", "bnp", "troponin",
+        "heart failure", "cardiomyopath", "arrhythm", "syncope", "tachycardia", "cardiomegaly",
+        "ejection fraction", "shortness of breath", "dyspnea", "cardiac", "cardiovascular",
+    ],
+    "internist": [
+        "fatigue", "weight loss", "fever", "anemia", "hemoglobin", "cbc", "cmp", "liver", "renal",
+        "kidney", "creatinine", "hypertension", "diabetes", "infection", "iron", "abdominal pain",
+        "nausea", "vomiting", "jaundice", "hepat", "hemoly", "pain crisis", "sickle",
+    ],
+    "geneticist": [
+        "genetic", "consanguin", "family history", "dysmorph", "congenital", "syndrome",
+        "hereditary", "inherited", "sibling", "mutation", "sequencing", "exome", "metabolic",
+        "lactate", "storage disease", "enzyme",
+    ],
+    "developmental_pediatrician": [
+        "developmental", "milestone", "speech delay", "language delay", "infant", "newborn",
+        "feeding", "failure to thrive", "growth", "percentile", "school", "autism", "toddler",
+        "pediatric",
+    ],
+    "immunologist": [
+        "recurrent infection", "immunoglobulin", "igg", "iga", "ige", "lymphocyte", "allerg",
+        "complement", "immunodeficien", "granulom", "sarcoid", "ace level", "lymphadenopathy",
+        "immunosuppress",
+    ],
+    "endocrinologist": [
+        "thyroid", "tsh", "free t4", "cortisol", "hba1c", "glucose", "calcium", "pth",
+        "parathyroid", "osteopor", "fracture", "dexa", "weight gain", "striae", "moon face",
+        "acth", "hormone", "menstrua", "adrenal", "pituitary", "bone metabolism", "endocrin",
+        "vitamin d",
+    ],
+    "rheumatologist": [
+        "joint", "arthritis", "arthralgia", "ana", "antinuclear", "esr", "crp", "autoimmun",
+        "lupus", "uveitis", "sjogren", "vasculitis", "inflammatory", "morning stiffness",
+        "myalgia", "synovitis", "rheumat",
+    ],
+}
+
+# Weight per distinct keyword hit, by case section (sections not listed: 1.0)
+SOURCE_WEIGHTS = {
+    "chief_complaint": 3.0,
+    "title": 2.0,
+    "case_title": 2.0,
+    "description": 2.0,
+    "narrative_context": 1.5,
+    "labs": 1.5,
+    "imaging": 1.5,
+    "clinical_exam_findings": 1.0,
+    "physical_exam": 1.0,
+    "timeline": 1.0,
+}
+SKIPPED_SECTIONS = {"metadata", "full_medical_records", "full_records_path", "case_id", "patient"}
+
+SHORT_KEYWORD = 3
+PEDIATRIC_AGE = 18
+PEDIATRIC_BONUS = 3.0
+SELECT_FRACTION = 0.5  # Of the best score, to make the roster
+MIN_TEAM = 2
+MAX_TEAM = 4
+STRONG_SIGNAL = 15.0  # Best score at which the signal counts as strong
+
+
+def _keyword_pattern(keyword: str) -> str:
+    # A short keyword may not run on into more letters (digits are fine: "igg4")
+    return re.escape(keyword) + ("(?![a-z])" if len(keyword) <= SHORT_KEYWORD else "")
+
+
+# One alternation per specialty; findall() returns the keywords matched
+_PATTERNS = {
+    specialty: re.compile(
+        r"\b(" + "|".join(map(_keyword_pattern, sorted(keywords, key=len, reverse=True))) + ")"
+    )
+    for specialty, keywords in SPECIALTY_KEYWORDS.items()
+}
+
+
+@dataclass
+class TriageResult:
+    roster: list[str]
+    confidence: float
+    scores: dict[str, float]
+    evidence: dict[str, list[str]] = field(default_factory=dict)  # {specialty: ["labs: tsh", ...]}
+    elapsed_ms: float = 0.0
+
+    def lines(self) -> list[str]:
+        """Log lines describing the result."""
+        ranked = sorted(self.scores.items(), key=lambda kv: -kv[1])
+        return [
+            f"Local roster: {', '.join(self.roster)} (confidence {self.confidence:.2f}, "
+            f"{self.elapsed_ms:.1f} ms)",
+            "Scores: " + ", ".join(f"{s} {score:.1f}" for s, score in ranked if score > 0),
+        ]
+
+    def focus(self, specialty: str) -> str:
+        """Round 1 focus instructions for a specialist the local triage picked."""
+        features = ", ".join(self.evidence.get(specialty, [])[:8])
+        return (
+            "Perform a complete independent diagnostic assessment of this case from "
+            "the perspective of your specialty. You were selected for these case "
+            f"features: {features or 'general review'}. Identify the key clinical "
+            "features, red flags, and the diagnoses your domain can confirm or rule out."
+        )
+
+
+def _text(value) -> str:
+    """All keys and values of a case section as one string."""
+    if isinstance(value, dict):
+        return " ".join(f"{k} {_text(v)}" for k, v in value.items())
+    if isinstance(value, list):
+        return " ".join(_text(v) for v in value)
+    return str(value)
+
+
+def _age_years(patient: dict) -> float | None:
+    age = patient.get("age") if isinstance(patient, dict) else None
+    if isinstance(age, (int, float)):
+        return float(age)
+    match = re.match(r"\s*(\d+(?:\.\d+)?)\s*(\w*)", str(age or ""))
+    if not match:
+        return None
+    value, unit = float(match.group(1)), match.group(2).lower()
+    if unit.startswith("month") or unit.startswith("mo"):
+        return value / 12
+    if unit.startswith("week") or unit.startswith("wk"):
+        return value / 52
+    if unit.startswith("day"):
+        return value / 365
+    return value
+
+
+def triage(
+    case_data: dict,
+    available: list[str] | None = None,
+    max_team: int = MAX_TEAM,
+) -> TriageResult:
+    """Score the available specialties from the case and pick a Round 1 roster.
+
+    Args:
+        case_data: The case JSON.
+        available: Specialties to choose from (default: DEFAULT_SPECIALTIES);
+            ones without keywords in SPECIALTY_KEYWORDS are never picked.
+        max_team: Largest roster to return.
+    """
+    start = time.perf_counter()
+    specialties = [s for s in (available or DEFAULT_SPECIALTIES) if s in _PATTERNS]
+    scores = {s: 0.0 for s in specialties}
+    evidence: dict[str, list[str]] = {s: [] for s in specialties}
+
+    for section, value in case_data.items():
+        if section in SKIPPED_SECTIONS or not value:
+            continue
+        text = _text(value).lower().replace("_", " ")
+        weight = SOURCE_WEIGHTS.get(section, 1.0)
+        for specialty in specialties:
+            for keyword in sorted(set(_PATTERNS[specialty].findall(text))):
+                scores[specialty] += weight
+                evidence[specialty].append(f"{section}: {keyword}")
+
+    age = _age_years(case_data.get("patient", {}))
+    if age is not None and age < PEDIATRIC_AGE:
+        for specialty in ("developmental_pediatrician", "geneticist"):
+            if specialty in scores:
+                scores[specialty] += PEDIATRIC_BONUS
+                evidence[specialty].append(f"patient: age {age:g}")
+
+    ranked = sorted(specialties, key=lambda s: -scores[s])
+    top = scores[ranked[0]] if ranked else 0.0
+    roster = [s for s in ranked if top and scores[s] >= SELECT_FRACTION * top][:max_team]
+    roster = roster or ranked[:MIN_TEAM]
+    if len(roster) < MIN_TEAM:
+        roster = ranked[:MIN_TEAM]
+
+    # Strong signal, and a clear gap between the roster and the rest
+    signal = min(1.0, top / STRONG_SIGNAL)
+    left_out = [scores[s] for s in ranked if s not in roster]
+    lowest = min((scores[s] for s in roster), default=0.0)
+    separation = 1.0 - (max(left_out) / lowest if left_out and lowest else 0.0)
+    confidence = signal * (0.5 + 0.5 * max(0.0, separation))
+
+    return TriageResult(
+        roster=roster,
+        confidence=round(confidence, 2),
+        scores={s: round(scores[s], 2) for s in specialties},
+        evidence={s: items for s, items in evidence.items() if items},
+        elapsed_ms=(time.perf_counter() - start) * 1e3,
+    )
+
+
+def agreement(local: list[str], observer: list[str]) -> float:
+    """Jaccard overlap of two rosters."""
+    a, b = set(local), set(observer)
+    return len(a & b) / len(a | b) if a | b else 1.0
+
+
+def log_triage(
+    case_id: str,
+    result: TriageResult,
+    observer_roster: list[str] | None,
+    fast_path: bool,
+    path: Path | None = TRIAGE_LOG_PATH,
+) -> dict:
+    """Append one run's triage outcome to the triage log and return the entry.
+
+    `observer_roster` is the Observer's own Round 1 pick (None when the fast
+    path ran Round 1 and the Observer never triaged).
+    """
+    entry = {
+        "case_id": case_id,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "fast_path": fast_path,
+        "confidence": result.confidence,
+        "local_roster": result.roster,
+        "observer_roster": observer_roster,
+        "agreement": round(agreement(result.roster, observer_roster), 2) if observer_roster else None,
+    }
+    if path is not None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a") as f:
+                f.write(json.dumps(entry) + "\n")
+        except OSError:
+            pass  # The log is advisory; the run goes on
+    return entry
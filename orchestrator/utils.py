@@ -16,6 +16,8 @@ from pathlib import Path
 
 import yaml
 
+from orchestrator.token_estimator import get_estimator
+
 # ── Paths ────────────────────────────────────────────────────────────────────
 # BASE_DIR points to the project root (parent of the orchestrator/ package)
 
@@ -59,8 +61,9 @@ def load_case(case_path: Path) -> dict:
     case_data = json.loads(case_path.read_text())
 
     # Load expanded medical records if path is specified
-    # Cap at ~400K chars to stay within the 200K token context window
-    MAX_RECORDS_CHARS = 400_000
+    # Cap at ~100K tokens (learned chars/token ratio) to stay within the 200K
+    # token context window
+    MAX_RECORDS_TOKENS = 100_000
     full_records_path = case_data.get("full_records_path")
     if full_records_path:
         records_file = case_path.parent / full_records_path
@@ -70,10 +73,11 @@ def load_case(case_path: Path) -> dict:
         if records_file.exists():
             records_text = records_file.read_text()
             full_size = len(records_text)
-            if full_size > MAX_RECORDS_CHARS:
-                records_text = records_text[:MAX_RECORDS_CHARS]
-                records_text += f"\n\n[... RECORDS TRUNCATED — showing {MAX_RECORDS_CHARS:,} of {full_size:,} total characters ...]"
-                print(f"   📄 Loaded expanded records: {records_file.name} (truncated to {MAX_RECORDS_CHARS:,} of {full_size:,} chars)")
+            records_text, truncated = get_estimator().truncate(records_text, MAX_RECORDS_TOKENS)
+            if truncated:
+                kept = len(records_text)
+                records_text += f"\n\n[... RECORDS TRUNCATED — showing {kept:,} of {full_size:,} total characters ...]"
+                print(f"   📄 Loaded expanded records: {records_file.name} (truncated to ~{MAX_RECORDS_TOKENS:,} tokens: {kept:,} of {full_size:,} chars)")
             else:
                 print(f"   📄 Loaded expanded records: {records_file.name} ({full_size:,} chars)")
             case_data["full_medical_records"] = records_text
@@ -18,11 +18,36 @@ import json
 import os
 import re
 import sys
+import time
 from pathlib import Path
 
 import yaml
 from anthropic import AsyncAnthropic
 
+from orchestrator.bias_prescreen import prescreen, summary_lines as prescreen_summary_lines
+from orchestrator.checkpoint import RunCheckpoint
+from orchestrator.diagnosis_lexicon import get_lexicon, reference_check, reference_diagnosis
+from orchestrator.hedging import Hedger, hedged
+from orchestrator.peer_context import (
+    DEFAULT_TOKEN_CAP as DEFAULT_PEER_CONTEXT_TOKENS,
+    PeerContextStats,
+    build_peer_context,
+    full_peer_context,
+)
+from orchestrator.prompt_cache import PrefixWarmer
+from orchestrator.quorum import QuorumPolicy, QuorumRound
+from orchestrator.resilience import ResilientClient
+from orchestrator.scheduler import ScheduledClient, call_stage
+from orchestrator.specialist_session import SpecialistCallStats, SpecialistSession
+from orchestrator.token_estimator import get_estimator
+from orchestrator.specialist_caller import (
+    build_followup_instructions,
+    build_shared_specialist_system_prompt,
+    build_specialist_instructions,
+    call_specialist as call_specialist_shared_prefix,
+    continue_specialist,
+)
+
 # ── Paths ────────────────────────────────────────────────────────────────────
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -123,8 +148,9 @@ def load_case(case_path: Path) -> dict:
     case_data = json.loads(case_path.read_text())
 
     # Load expanded medical records if path is specified
-    # Cap at ~400K chars to stay within the 200K token context window
-    MAX_RECORDS_CHARS = 400_000
+    # Cap at ~100K tokens (learned chars/token ratio) to stay within the 200K
+    # token context window
+    MAX_RECORDS_TOKENS = 100_000
     full_records_path = case_data.get("full_records_path")
     if full_records_path:
         records_file = case_path.parent / full_records_path
@@ -134,10 +160,11 @@ def load_case(case_path: Path) -> dict:
         if records_file.exists():
             records_text = records_file.read_text()
             full_size = len(records_text)
-            if full_size > MAX_RECORDS_CHARS:
-                records_text = records_text[:MAX_RECORDS_CHARS]
-                records_text += f"\n\n[... RECORDS TRUNCATED — showing {MAX_RECORDS_CHARS:,} of {full_size:,} total characters ...]"
-                print(f"   📄 Loaded expanded records: {records_file.name} (truncated to {MAX_RECORDS_CHARS:,} of {full_size:,} chars)")
+            records_text, truncated = get_estimator().truncate(records_text, MAX_RECORDS_TOKENS)
+            if truncated:
+                kept = len(records_text)
+                records_text += f"\n\n[... RECORDS TRUNCATED — showing {kept:,} of {full_size:,} total characters ...]"
+                print(f"   📄 Loaded expanded records: {records_file.name} (truncated to ~{MAX_RECORDS_TOKENS:,} tokens: {kept:,} of {full_size:,} chars)")
             else:
                 print(f"   📄 Loaded expanded records: {records_file.name} ({full_size:,} chars)")
             case_data["full_medical_records"] = records_text
@@ -384,6 +411,8 @@ async def call_specialist(
     system_prompt: str,
     case_json: str,
     attached_images: list[dict] | None = None,
+    call_stats: SpecialistCallStats | None = None,
+    hedger: Hedger | None = None,
 ) -> dict:
     """Call a single specialist via the Anthropic API and return parsed JSON."""
     print(f"  ⏳ Launching {display_name}...")
@@ -417,20 +446,27 @@ async def call_specialist(
                 })
     content_blocks.append({"type": "text", "text": text_content_msg})
 
-    async with client.messages.stream(
-        model=agent_def["model"],
-        max_tokens=16_000,
-        thinking={"type": "adaptive"},
-        system=system_prompt,
-        messages=[{"role": "user", "content": content_blocks}],
-    ) as stream:
-        response = await stream.get_final_message()
+    async def _attempt(client):
+        async with client.messages.stream(
+            model=agent_def["model"],
+            max_tokens=16_000,
+            thinking={"type": "adaptive"},
+            system=system_prompt,
+            messages=[{"role": "user", "content": content_blocks}],
+        ) as stream:
+            response = await stream.get_final_message()
+
+        text_content = "".join(
+            block.text for block in response.content if block.type == "text"
+        )
+        return extract_json(text_content), response.usage
 
-    text_content = "".join(
-        block.text for block in response.content if block.type == "text"
-    )
+    start = time.monotonic()
+    with call_stage("specialist"):
+        raw, usage = await hedged(hedger, "specialist", client, _attempt)
+    if call_stats is not None:
+        call_stats.record(1, "fresh", time.monotonic() - start, usage)
 
-    raw = extract_json(text_content)
     agent_key = display_name.lower().replace(" ", "_")
     parsed = normalize_specialist_output(raw, agent_key)
     hypothesis = parsed.get("diagnosis_hypothesis", "N/A")
@@ -447,8 +483,14 @@ async def call_observer(
     case_data: dict,
     round_num: int = 1,
     prior_observer: dict | None = None,
+    prescreen_result: dict | None = None,
+    hedger: Hedger | None = None,
 ) -> dict:
-    """Call the Metacognitive Observer on specialist outputs for any round."""
+    """Call the Metacognitive Observer on specialist outputs for any round.
+
+    With `prescreen_result`, the local pre-screen's findings are included
+    as leads to verify (see orchestrator.bias_prescreen).
+    """
     print(f"  ⏳ Launching Metacognitive Observer (Round {round_num})...")
 
     effort = observer_def.get("thinking", {}).get("effort", "max")
@@ -460,10 +502,20 @@ async def call_observer(
 
     prior_section = ""
     if prior_observer:
+        heading = (
+            f"Round {round_num - 1} Local Bias Pre-screen (source: local — you were not called)"
+            if prior_observer.get("source") == "local"
+            else f"Your Round {round_num - 1} Analysis"
+        )
         prior_section = (
-            f"\n## Your Round {round_num - 1} Analysis (for reference)\n"
+            f"\n## {heading} (for reference)\n"
             f"```json\n{json.dumps(prior_observer, indent=2)}\n```\n"
         )
+    if prescreen_result:
+        prior_section += (
+            "\n## Automated Pre-screen (heuristic — verify, extend or overrule)\n"
+            + "\n".join(prescreen_summary_lines(prescreen_result)) + "\n"
+        )
 
     user_message = (
         "## Case Data\n"
@@ -480,27 +532,109 @@ async def call_observer(
         "Respond with ONLY the JSON object."
     )
 
-    async with client.messages.stream(
-        model=observer_def["model"],
-        max_tokens=16_000,
-        thinking={"type": "adaptive"},
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_message}],
-    ) as stream:
-        response = await stream.get_final_message()
-
-    text_content = "".join(
-        block.text for block in response.content if block.type == "text"
-    )
+    async def _attempt(client):
+        async with client.messages.stream(
+            model=observer_def["model"],
+            max_tokens=16_000,
+            thinking={"type": "adaptive"},
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_message}],
+        ) as stream:
+            response = await stream.get_final_message()
+
+        text_content = "".join(
+            block.text for block in response.content if block.type == "text"
+        )
+        return extract_json(text_content)
 
-    parsed = extract_json(text_content)
+    with call_stage("observer_review"):
+        parsed = await hedged(hedger, "observer_review", client, _attempt)
     n_biases = len(parsed.get("biases_detected", []))
     print(f"  ✅ Observer complete — {n_biases} bias(es) detected")
     return parsed
 
 
+async def review_with_observer(
+    client: AsyncAnthropic,
+    agent_defs: dict,
+    constitution: str,
+    specialist_outputs: dict,
+    case_data: dict,
+    round_num: int = 1,
+    prior_observer: dict | None = None,
+    prior_outputs: dict | None = None,
+    observer_threshold: float | None = None,
+    hedger: Hedger | None = None,
+) -> dict:
+    """Review a round: the local bias pre-screen, then the Observer if needed.
+
+    With `observer_threshold` (pre-screen mode), the Observer is only called
+    when the pre-screen's flag score reaches it; otherwise the pre-screen
+    result is the round's review. Without it (full mode) the Observer
+    always runs, as before.
+    """
+    if observer_threshold is None:
+        observer_def = agent_defs["metacognitive_observer.md"]
+        return await call_observer(
+            client, observer_def, build_observer_system_prompt(observer_def, constitution, round_num=round_num),
+            specialist_outputs, case_data, round_num=round_num, prior_observer=prior_observer,
+            hedger=hedger,
+        )
+
+    local = prescreen(specialist_outputs, case_data, round_num, prior_outputs)
+    flag_score = local["prescreen"]["flag_score"]
+    if flag_score < observer_threshold:
+        print(
+            f"  ✅ Bias pre-screen: flag score {flag_score:.2f} < {observer_threshold:.2f} — "
+            f"Observer call skipped ({len(local['biases_detected'])} bias(es) noted locally)"
+        )
+        return local
+
+    print(f"  ⚠️  Bias pre-screen: flag score {flag_score:.2f} ≥ {observer_threshold:.2f} — calling the Observer")
+    observer_def = agent_defs["metacognitive_observer.md"]
+    result = await call_observer(
+        client, observer_def, build_observer_system_prompt(observer_def, constitution, round_num=round_num),
+        specialist_outputs, case_data, round_num=round_num, prior_observer=prior_observer,
+        prescreen_result=local, hedger=hedger,
+    )
+    result["prescreen"] = local["prescreen"]
+    return result
+
+
 # ── Summary ──────────────────────────────────────────────────────────────────
 
+def write_specialist_result(
+    round_dir: Path, round_num: int, display_name: str, result, late: bool = False,
+) -> dict:
+    """Write one specialist's round output (or its error) and return it."""
+    file_key = display_name.lower().replace(" ", "_")
+    if isinstance(result, Exception):
+        print(f"  ❌ {display_name} failed: {result}")
+        output = {
+            "agent": file_key,
+            "round": round_num,
+            "error": str(result),
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        }
+    else:
+        output = dict(result)
+    if late:
+        # Arrived after the round's quorum — the Observer review did not see it
+        output["late_arrival"] = True
+    (round_dir / f"{file_key}.json").write_text(json.dumps(output, indent=2))
+    return output
+
+
+def pending_specialist_output(display_name: str, round_num: int) -> dict:
+    """Placeholder for a specialist still running when its round reached quorum."""
+    return {
+        "agent": display_name.lower().replace(" ", "_"),
+        "round": round_num,
+        "pending": True,
+        "note": "Still running when the round reached quorum; merged as a late result when it arrives.",
+    }
+
+
 def print_summary(specialist_outputs: dict, observer_result: dict, round_num: int = 1):
     """Print a human-readable summary of any round's results."""
     print("\n" + "=" * 70)
@@ -511,6 +645,9 @@ def print_summary(specialist_outputs: dict, observer_result: dict, round_num: in
     print("\n─── Specialist Analyses ───\n")
     for name, output in specialist_outputs.items():
         label = name.upper().replace("_", " ")
+        if output.get("pending"):
+            print(f"  {label}: STILL RUNNING — will be merged when it arrives\n")
+            continue
         if "error" in output:
             print(f"  {label}: FAILED — {output['error']}\n")
             continue
@@ -534,7 +671,10 @@ def print_summary(specialist_outputs: dict, observer_result: dict, round_num: in
         print()
 
     # Observer
-    print("─── Metacognitive Observer ───\n")
+    if observer_result.get("source") == "local":
+        print("─── Bias Pre-screen (source: local — Observer call skipped) ───\n")
+    else:
+        print("─── Metacognitive Observer ───\n")
     biases = observer_result.get("biases_detected", [])
     quality = observer_result.get("reasoning_quality", {})
     interrupt = observer_result.get("interrupt_recommended", False)
@@ -584,8 +724,17 @@ def print_round_comparison(r1_specialists: dict, r2_specialists: dict, r1_observ
         r1_conf = r1.get("confidence", "N/A")
         r2_conf = r2.get("confidence", "N/A")
 
-        # Determine if hypothesis changed
-        changed = "REVISED" if r1_hyp[:40] != r2_hyp[:40] else "maintained"
+        # Determine if hypothesis changed (by diagnosis concept, when the
+        # lexicon knows both; otherwise by text)
+        relation = get_lexicon().compare(r1_hyp, r2_hyp)
+        if relation == "same":
+            changed = "maintained"
+        elif relation == "related":
+            changed = "REFINED"
+        elif relation == "different":
+            changed = "REVISED"
+        else:
+            changed = "REVISED" if r1_hyp[:40] != r2_hyp[:40] else "maintained"
 
         # Confidence delta
         conf_delta = ""
@@ -645,8 +794,31 @@ async def run_round_2(
     constitution: str,
     r1_specialists: dict,
     r1_observer: dict,
+    prompt_layout: str = "standard",
+    checkpoint: RunCheckpoint | None = None,
+    quorum: QuorumPolicy | None = None,
+    observer_threshold: float | None = None,
+    peer_context_tokens: int | None = DEFAULT_PEER_CONTEXT_TOKENS,
+    sessions: dict[str, SpecialistSession] | None = None,
+    call_stats: SpecialistCallStats | None = None,
+    hedger: Hedger | None = None,
 ) -> dict:
-    """Execute Round 2: debate with peer review + Observer re-evaluation."""
+    """Execute Round 2: debate with peer review + Observer re-evaluation.
+
+    With prompt_layout="shared-prefix", the case data is sent as a cached
+    prefix shared by all specialists and the peer analyses go in the
+    per-specialist tail (see orchestrator.specialist_caller). Steps already
+    saved in `checkpoint` are restored instead of re-run. With a `quorum`,
+    the Observer reviews once the quorum is in; stragglers are returned as
+    "stragglers" and merged into the round as they finish. With an
+    `observer_threshold`, the Observer only runs if the bias pre-screen
+    flags the round (see review_with_observer). Peers and the Observer
+    report are given as a digest capped at `peer_context_tokens` (None =
+    full Round 1 JSON; see orchestrator.peer_context). A specialist with a
+    Round 1 conversation in `sessions` answers as a new turn of it (see
+    orchestrator.specialist_session). With a `hedger`, slow specialist and
+    Observer calls get a duplicate request (see orchestrator.hedging).
+    """
     case_id = case_data.get("case_id", "unknown")
     case_json = json.dumps(case_data, indent=2)
 
@@ -656,112 +828,180 @@ async def run_round_2(
 
     update_visualization_state("running", case_id, 2, "specialist_debate")
 
-    # Build specialist tasks
-    tasks = []
     print("[STAGE] round2_specialists")
     print("\n🩺 Round 2: Specialist Debate (with Observer feedback)")
     print("─" * 50)
 
-    for spec in ROUND_1_SPECIALISTS:
-        agent_def = agent_defs[spec["agent_file"]]
-        display_name = spec["display_name"]
-        agent_key = display_name.lower().replace(" ", "_")
-
-        system_prompt = build_round_2_specialist_system_prompt(
-            agent_def=agent_def,
-            display_name=display_name,
-            role_override=spec["role_override"],
-            focus=spec["focus"],
-            constitution=constitution,
-        )
+    r2_specialists = checkpoint.get("r2_specialists") if checkpoint else None
+    stragglers = None
+    if r2_specialists is not None:
+        print("  ↻ Restored from checkpoint")
+    else:
+        # Build specialist tasks
+        tasks = {}
+        shared_system_prompt = build_shared_specialist_system_prompt(constitution)
+        prefix_warmer = PrefixWarmer()
+        peer_stats = PeerContextStats()
+
+        for spec in ROUND_1_SPECIALISTS:
+            agent_def = agent_defs[spec["agent_file"]]
+            display_name = spec["display_name"]
+            agent_key = display_name.lower().replace(" ", "_")
+
+            session = (sessions or {}).get(agent_key)
+            own_r1 = r1_specialists.get(agent_key) or {}
+            if session is not None and session.continues(None, 1) and not own_r1.get("pending"):
+                # Its Round 1 analysis is already in the conversation
+                if peer_context_tokens is None:
+                    prior_context = full_peer_context(agent_key, {1: r1_specialists}, {1: r1_observer}, include_own=False)
+                else:
+                    peer_context = build_peer_context(
+                        agent_key, {1: r1_specialists}, {1: r1_observer},
+                        token_cap=peer_context_tokens, include_own=False,
+                    )
+                    peer_stats.record(2, peer_context)
+                    prior_context = peer_context.text
+                tasks[display_name] = continue_specialist(
+                    client, agent_def, display_name, session,
+                    build_followup_instructions(display_name, 2, prior_context),
+                    round_num=2,
+                    call_stats=call_stats,
+                    hedger=hedger,
+                )
+                continue
+
+            if peer_context_tokens is None:
+                own_r1 = r1_specialists.get(agent_key, {})
+                others_text = ""
+                for name, output in r1_specialists.items():
+                    if name != agent_key:
+                        others_text += f"\n### {name}\n```json\n{json.dumps(output, indent=2)}\n```\n"
+                prior_context = (
+                    "## Your Round 1 Analysis\n"
+                    f"```json\n{json.dumps(own_r1, indent=2)}\n```\n\n"
+                    "## Other Specialists' Round 1 Analyses\n"
+                    f"{others_text}\n"
+                    + (
+                        "## Round 1 Bias Pre-screen (source: local heuristics, the Observer was not called)\n"
+                        if r1_observer.get("source") == "local"
+                        else "## Metacognitive Observer's Round 1 Bias Report\n"
+                    )
+                    + f"```json\n{json.dumps(r1_observer, indent=2)}\n```"
+                )
+            else:
+                peer_context = build_peer_context(
+                    agent_key, {1: r1_specialists}, {1: r1_observer}, token_cap=peer_context_tokens
+                )
+                peer_stats.record(2, peer_context)
+                prior_context = peer_context.text
+
+            if prompt_layout == "shared-prefix":
+                tasks[display_name] = call_specialist_shared_prefix(
+                    client, agent_def, display_name, shared_system_prompt, case_json,
+                    case_data.get("attached_images"),
+                    instructions=build_specialist_instructions(
+                        agent_def, display_name, spec["role_override"], spec["focus"],
+                        round_num=2, prior_context=prior_context,
+                    ),
+                    prefix_warmer=prefix_warmer,
+                    round_num=2,
+                    call_stats=call_stats,
+                    hedger=hedger,
+                )
+                continue
+
+            system_prompt = build_round_2_specialist_system_prompt(
+                agent_def=agent_def,
+                display_name=display_name,
+                role_override=spec["role_override"],
+                focus=spec["focus"],
+                constitution=constitution,
+            )
 
-        # Build the Round 2 user message with full context
-        own_r1 = r1_specialists.get(agent_key, {})
-        other_r1 = {
-            k: v for k, v in r1_specialists.items() if k != agent_key
-        }
+            # Build the Round 2 user message with the case and prior-round context
+            user_message_text = (
+                "## Case Data\n\n"
+                f"```json\n{case_json}\n```\n\n"
+                f"{prior_context}\n\n"
+                "Now provide your Round 2 analysis. Respond with ONLY the JSON object."
+            )
 
-        others_text = ""
-        for name, output in other_r1.items():
-            others_text += f"\n### {name}\n```json\n{json.dumps(output, indent=2)}\n```\n"
-
-        user_message_text = (
-            "## Case Data\n\n"
-            f"```json\n{case_json}\n```\n\n"
-            "## Your Round 1 Analysis\n"
-            f"```json\n{json.dumps(own_r1, indent=2)}\n```\n\n"
-            "## Other Specialists' Round 1 Analyses\n"
-            f"{others_text}\n"
-            "## Metacognitive Observer's Round 1 Bias Report\n"
-            f"```json\n{json.dumps(r1_observer, indent=2)}\n```\n\n"
-            "Now provide your Round 2 analysis. Respond with ONLY the JSON object."
-        )
+            # Build content blocks with images if present
+            r2_attached = case_data.get("attached_images")
+            r2_content = []
+            if r2_attached:
+                for img in r2_attached:
+                    img_path = Path(img["path"])
+                    if img_path.exists():
+                        image_data = base64.b64encode(img_path.read_bytes()).decode("utf-8")
+                        r2_content.append({
+                            "type": "image",
+                            "source": {"type": "base64", "media_type": img["mime_type"], "data": image_data},
+                        })
+            r2_content.append({"type": "text", "text": user_message_text})
+
+            print(f"  ⏳ Launching {display_name} (Round 2)...")
+
+            async def _call(ad=agent_def, sp=system_prompt, um=r2_content, dn=display_name):
+                async def _attempt(client):
+                    async with client.messages.stream(
+                        model=ad["model"],
+                        max_tokens=16_000,
+                        thinking={"type": "adaptive"},
+                        system=sp,
+                        messages=[{"role": "user", "content": um}],
+                    ) as stream:
+                        response = await stream.get_final_message()
+
+                    text_content = "".join(
+                        block.text for block in response.content if block.type == "text"
+                    )
+                    return extract_json(text_content), response.usage
+
+                start = time.monotonic()
+                with call_stage("specialist"):
+                    raw, usage = await hedged(hedger, "specialist", client, _attempt)
+                if call_stats is not None:
+                    call_stats.record(2, "fresh", time.monotonic() - start, usage)
+
+                ak = dn.lower().replace(" ", "_")
+                parsed = normalize_specialist_output(raw, ak)
+                # Preserve bias_acknowledgment if present in raw but lost in normalize
+                if "bias_acknowledgment" in raw and "bias_acknowledgment" not in parsed:
+                    parsed["bias_acknowledgment"] = raw["bias_acknowledgment"]
+                hyp = parsed.get("diagnosis_hypothesis", "N/A")
+                conf = parsed.get("confidence", "N/A")
+                print(f"  ✅ {dn} complete — {hyp[:80]} (confidence: {conf})")
+                return parsed
+
+            tasks[display_name] = _call()
+
+        if peer_stats.rounds:
+            print(f"  [PEER] {peer_stats.summary()}")
+
+        r2_specialists = {}
+
+        def _merge_late(display_name, result):
+            file_key = display_name.lower().replace(" ", "_")
+            r2_specialists[file_key] = write_specialist_result(round_2_dir, 2, display_name, result, late=True)
+            print(f"  ⏰ {display_name} (Round 2) arrived late — merged into the round")
+            if checkpoint:
+                checkpoint.save("round2_specialists", r2_specialists=r2_specialists)
+
+        # Execute all specialists in parallel, up to the quorum
+        stragglers = QuorumRound(quorum, on_late=_merge_late, label="Round 2")
+        results = await stragglers.run(tasks)
+
+        # Write results to disk
+        for display_name in tasks:
+            file_key = display_name.lower().replace(" ", "_")
+            if display_name in results:
+                r2_specialists[file_key] = write_specialist_result(round_2_dir, 2, display_name, results[display_name])
+            else:
+                r2_specialists[file_key] = pending_specialist_output(display_name, 2)
 
-        # Build content blocks with images if present
-        r2_attached = case_data.get("attached_images")
-        r2_content = []
-        if r2_attached:
-            for img in r2_attached:
-                img_path = Path(img["path"])
-                if img_path.exists():
-                    image_data = base64.b64encode(img_path.read_bytes()).decode("utf-8")
-                    r2_content.append({
-                        "type": "image",
-                        "source": {"type": "base64", "media_type": img["mime_type"], "data": image_data},
-                    })
-        r2_content.append({"type": "text", "text": user_message_text})
-
-        print(f"  ⏳ Launching {display_name} (Round 2)...")
-
-        async def _call(ad=agent_def, sp=system_prompt, um=r2_content, dn=display_name):
-            async with client.messages.stream(
-                model=ad["model"],
-                max_tokens=16_000,
-                thinking={"type": "adaptive"},
-                system=sp,
-                messages=[{"role": "user", "content": um}],
-            ) as stream:
-                response = await stream.get_final_message()
-
-            text_content = "".join(
-                block.text for block in response.content if block.type == "text"
-            )
-            raw = extract_json(text_content)
-            ak = dn.lower().replace(" ", "_")
-            parsed = normalize_specialist_output(raw, ak)
-            # Preserve bias_acknowledgment if present in raw but lost in normalize
-            if "bias_acknowledgment" in raw and "bias_acknowledgment" not in parsed:
-                parsed["bias_acknowledgment"] = raw["bias_acknowledgment"]
-            hyp = parsed.get("diagnosis_hypothesis", "N/A")
-            conf = parsed.get("confidence", "N/A")
-            print(f"  ✅ {dn} complete — {hyp[:80]} (confidence: {conf})")
-            return parsed
-
-        tasks.append(_call())
-
-    # Execute all specialists in parallel
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Write results to disk
-    r2_specialists = {}
-    for i, result in enumerate(results):
-        display_name = ROUND_1_SPECIALISTS[i]["display_name"]
-        file_key = display_name.lower().replace(" ", "_")
-        output_path = round_2_dir / f"{file_key}.json"
-
-        if isinstance(result, Exception):
-            print(f"  ❌ {display_name} failed: {result}")
-            error_output = {
-                "agent": file_key,
-                "round": 2,
-                "error": str(result),
-                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-            }
-            output_path.write_text(json.dumps(error_output, indent=2))
-            r2_specialists[file_key] = error_output
-        else:
-            output_path.write_text(json.dumps(result, indent=2))
-            r2_specialists[file_key] = result
+        if checkpoint:
+            checkpoint.save("round2_specialists", r2_specialists=r2_specialists)
 
     # Run Observer on Round 2
     print("[STAGE] round2_observer")
@@ -769,12 +1009,17 @@ async def run_round_2(
     print("─" * 50)
     update_visualization_state("running", case_id, 2, "observer_analysis")
 
-    observer_def = agent_defs["metacognitive_observer.md"]
-    observer_system_prompt = build_observer_system_prompt(observer_def, constitution, round_num=2)
-    r2_observer = await call_observer(
-        client, observer_def, observer_system_prompt,
-        r2_specialists, case_data, round_num=2, prior_observer=r1_observer,
-    )
+    r2_observer = checkpoint.get("r2_observer") if checkpoint else None
+    if r2_observer is not None:
+        print("  ↻ Restored from checkpoint")
+    else:
+        r2_observer = await review_with_observer(
+            client, agent_defs, constitution, r2_specialists, case_data, round_num=2,
+            prior_observer=r1_observer, prior_outputs=r1_specialists,
+            observer_threshold=observer_threshold, hedger=hedger,
+        )
+        if checkpoint:
+            checkpoint.save("round2_observer", r2_observer=r2_observer)
 
     # Write observer output
     observer_path = OBSERVER_DIR / "analysis_round_2.json"
@@ -788,7 +1033,7 @@ async def run_round_2(
     # Print comparison
     print_round_comparison(r1_specialists, r2_specialists, r1_observer, r2_observer)
 
-    return {"specialists": r2_specialists, "observer": r2_observer}
+    return {"specialists": r2_specialists, "observer": r2_observer, "stragglers": stragglers}
 
 
 async def run_synthesis(
@@ -798,6 +1043,7 @@ async def run_synthesis(
     r2_specialists: dict,
     r1_observer: dict,
     r2_observer: dict,
+    hedger: Hedger | None = None,
 ) -> dict:
     """Synthesize all debate rounds into a final diagnosis."""
     case_id = case_data.get("case_id", "unknown")
@@ -856,19 +1102,23 @@ Respond with ONLY valid JSON — no markdown fences, no preamble. Use exactly th
         "Respond with ONLY the JSON object."
     )
 
-    async with client.messages.stream(
-        model="claude-opus-4-6",
-        max_tokens=16_000,
-        thinking={"type": "adaptive"},
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_message}],
-    ) as stream:
-        response = await stream.get_final_message()
+    async def _attempt(client):
+        async with client.messages.stream(
+            model="claude-opus-4-6",
+            max_tokens=16_000,
+            thinking={"type": "adaptive"},
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_message}],
+        ) as stream:
+            response = await stream.get_final_message()
+
+        text_content = "".join(
+            block.text for block in response.content if block.type == "text"
+        )
+        return extract_json(text_content)
 
-    text_content = "".join(
-        block.text for block in response.content if block.type == "text"
-    )
-    diagnosis = extract_json(text_content)
+    with call_stage("synthesis"):
+        diagnosis = await hedged(hedger, "synthesis", client, _attempt)
 
     # Write to disk
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -949,13 +1199,14 @@ Write a markdown document with these sections:
         "Output ONLY the markdown document — no JSON wrapper, no code fences around the whole thing."
     )
 
-    async with client.messages.stream(
-        model=TRANSLATOR_MODEL,
-        max_tokens=8_000,
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_message}],
-    ) as stream:
-        response = await stream.get_final_message()
+    with call_stage("translation"):
+        async with client.messages.stream(
+            model=TRANSLATOR_MODEL,
+            max_tokens=8_000,
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_message}],
+        ) as stream:
+            response = await stream.get_final_message()
 
     explanation = "".join(
         block.text for block in response.content if block.type == "text"
@@ -1060,14 +1311,15 @@ Propose 3-6 focused, non-overlapping amendments. Each should be specific enough
         "Respond with ONLY the JSON object."
     )
 
-    async with client.messages.stream(
-        model=amender_def["model"],
-        max_tokens=16_000,
-        thinking={"type": "adaptive"},
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_message}],
-    ) as stream:
-        response = await stream.get_final_message()
+    with call_stage("amendments"):
+        async with client.messages.stream(
+            model=amender_def["model"],
+            max_tokens=16_000,
+            thinking={"type": "adaptive"},
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_message}],
+        ) as stream:
+            response = await stream.get_final_message()
 
     text_content = "".join(
         block.text for block in response.content if block.type == "text"
@@ -1151,8 +1403,25 @@ Propose 3-6 focused, non-overlapping amendments. Each should be specific enough
     return amendments
 
 
-async def run_round_1(case_path: Path) -> dict:
-    """Execute Round 1: parallel specialist analysis → observer."""
+async def run_round_1(
+    case_path: Path,
+    prompt_layout: str = "standard",
+    checkpoint: RunCheckpoint | None = None,
+    quorum: QuorumPolicy | None = None,
+    observer_threshold: float | None = None,
+    sessions: dict[str, SpecialistSession] | None = None,
+    call_stats: SpecialistCallStats | None = None,
+    hedger: Hedger | None = None,
+) -> dict:
+    """Execute Round 1: parallel specialist analysis → observer.
+
+    Steps already saved in `checkpoint` are restored instead of re-run. With
+    a `quorum`, the Observer runs once the quorum is in and stragglers are
+    merged as they finish; with an `observer_threshold`, only if the bias
+    pre-screen flags the round (see run_round_2). With `sessions`, each
+    specialist's conversation is recorded there for Round 2 to continue.
+    A `hedger` duplicates slow specialist and Observer calls.
+    """
     # Load inputs
     print("[STAGE] loading")
     print("\n📂 Loading case and constitution...")
@@ -1177,51 +1446,91 @@ async def run_round_1(case_path: Path) -> dict:
     # Update visualization state
     update_visualization_state("running", case_id, 1, "specialist_analysis")
 
-    # Build specialist tasks
-    client = AsyncAnthropic()
-    tasks = []
-
+    # Admits each request through the rate-limit scheduler and retries it on
+    # its own (the SDK's retries are off)
+    client = ResilientClient(ScheduledClient(AsyncAnthropic(max_retries=0)))
     attached_images = case_data.get("attached_images")
 
     print("[STAGE] round1_specialists")
     print("\n🩺 Round 1: Independent Specialist Analysis")
     print("─" * 50)
-    for spec in ROUND_1_SPECIALISTS:
-        agent_def = agent_defs[spec["agent_file"]]
-        system_prompt = build_specialist_system_prompt(
-            agent_def=agent_def,
-            display_name=spec["display_name"],
-            role_override=spec["role_override"],
-            focus=spec["focus"],
-            constitution=constitution,
-        )
-        tasks.append(
-            call_specialist(client, agent_def, spec["display_name"], system_prompt, case_json, attached_images)
-        )
+    specialist_outputs = checkpoint.get("r1_specialists") if checkpoint else None
+    stragglers = None
+    if specialist_outputs is not None:
+        print("  ↻ Restored from checkpoint")
+    else:
+        # Build specialist tasks
+        tasks = {}
+        shared_system_prompt = build_shared_specialist_system_prompt(constitution)
+        prefix_warmer = PrefixWarmer()
+        for spec in ROUND_1_SPECIALISTS:
+            agent_def = agent_defs[spec["agent_file"]]
+            agent_key = spec["display_name"].lower().replace(" ", "_")
+            if prompt_layout == "shared-prefix":
+                session = None
+                if sessions is not None:
+                    session = sessions[agent_key] = SpecialistSession(
+                        agent_key, agent_def["model"], shared_system_prompt, focus=spec["focus"]
+                    )
+                tasks[spec["display_name"]] = call_specialist_shared_prefix(
+                    client, agent_def, spec["display_name"], shared_system_prompt,
+                    case_json, attached_images,
+                    instructions=build_specialist_instructions(
+                        agent_def, spec["display_name"], spec["role_override"], spec["focus"],
+                    ),
+                    prefix_warmer=prefix_warmer,
+                    session=session,
+                    call_stats=call_stats,
+                    hedger=hedger,
+                )
+                continue
+            system_prompt = build_specialist_system_prompt(
+                agent_def=agent_def,
+                display_name=spec["display_name"],
+                role_override=spec["role_override"],
+                focus=spec["focus"],
+                constitution=constitution,
+            )
+            if sessions is not None:
+                # The shared caller records the conversation for Round 2
+                sessions[agent_key] = SpecialistSession(
+                    agent_key, agent_def["model"], system_prompt, focus=spec["focus"]
+                )
+                tasks[spec["display_name"]] = call_specialist_shared_prefix(
+                    client, agent_def, spec["display_name"], system_prompt, case_json, attached_images,
+                    session=sessions[agent_key],
+                    call_stats=call_stats,
+                    hedger=hedger,
+                )
+                continue
+            tasks[spec["display_name"]] = call_specialist(
+                client, agent_def, spec["display_name"], system_prompt, case_json, attached_images,
+                call_stats=call_stats, hedger=hedger,
+            )
 
-    # Execute all specialists in parallel
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Write results to disk
-    specialist_outputs = {}
-    for i, result in enumerate(results):
-        display_name = ROUND_1_SPECIALISTS[i]["display_name"]
-        file_key = display_name.lower().replace(" ", "_")
-        output_path = round_1_dir / f"{file_key}.json"
-
-        if isinstance(result, Exception):
-            print(f"  ❌ {display_name} failed: {result}")
-            error_output = {
-                "agent": file_key,
-                "round": 1,
-                "error": str(result),
-                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-            }
-            output_path.write_text(json.dumps(error_output, indent=2))
-            specialist_outputs[file_key] = error_output
-        else:
-            output_path.write_text(json.dumps(result, indent=2))
-            specialist_outputs[file_key] = result
+        specialist_outputs = {}
+
+        def _merge_late(display_name, result):
+            file_key = display_name.lower().replace(" ", "_")
+            specialist_outputs[file_key] = write_specialist_result(round_1_dir, 1, display_name, result, late=True)
+            print(f"  ⏰ {display_name} (Round 1) arrived late — merged into the round")
+            if checkpoint:
+                checkpoint.save("round1_specialists", r1_specialists=specialist_outputs)
+
+        # Execute all specialists in parallel, up to the quorum
+        stragglers = QuorumRound(quorum, on_late=_merge_late, label="Round 1")
+        results = await stragglers.run(tasks)
+
+        # Write results to disk
+        for display_name in tasks:
+            file_key = display_name.lower().replace(" ", "_")
+            if display_name in results:
+                specialist_outputs[file_key] = write_specialist_result(round_1_dir, 1, display_name, results[display_name])
+            else:
+                specialist_outputs[file_key] = pending_specialist_output(display_name, 1)
+
+        if checkpoint:
+            checkpoint.save("round1_specialists", r1_specialists=specialist_outputs)
 
     # Run Metacognitive Observer
     print("[STAGE] round1_observer")
@@ -1229,11 +1538,16 @@ async def run_round_1(case_path: Path) -> dict:
     print("─" * 50)
     update_visualization_state("running", case_id, 1, "observer_analysis")
 
-    observer_def = agent_defs["metacognitive_observer.md"]
-    observer_system_prompt = build_observer_system_prompt(observer_def, constitution)
-    observer_result = await call_observer(
-        client, observer_def, observer_system_prompt, specialist_outputs, case_data
-    )
+    observer_result = checkpoint.get("r1_observer") if checkpoint else None
+    if observer_result is not None:
+        print("  ↻ Restored from checkpoint")
+    else:
+        observer_result = await review_with_observer(
+            client, agent_defs, constitution, specialist_outputs, case_data,
+            observer_threshold=observer_threshold, hedger=hedger,
+        )
+        if checkpoint:
+            checkpoint.save("round1_observer", r1_observer=observer_result)
 
     # Write observer output
     observer_path = OBSERVER_DIR / "analysis_round_1.json"
@@ -1252,13 +1566,69 @@ async def run_round_1(case_path: Path) -> dict:
         "agent_defs": agent_defs,
         "case_data": case_data,
         "constitution": constitution,
+        "stragglers": stragglers,
     }
 
 
-async def run_pipeline(case_path: Path):
-    """Execute the full pipeline: Round 1 → Round 2 → Synthesis → Patient Translator → Constitution Amender."""
+async def run_pipeline(
+    case_path: Path,
+    prompt_layout: str = "standard",
+    resume_dir: Path | None = None,
+    quorum_size: int | None = None,
+    straggler_grace: float = 0.0,
+    observer_threshold: float | None = None,
+    peer_context_tokens: int | None = DEFAULT_PEER_CONTEXT_TOKENS,
+    specialist_sessions: bool = False,
+    hedge_percentile: float | None = None,
+):
+    """Execute the full pipeline: Round 1 → Round 2 → Synthesis → Patient Translator → Constitution Amender.
+
+    State is checkpointed to a shared/runs/ directory after every stage; with
+    `resume_dir`, completed stages are restored from it instead of re-run.
+
+    With `quorum_size`, each round's Observer review starts once that many
+    specialists are done (plus up to `straggler_grace` seconds for the rest).
+    Stragglers are merged before the next round and before synthesis.
+
+    With `observer_threshold`, each round is first reviewed by the local bias
+    pre-screen and the Observer is only called when its flag score reaches
+    the threshold (None = always call the Observer). Round 2 specialists
+    get a digest of Round 1 capped at `peer_context_tokens` (None = every
+    Round 1 output and the Observer report as full JSON). With
+    `specialist_sessions`, Round 2 continues each specialist's Round 1
+    conversation instead of re-sending the case in a fresh request.
+
+    With `hedge_percentile`, specialist, Observer review and synthesis calls
+    still running past that quantile of their recent latencies get a
+    duplicate request; the first valid response wins (see
+    orchestrator.hedging).
+    """
+    if resume_dir is not None:
+        checkpoint = RunCheckpoint.load(resume_dir)
+    else:
+        checkpoint = RunCheckpoint.create("legacy", case_path, {
+            "prompt_layout": prompt_layout,
+            "quorum_size": quorum_size,
+            "straggler_grace": straggler_grace,
+            "observer_threshold": observer_threshold,
+            "peer_context_tokens": peer_context_tokens,
+            "specialist_sessions": specialist_sessions,
+            "hedge_percentile": hedge_percentile,
+        })
+    quorum = QuorumPolicy(quorum_size, straggler_grace) if quorum_size else None
+    hedger = Hedger(percentile=hedge_percentile) if hedge_percentile else None
+
     # Round 1
-    r1 = await run_round_1(case_path)
+    # Specialist conversations for Round 2 to continue (not checkpointed)
+    sessions = {} if specialist_sessions else None
+    call_stats = SpecialistCallStats()
+    r1 = await run_round_1(
+        case_path, prompt_layout=prompt_layout, checkpoint=checkpoint, quorum=quorum,
+        observer_threshold=observer_threshold, sessions=sessions, call_stats=call_stats,
+        hedger=hedger,
+    )
+    if r1["stragglers"]:
+        await r1["stragglers"].drain()
 
     # Round 2
     r2 = await run_round_2(
@@ -1268,35 +1638,53 @@ async def run_pipeline(case_path: Path):
         constitution=r1["constitution"],
         r1_specialists=r1["specialists"],
         r1_observer=r1["observer"],
+        prompt_layout=prompt_layout,
+        checkpoint=checkpoint,
+        quorum=quorum,
+        observer_threshold=observer_threshold,
+        peer_context_tokens=peer_context_tokens,
+        sessions=sessions,
+        call_stats=call_stats,
+        hedger=hedger,
     )
+    if r2["stragglers"]:
+        await r2["stragglers"].drain()
 
     # Synthesis
-    diagnosis = await run_synthesis(
-        client=r1["client"],
-        case_data=r1["case_data"],
-        r1_specialists=r1["specialists"],
-        r2_specialists=r2["specialists"],
-        r1_observer=r1["observer"],
-        r2_observer=r2["observer"],
-    )
+    diagnosis = checkpoint.get("diagnosis")
+    if diagnosis is None:
+        diagnosis = await run_synthesis(
+            client=r1["client"],
+            case_data=r1["case_data"],
+            r1_specialists=r1["specialists"],
+            r2_specialists=r2["specialists"],
+            r1_observer=r1["observer"],
+            r2_observer=r2["observer"],
+            hedger=hedger,
+        )
+        checkpoint.save("synthesis", diagnosis=diagnosis)
 
     # Patient Translator
-    await run_patient_translator(
-        client=r1["client"],
-        case_data=r1["case_data"],
-        diagnosis=diagnosis,
-    )
+    if not checkpoint.get("translation_done"):
+        await run_patient_translator(
+            client=r1["client"],
+            case_data=r1["case_data"],
+            diagnosis=diagnosis,
+        )
+        checkpoint.save("translator", translation_done=True)
 
     # Constitution Amender
-    await run_constitution_amender(
-        client=r1["client"],
-        agent_defs=r1["agent_defs"],
-        case_data=r1["case_data"],
-        constitution=r1["constitution"],
-        r1_observer=r1["observer"],
-        r2_observer=r2["observer"],
-        diagnosis=diagnosis,
-    )
+    if not checkpoint.get("amendments_done"):
+        await run_constitution_amender(
+            client=r1["client"],
+            agent_defs=r1["agent_defs"],
+            case_data=r1["case_data"],
+            constitution=r1["constitution"],
+            r1_observer=r1["observer"],
+            r2_observer=r2["observer"],
+            diagnosis=diagnosis,
+        )
+        checkpoint.save("amender", amendments_done=True)
 
     print("[STAGE] complete")
     print("\n" + "=" * 70)
@@ -1306,6 +1694,14 @@ async def run_pipeline(case_path: Path):
     print(f"  Patient explanation:  shared/output/patient_explanation.md")
     print(f"  Amendments log:       shared/constitution/amendments_log.json")
     print(f"  Updated constitution: shared/constitution/constitution.md")
+    reference_line = reference_check(diagnosis, reference_diagnosis(case_path, r1["case_data"]))
+    if reference_line:
+        print(f"  {reference_line}")
+    print(f"  {r1['client'].summary()}")
+    print(f"  {r1['client'].scheduler.summary()}")
+    print(f"  {call_stats.summary()}")
+    if hedger is not None:
+        print(f"  {hedger.summary()}")
     print("=" * 70)
 
 
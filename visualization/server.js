@@ -135,6 +135,15 @@ function handleDynamicStage(stageEvent) {
   });
 }
 
+function handleObserverEvent(observerEvent) {
+  const { event, text, tool } = observerEvent;
+  if (event === 'text' && text) {
+    broadcastSSE({ type: 'reasoning', agent: 'observer_stream', agentName: 'Observer', icon: 'eye', round: 0, text });
+  } else if (event === 'tool_use_start' && tool) {
+    broadcastSSE({ type: 'reasoning', agent: 'observer_stream', agentName: 'Observer', icon: 'eye', round: 0, text: `Calling ${tool.replace(/_/g, ' ')}...` });
+  }
+}
+
 // ── SSE helpers ────────────────────────────────────────────────────────────────
 
 function broadcastSSE(event) {
@@ -540,6 +549,16 @@ app.post('/api/run-diagnosis', (req, res) => {
         }
       }
 
+      // ── Agentic mode: live events from the streamed Observer turn ────
+      const observerMatch = line.match(/\[OBSERVER\]\s*(\{.+\})/);
+      if (observerMatch && pipelineMode === 'agentic') {
+        const observerEvent = parseStructuredStage(observerMatch[1]);
+        if (observerEvent) {
+          handleObserverEvent(observerEvent);
+          continue;
+        }
+      }
+
       // ── Legacy mode: detect individual specialist completions ────────
       if (pipelineMode === 'legacy') {
         if (line.includes('✅') && line.includes('Neurologist') && !line.includes('Round 2')) {